@@ -0,0 +1,50 @@
+"""Measure the cost of `import bls_sdk` in a fresh interpreter.
+
+Usage:
+	python benchmarks/bench_import.py [--repeat N]
+
+Reports the best wall time of `import bls_sdk` and of importing
+`PublicDataClient`, each minus a bare interpreter start, and lists which heavy
+dependencies ended up in sys.modules.
+"""
+import argparse
+import subprocess
+import sys
+import time
+
+_HEAVY = ("selenium", "bs4", "tqdm", "pandas", "numpy", "lxml", "dotenv", "requests")
+
+_CASES = {
+	"import bls_sdk": "import bls_sdk",
+	"from bls_sdk import PublicDataClient": "from bls_sdk import PublicDataClient",
+}
+
+
+def _best_time(code: str, repeat: int) -> float:
+	best = float("inf")
+	for _ in range(repeat):
+		t0 = time.perf_counter()
+		subprocess.run([sys.executable, "-c", code], check=True)
+		best = min(best, time.perf_counter() - t0)
+	return best
+
+
+def _loaded(code: str) -> list:
+	probe = f"{code}\nimport sys\nprint(' '.join(m for m in {_HEAVY!r} if m in sys.modules))"
+	out = subprocess.run([sys.executable, "-c", probe], check=True, capture_output=True, text=True)
+	return out.stdout.split()
+
+
+def main() -> None:
+	ap = argparse.ArgumentParser(description=__doc__)
+	ap.add_argument("--repeat", type=int, default=10)
+	args = ap.parse_args()
+	baseline = _best_time("pass", args.repeat)
+	print(f"{'python (baseline)':40s} {baseline * 1000:7.1f} ms")
+	for label, code in _CASES.items():
+		t = _best_time(code, args.repeat)
+		print(f"{label:40s} {t * 1000:7.1f} ms  (+{max(0.0, t - baseline) * 1000:.1f} ms)  loaded: {', '.join(_loaded(code)) or '-'}")
+
+
+if __name__ == "__main__":
+	main()
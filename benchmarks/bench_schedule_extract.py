@@ -0,0 +1,59 @@
+"""Compare schedule-table extraction backends on a saved page.
+
+Usage:
+	python benchmarks/bench_schedule_extract.py [path/to/saved_page.html] [--repeat N]
+
+Without a path, a synthetic year page (~1,000 rows plus page chrome) is used.
+Pages saved by `ScheduleScraper(cache_dir=...)` work as input.
+"""
+import argparse
+import time
+from pathlib import Path
+
+from bls_sdk.release_schedule import _extract_rows_from_html
+
+
+def _synthetic_page(n_rows: int = 1000) -> str:
+	nav = "".join(f"<li><a href='/x{i}.htm'>Link {i}</a></li>" for i in range(2000))
+	body = "".join(
+		f"<tr><td>Friday, January {1 + i % 28:02d}, 2024</td><td>08:30 AM</td>"
+		f"<td><a href='/r{i}.htm'>Consumer Price Index</a> for December 2023 (P)</td></tr>"
+		for i in range(n_rows)
+	)
+	return (
+		f"<html><head><title>Schedule</title></head><body><ul>{nav}</ul>"
+		f"<table><tr><th>Date</th><th>Time</th><th>Release</th></tr>{body}</table>"
+		f"<div>{'footer ' * 5000}</div></body></html>"
+	)
+
+
+def _time(backend: str, html: str, repeat: int) -> float:
+	best = float("inf")
+	for _ in range(repeat):
+		t0 = time.perf_counter()
+		_extract_rows_from_html(html, backend=backend)
+		best = min(best, time.perf_counter() - t0)
+	return best
+
+
+def main() -> None:
+	ap = argparse.ArgumentParser(description=__doc__)
+	ap.add_argument("page", nargs="?")
+	ap.add_argument("--repeat", type=int, default=5)
+	args = ap.parse_args()
+	html = Path(args.page).read_text(encoding="utf-8") if args.page else _synthetic_page()
+
+	rows_bs4 = _extract_rows_from_html(html, backend="bs4")
+	rows_lxml = _extract_rows_from_html(html, backend="lxml")
+	assert rows_bs4 == rows_lxml, "backends disagree"
+
+	t_bs4 = _time("bs4", html, args.repeat)
+	t_lxml = _time("lxml", html, args.repeat)
+	print(f"rows: {len(rows_bs4)}  page: {len(html) / 1024:.0f} KiB")
+	print(f"bs4 (html.parser): {t_bs4 * 1000:8.1f} ms")
+	print(f"lxml:              {t_lxml * 1000:8.1f} ms")
+	print(f"speedup:           {t_bs4 / t_lxml:8.1f}x")
+
+
+if __name__ == "__main__":
+	main()
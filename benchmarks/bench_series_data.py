@@ -0,0 +1,68 @@
+"""Compare memory and iteration time of API dicts vs compact `Series`.
+
+Usage:
+	python benchmarks/bench_series_data.py [--series N] [--years N]
+
+Builds a synthetic monthly pull shaped like `get_many_series` output and
+reports the memory each form allocates (tracemalloc) and a full value scan for both forms.
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+
+from bls_sdk.series_data import compact_series
+
+
+def _synthetic(n_series: int, n_years: int):
+	out = []
+	for s in range(n_series):
+		data = []
+		for y in range(2024, 2024 - n_years, -1):
+			for m in range(12, 0, -1):
+				data.append({"year": str(y), "period": f"M{m:02d}", "periodName": f"Month {m}", "value": f"{100 + s + m / 10:.3f}", "footnotes": [{}]})
+		out.append({"seriesID": f"CUUR{s:07d}", "data": data})
+	return out
+
+
+def _measure(build):
+	gc.collect()
+	tracemalloc.start()
+	obj = build()
+	current, _ = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+	return obj, current
+
+
+def main() -> None:
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+	parser.add_argument("--series", type=int, default=1000)
+	parser.add_argument("--years", type=int, default=20)
+	args = parser.parse_args()
+
+	raw, raw_bytes = _measure(lambda: _synthetic(args.series, args.years))
+	compact, compact_bytes = _measure(lambda: compact_series(raw))
+	n_obs = sum(len(s["data"]) for s in raw)
+	print(f"{args.series} series, {n_obs:,} observations")
+	print(f"dicts:   {raw_bytes / 1e6:8.1f} MB")
+	print(f"compact: {compact_bytes / 1e6:8.1f} MB  ({raw_bytes / compact_bytes:.1f}x smaller)")
+
+	t0 = time.perf_counter()
+	total = sum(float(d["value"]) for s in raw for d in s["data"])
+	t1 = time.perf_counter()
+	total_c = sum(obs.value for s in compact for obs in s)
+	t2 = time.perf_counter()
+	total_r = sum(row[3] for s in compact for row in s.rows())
+	t3 = time.perf_counter()
+	total_v = sum(sum(s.values) for s in compact)
+	t4 = time.perf_counter()
+	for t in (total_c, total_r, total_v):
+		assert abs(total - t) < 1e-6 * abs(total)
+	print(f"scan dicts:          {t1 - t0:.3f}s")
+	print(f"scan Observations:   {t2 - t1:.3f}s")
+	print(f"scan rows() tuples:  {t3 - t2:.3f}s")
+	print(f"scan values arrays:  {t4 - t3:.3f}s")
+
+
+if __name__ == "__main__":
+	main()
@@ -1,13 +1,62 @@
-from .public_data import PublicDataClient
-from .release_schedule import scrape_archived_schedule
-from .manual_parser import parse_manual_schedule_txt, parse_manual_batch
+from importlib import import_module
+from typing import Any
+
+# Public names resolve to their submodule on first access, so `import bls_sdk`
+# doesn't pull in Selenium, BeautifulSoup, tqdm, pandas or even requests.
+_LAZY_ATTRS = {
+	"PublicDataClient": ".public_data",
+	"scrape_archived_schedule": ".release_schedule",
+	"ScheduleScraper": ".release_schedule",
+	"reparse_cached_schedule": ".release_schedule",
+	"SchedulePageCache": ".schedule_cache",
+	"parse_manual_schedule_txt": ".manual_parser",
+	"parse_manual_batch": ".manual_parser",
+	"ReleaseCalendar": ".release_calendar",
+	"ReleaseWatcher": ".release_watcher",
+	"ReleaseEvent": ".release_watcher",
+	"Series": ".series_data",
+	"Observation": ".series_data",
+	"compact_series": ".series_data",
+	"VintageStore": ".vintages",
+}
 
 __all__ = [
 	"__version__",
 	"PublicDataClient",
 	"scrape_archived_schedule",
+	"ScheduleScraper",
+	"reparse_cached_schedule",
+	"SchedulePageCache",
 	"parse_manual_schedule_txt",
 	"parse_manual_batch",
+	"ReleaseCalendar",
+	"ReleaseWatcher",
+	"ReleaseEvent",
+	"Series",
+	"Observation",
+	"compact_series",
+	"VintageStore",
 ]
 
 __version__ = "0.1.1"
+
+
+def __getattr__(name: str) -> Any:
+	module_name = _LAZY_ATTRS.get(name)
+	if module_name is None:
+		# Submodules (`bls_sdk.config`, `bls_sdk.release_schedule`, ...) load on access too
+		if name.startswith("_"):
+			raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+		try:
+			return import_module(f".{name}", __name__)
+		except ModuleNotFoundError as e:
+			if e.name != f"{__name__}.{name}":
+				raise
+			raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+	value = getattr(import_module(module_name, __name__), name)
+	globals()[name] = value
+	return value
+
+
+def __dir__():
+	return sorted(set(globals()) | set(__all__))
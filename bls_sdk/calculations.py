@@ -0,0 +1,191 @@
+"""Local replacements for the API's `calculations` and `annualaverage` options.
+
+Fetch lean raw data once (calculations=False, annualaverage=False) and derive
+net/percent changes and annual averages here, vectorized across all series.
+
+Semantics follow the Public Data API:
+- changes are over 1, 3, 6 and 12 months, keyed by the horizon as a string
+  ("1", "3", ...), and only present when the earlier observation exists;
+- net changes are rounded to the series' value precision, percent changes to
+  one decimal;
+- annual averages are period "M13" / periodName "Annual", the mean of M01-M12,
+  produced only for years with all twelve months.
+Quarterly (Qnn), semiannual (Snn) and annual (A01) periods are placed on the
+same month axis, so a quarterly series gets 3, 6 and 12 month changes.
+"""
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+DEFAULT_HORIZONS = (1, 3, 6, 12)
+
+# Months covered by one period of each frequency code (M01, Q01, S01, A01)
+MONTHS_PER_STEP = {"M": 1, "Q": 3, "S": 6, "A": 12}
+
+
+def _decimals(raw: List[str]) -> List[int]:
+	# Digits after the decimal point, i.e. the precision BLS published the value with
+	return [len(v) - v.index(".") - 1 if "." in v else 0 for v in raw]
+
+
+def _period_month(period: Any) -> float:
+	"""Month (1-12) a period code ends in, e.g. 'Q02' -> 6; NaN for annual averages such as M13."""
+	kind = str(period)[:1]
+	per_step = MONTHS_PER_STEP.get(kind)
+	try:
+		step = int(str(period)[1:])
+	except ValueError:
+		return np.nan
+	# M13, Q05, S03 are annual averages, not points on the month axis
+	if per_step is None or not 1 <= step <= 12 // per_step:
+		return np.nan
+	return float(step * per_step)
+
+
+def observations_frame(series_list: Iterable[Dict[str, Any]]) -> pd.DataFrame:
+	"""Flatten API series into a long frame, one row per observation.
+
+	Columns: series_id, year, period, period_name, value (float, NaN when not
+	numeric), decimals, month (months since year 0 on a common axis; NaN for
+	annual-average periods such as M13).
+	"""
+	sids: List[str] = []
+	years: List[str] = []
+	periods: List[str] = []
+	names: List[Optional[str]] = []
+	raw: List[str] = []
+	for s in series_list:
+		sid = s.get("seriesID") or s.get("series_id")
+		for d in s.get("data") or []:
+			sids.append(sid)
+			years.append(d.get("year"))
+			periods.append(d.get("period"))
+			names.append(d.get("periodName"))
+			raw.append(str(d.get("value", "")).strip())
+	df = pd.DataFrame({
+		"series_id": sids,
+		"year": pd.to_numeric(pd.Series(years, dtype=object), errors="coerce").astype("Int64"),
+		"period": pd.Series(periods, dtype=object),
+		"period_name": pd.Series(names, dtype=object),
+	})
+	df["value"] = pd.to_numeric(pd.Series(raw, dtype=object), errors="coerce")
+	df["decimals"] = np.array(_decimals(raw), dtype="int64")
+	# Only a few dozen distinct period codes: resolve each once, then take by code
+	codes, uniques = pd.factorize(df["period"])
+	offset = np.array([_period_month(p) for p in uniques] + [np.nan], dtype="float64")[codes]
+	df["month"] = df["year"].astype("float64").to_numpy() * 12 + offset
+	return df
+
+
+def compute_changes(frame: pd.DataFrame, horizons: Sequence[int] = DEFAULT_HORIZONS) -> pd.DataFrame:
+	"""Add net_change_<h> and pct_change_<h> columns for each horizon (in months)."""
+	out = frame.copy()
+	on_axis = out["month"].notna()
+	keyed = out.loc[on_axis].set_index(["series_id", "month"])["value"]
+	keyed = keyed[~keyed.index.duplicated(keep="first")]
+	for h in horizons:
+		lag_index = pd.MultiIndex.from_arrays([out["series_id"], out["month"] - h])
+		prev = keyed.reindex(lag_index).to_numpy()
+		prev = np.where(on_axis.to_numpy(), prev, np.nan)
+		cur = out["value"].to_numpy()
+		out[f"net_change_{h}"] = cur - prev
+		with np.errstate(divide="ignore", invalid="ignore"):
+			pct = (cur - prev) / prev * 100.0
+		out[f"pct_change_{h}"] = np.where(prev == 0, np.nan, pct)
+	return out
+
+
+def compute_annual_averages(frame: pd.DataFrame) -> pd.DataFrame:
+	"""Annual averages (period M13) of monthly series for years with all 12 months."""
+	monthly = frame[frame["period"].str.match(r"^M(0[1-9]|1[0-2])$") & frame["value"].notna()]
+	grouped = monthly.groupby(["series_id", "year"], sort=False)
+	agg = grouped.agg(value=("value", "mean"), count=("value", "size"), decimals=("decimals", "max")).reset_index()
+	agg = agg[agg["count"] == 12].drop(columns="count")
+	agg["value"] = [round(v, int(d)) for v, d in zip(agg["value"], agg["decimals"])]
+	agg["period"] = "M13"
+	agg["period_name"] = "Annual"
+	agg["month"] = np.nan
+	return agg[["series_id", "year", "period", "period_name", "value", "decimals", "month"]]
+
+
+def _fmt(value: float, decimals: int) -> str:
+	return f"{value:.{decimals}f}"
+
+
+def apply_calculations(
+		series_list: Iterable[Dict[str, Any]],
+		calculations: bool = True,
+		annualaverage: bool = False,
+		horizons: Sequence[int] = DEFAULT_HORIZONS,
+) -> List[Dict[str, Any]]:
+	"""Return copies of API series as if fetched with calculations/annualaverage=True.
+
+	Each observation gains a "calculations" dict with "net_changes" and
+	"pct_changes"; with annualaverage, M13 rows are inserted ahead of each
+	complete year's months (the API's newest-first order).
+	"""
+	series_list = list(series_list)
+	frame = observations_frame(series_list)
+	if calculations:
+		frame = compute_changes(frame, horizons)
+	calc_dicts: List[Optional[Dict[str, Dict[str, str]]]] = [None] * len(frame)
+	if calculations:
+		dec_arr = frame["decimals"].to_numpy()
+		scale = 10.0 ** dec_arr
+		dec = dec_arr.tolist()
+		on_axis = frame["month"].notna().tolist()
+		cols = []
+		for h in horizons:
+			# Round vectorized (adding 0.0 turns -0.0 into 0.0); only formatting is per value
+			net_r = np.rint(frame[f"net_change_{h}"].to_numpy() * scale) / scale + 0.0
+			pct_r = np.rint(frame[f"pct_change_{h}"].to_numpy() * 10.0) / 10.0 + 0.0
+			cols.append((str(h), net_r.tolist(), pct_r.tolist()))
+		for i in range(len(frame)):
+			if not on_axis[i]:
+				continue
+			net: Dict[str, str] = {}
+			pct: Dict[str, str] = {}
+			for key, n_list, p_list in cols:
+				n = n_list[i]
+				if n == n:
+					net[key] = f"{n:.{dec[i]}f}"
+				p = p_list[i]
+				if p == p:
+					pct[key] = f"{p:.1f}"
+			calc_dicts[i] = {"net_changes": net, "pct_changes": pct}
+
+	averages: Dict[Any, Dict[str, Any]] = {}
+	if annualaverage:
+		for row in compute_annual_averages(frame).itertuples(index=False):
+			averages[(row.series_id, int(row.year))] = {
+				"year": str(int(row.year)),
+				"period": "M13",
+				"periodName": "Annual",
+				"value": _fmt(row.value, int(row.decimals)),
+				"footnotes": [{}],
+			}
+
+	out: List[Dict[str, Any]] = []
+	i = 0
+	for s in series_list:
+		sid = s.get("seriesID") or s.get("series_id")
+		raw_data = s.get("data") or []
+		# Years that already carry an API-provided annual average are left alone
+		emitted = {str(d.get("year")) for d in raw_data if d.get("period") == "M13"}
+		data: List[Dict[str, Any]] = []
+		for d in raw_data:
+			y = str(d.get("year"))
+			if y not in emitted and y.isdigit() and (sid, int(y)) in averages:
+				data.append(dict(averages[(sid, int(y))]))
+				emitted.add(y)
+			obs = dict(d)
+			if calc_dicts[i] is not None:
+				obs["calculations"] = calc_dicts[i]
+			data.append(obs)
+			i += 1
+		new_series = dict(s)
+		new_series["data"] = data
+		out.append(new_series)
+	return out
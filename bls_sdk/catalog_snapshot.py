@@ -0,0 +1,183 @@
+"""Compile survey catalogs into memory-mapped, read-only columnar snapshots.
+
+`fetch_series_for_survey` returns a list of dicts per call, so every worker
+process holds its own copy. A snapshot is written once and opened by each
+worker with mmap: the OS page cache shares the pages between processes and
+opening it only reads a small header.
+
+	compile_catalog("cu", "data/catalog/cu")          # once
+	snap = CatalogSnapshot("data/catalog/cu")          # in each worker
+	snap.get("CUUR0000SA0")["series_title"]
+
+Layout of the snapshot directory:
+- meta.json: survey, row count, column names
+- series_id.npy: fixed-width ASCII IDs, sorted (lookups are a binary search)
+- <column>.offsets.npy + <column>.bin: int64 offsets into a UTF-8 blob, per column
+
+A snapshot is never rewritten in place: a new one is built next to it and
+swapped in with a rename, so workers that still have the old one mapped keep
+reading the old files.
+"""
+import json
+import mmap
+import os
+import shutil
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+
+from .series_catalog import fetch_series_for_survey
+
+
+_FORMAT_VERSION = 1
+
+
+def write_catalog_snapshot(rows: Iterable[Mapping[str, Any]], path: Union[str, Path], survey: Optional[str] = None) -> Path:
+	"""Write catalog rows (e.g. from `fetch_series_for_survey`) as a snapshot directory, replacing any existing one."""
+	target = Path(path)
+	if target.is_dir() and any(target.iterdir()) and not (target / "meta.json").exists():
+		raise ValueError(f"{target} exists and is not a catalog snapshot")
+	target.parent.mkdir(parents=True, exist_ok=True)
+	tag = uuid.uuid4().hex
+	root = target.parent / f".{target.name}.tmp-{tag}"
+	root.mkdir()
+	try:
+		_write_files(rows, root, survey)
+		if target.exists():
+			# Directories can't be renamed over a non-empty one; move the old one aside first
+			old = target.parent / f".{target.name}.old-{tag}"
+			os.replace(target, old)
+			os.replace(root, target)
+			shutil.rmtree(old, ignore_errors=True)
+		else:
+			os.replace(root, target)
+	except BaseException:
+		shutil.rmtree(root, ignore_errors=True)
+		raise
+	return target
+
+
+def _write_files(rows: Iterable[Mapping[str, Any]], root: Path, survey: Optional[str]) -> None:
+	# Sorted by series_id, first row wins on duplicates
+	by_id: Dict[str, Mapping[str, Any]] = {}
+	for r in rows:
+		sid = str(r.get("series_id") or "").strip().upper()
+		if sid and sid not in by_id:
+			by_id[sid] = r
+	ids = sorted(by_id)
+	columns: List[str] = []
+	for r in by_id.values():
+		for c in r:
+			if c != "series_id" and c not in columns:
+				columns.append(c)
+
+	width = max((len(s) for s in ids), default=1)
+	np.save(root / "series_id.npy", np.array([s.encode("ascii") for s in ids], dtype=f"S{width}"))
+	for c in columns:
+		encoded = [str(by_id[s].get(c) or "").encode("utf-8") for s in ids]
+		offsets = np.zeros(len(ids) + 1, dtype="int64")
+		np.cumsum([len(b) for b in encoded], out=offsets[1:])
+		np.save(root / f"{c}.offsets.npy", offsets)
+		(root / f"{c}.bin").write_bytes(b"".join(encoded))
+	meta = {"version": _FORMAT_VERSION, "survey": survey, "rows": len(ids), "columns": columns}
+	(root / "meta.json").write_text(json.dumps(meta, indent=2), encoding="utf-8")
+
+
+def compile_catalog(survey: str, path: Union[str, Path], rate_limit_per_second: float = 2.0) -> Path:
+	"""Download '<survey>.series' and write it as a snapshot."""
+	rows = fetch_series_for_survey(survey, rate_limit_per_second=rate_limit_per_second)
+	return write_catalog_snapshot(rows, path, survey=survey.strip("/ ").lower())
+
+
+def _map_file(path: Path) -> Union[mmap.mmap, bytes]:
+	with open(path, "rb") as f:
+		if path.stat().st_size == 0:
+			# mmap can't map an empty file
+			return b""
+		return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class CatalogSnapshot:
+	"""Read-only view of a snapshot; nothing is decoded until a row or column is asked for."""
+
+	def __init__(self, path: Union[str, Path]):
+		self.path = Path(path)
+		meta = json.loads((self.path / "meta.json").read_text(encoding="utf-8"))
+		if meta.get("version") != _FORMAT_VERSION:
+			raise ValueError(f"Unsupported catalog snapshot version: {meta.get('version')!r}")
+		self.survey: Optional[str] = meta.get("survey")
+		self.columns: List[str] = list(meta["columns"])
+		self.series_ids: np.ndarray = np.load(self.path / "series_id.npy", mmap_mode="r")
+		self._offsets = {c: np.load(self.path / f"{c}.offsets.npy", mmap_mode="r") for c in self.columns}
+		self._blobs = {c: _map_file(self.path / f"{c}.bin") for c in self.columns}
+
+	def close(self) -> None:
+		for blob in self._blobs.values():
+			if isinstance(blob, mmap.mmap):
+				blob.close()
+		self._blobs = {}
+
+	def __enter__(self) -> "CatalogSnapshot":
+		return self
+
+	def __exit__(self, *exc: Any) -> None:
+		self.close()
+
+	def __len__(self) -> int:
+		return len(self.series_ids)
+
+	def __contains__(self, series_id: object) -> bool:
+		return isinstance(series_id, str) and self.index_of(series_id) >= 0
+
+	def __iter__(self) -> Iterator[str]:
+		return (s.decode("ascii") for s in self.series_ids)
+
+	def index_of(self, series_id: str) -> int:
+		"""Row number of `series_id`, or -1."""
+		key = series_id.strip().upper().encode("ascii", errors="replace")
+		if len(key) > self.series_ids.dtype.itemsize:
+			return -1
+		i = int(np.searchsorted(self.series_ids, key))
+		return i if i < len(self.series_ids) and self.series_ids[i] == key else -1
+
+	def find(self, series_ids: Sequence[str]) -> np.ndarray:
+		"""Row numbers for many IDs at once (-1 where missing)."""
+		raw = [s.strip().upper().encode("ascii", errors="replace") for s in series_ids]
+		# Longer keys would be truncated to the stored width and could false-match
+		fits = np.array([len(k) <= self.series_ids.dtype.itemsize for k in raw], dtype=bool)
+		keys = np.array(raw, dtype=self.series_ids.dtype)
+		idx = np.searchsorted(self.series_ids, keys)
+		found = fits & (idx < len(self.series_ids))
+		found[found] = self.series_ids[idx[found]] == keys[found]
+		return np.where(found, idx, -1)
+
+	def value(self, row: int, column: str) -> str:
+		offsets = self._offsets[column]
+		return self._blobs[column][offsets[row]:offsets[row + 1]].decode("utf-8")
+
+	def row(self, row: int) -> Dict[str, str]:
+		out = {"series_id": self.series_ids[row].decode("ascii")}
+		for c in self.columns:
+			out[c] = self.value(row, c)
+		return out
+
+	def get(self, series_id: str, default: Optional[Dict[str, str]] = None) -> Optional[Dict[str, str]]:
+		"""Catalog row for `series_id` in the same shape as `fetch_series_for_survey` rows."""
+		i = self.index_of(series_id)
+		return self.row(i) if i >= 0 else default
+
+	def __getitem__(self, series_id: str) -> Dict[str, str]:
+		row = self.get(series_id)
+		if row is None:
+			raise KeyError(series_id)
+		return row
+
+	def column(self, column: str, rows: Optional[Sequence[int]] = None) -> List[str]:
+		"""Decode one column for all rows (or the given row numbers)."""
+		if column == "series_id":
+			ids = self.series_ids if rows is None else self.series_ids[np.asarray(rows)]
+			return [s.decode("ascii") for s in ids]
+		which = range(len(self)) if rows is None else rows
+		return [self.value(i, column) for i in which]
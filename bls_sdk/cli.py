@@ -0,0 +1,406 @@
+"""`bls-sdk` command line: bulk series pulls, catalog refreshes and schedule rebuilds.
+
+	bls-sdk sync --series-file ids.txt --start-year 2005 --end-year 2024 -o data/ts --format parquet --workers 4
+	bls-sdk catalog cu ce sm -o data/catalog --format snapshot
+	bls-sdk schedule --years 2008-2024 -o data/schedule.csv --cache-dir data/schedule_pages
+
+Progress goes to stderr (tqdm) and each command ends with a throughput and
+quota summary there; stdout is left alone for scripts.
+"""
+import argparse
+import csv
+import hashlib
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Public Data API v2 limits
+_MAX_SERIES_PER_QUERY = 50
+_DAILY_QUERIES_REGISTERED = 500
+_DAILY_QUERIES_UNREGISTERED = 25
+_MAX_YEARS_REGISTERED = 20
+_MAX_YEARS_UNREGISTERED = 10
+
+
+def _log(message: str) -> None:
+	print(message, file=sys.stderr)
+
+
+def _progress(total: int, desc: str, unit: str, enabled: bool):
+	from tqdm.auto import tqdm
+
+	return tqdm(total=total, desc=desc, unit=unit, disable=not enabled, file=sys.stderr)
+
+
+def _parse_years(spec: str) -> List[int]:
+	"""'2008-2012,2015' -> [2008, 2009, 2010, 2011, 2012, 2015]"""
+	years: List[int] = []
+	for part in spec.split(","):
+		part = part.strip()
+		if not part:
+			continue
+		if "-" in part:
+			lo, hi = (int(p) for p in part.split("-", 1))
+			years.extend(range(lo, hi + 1))
+		else:
+			years.append(int(part))
+	return sorted(set(years))
+
+
+def _read_series_ids(paths: Sequence[str], inline: Sequence[str]) -> List[str]:
+	"""IDs from files (one per line or comma/whitespace separated; '#' comments; '-' is stdin) plus inline IDs."""
+	ids: List[str] = list(inline)
+	for path in paths:
+		text = sys.stdin.read() if path == "-" else Path(path).read_text(encoding="utf-8")
+		for line in text.splitlines():
+			line = line.split("#", 1)[0]
+			ids.extend(tok for tok in line.replace(",", " ").split() if tok)
+	return list(dict.fromkeys(s.strip().upper() for s in ids))
+
+
+def _year_windows(start: int, end: int, span: int) -> List[Tuple[int, int]]:
+	return [(y, min(y + span - 1, end)) for y in range(start, end + 1, span)]
+
+
+def _observation_rows(series_list: Iterable[Dict[str, Any]]) -> Iterable[Dict[str, Any]]:
+	# Same columns as the Parquet timeseries layout in `storage`
+	from .series_data import footnote_text
+
+	for s in series_list:
+		sid = s.get("seriesID")
+		for d in s.get("data") or []:
+			yield {
+				"series_id": sid,
+				"survey": (sid or "")[:2].upper(),
+				"year": d.get("year"),
+				"period": d.get("period"),
+				"period_name": d.get("periodName"),
+				"value": d.get("value"),
+				"footnotes": footnote_text(d.get("footnotes")),
+				"latest": str(d.get("latest", "")).lower() == "true",
+			}
+
+
+def _merge_windows(series_list: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+	"""Join the per-year-window pieces of each series back into one newest-first series."""
+	merged: Dict[str, Dict[str, Any]] = {}
+	for s in series_list:
+		sid = s.get("seriesID")
+		target = merged.setdefault(sid, {**s, "data": []})
+		target["data"].extend(s.get("data") or [])
+	for s in merged.values():
+		s["data"].sort(key=lambda d: (str(d.get("year")), str(d.get("period"))), reverse=True)
+	return list(merged.values())
+
+
+class _ResponseCache:
+	"""On-disk cache of query results, keyed on the request body, so re-runs skip finished chunks."""
+
+	def __init__(self, directory: str, ttl_hours: float):
+		self.directory = Path(directory)
+		self.directory.mkdir(parents=True, exist_ok=True)
+		self.ttl_seconds = ttl_hours * 3600
+
+	def _path(self, body: Dict[str, Any]) -> Path:
+		key = hashlib.sha1(json.dumps(body, sort_keys=True).encode("utf-8")).hexdigest()
+		return self.directory / f"{key}.json"
+
+	def get(self, body: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+		path = self._path(body)
+		if not path.exists() or time.time() - path.stat().st_mtime > self.ttl_seconds:
+			return None
+		return json.loads(path.read_text(encoding="utf-8"))
+
+	def put(self, body: Dict[str, Any], series_list: List[Dict[str, Any]]) -> None:
+		path = self._path(body)
+		tmp = path.with_suffix(".tmp")
+		tmp.write_text(json.dumps(series_list), encoding="utf-8")
+		tmp.replace(path)
+
+
+def _write_series(series_list: List[Dict[str, Any]], output: str, fmt: str) -> int:
+	"""Write pulled series; returns the number of observation rows written."""
+	if fmt == "parquet":
+		from .storage import write_timeseries
+		return write_timeseries(series_list, output)
+	out = Path(output)
+	out.parent.mkdir(parents=True, exist_ok=True)
+	if fmt == "jsonl":
+		with out.open("w", encoding="utf-8") as f:
+			for s in series_list:
+				f.write(json.dumps(s) + "\n")
+		return sum(len(s.get("data") or []) for s in series_list)
+	from .storage import TIMESERIES_COLUMNS
+
+	rows = 0
+	with out.open("w", encoding="utf-8", newline="") as f:
+		writer = csv.DictWriter(f, fieldnames=TIMESERIES_COLUMNS)
+		writer.writeheader()
+		for row in _observation_rows(series_list):
+			writer.writerow(row)
+			rows += 1
+	return rows
+
+
+def _write_records(records: List[Dict[str, Any]], output: Path, fmt: str) -> None:
+	output.parent.mkdir(parents=True, exist_ok=True)
+	if fmt == "jsonl":
+		with output.open("w", encoding="utf-8") as f:
+			for r in records:
+				f.write(json.dumps(r) + "\n")
+	elif fmt == "parquet":
+		import pandas as pd  # type: ignore
+		pd.DataFrame.from_records(records).to_parquet(output, index=False)
+	else:
+		import pandas as pd  # type: ignore
+		pd.DataFrame.from_records(records).to_csv(output, index=False)
+
+
+def _summary(label: str, elapsed: float, **counts: Any) -> str:
+	parts = [f"{k.replace('_', ' ')}={v}" for k, v in counts.items()]
+	return f"{label}: " + ", ".join(parts) + f" in {elapsed:.1f}s"
+
+
+def cmd_sync(args: argparse.Namespace) -> int:
+	from . import config
+	from .http_client import HttpClient
+	from .public_data import PublicDataClient
+	from .rate_limiter import RateLimiter
+
+	ids = _read_series_ids(args.series_file, args.series)
+	if not ids:
+		_log("sync: no series IDs given (use --series-file or --series)")
+		return 2
+	if args.validate:
+		import requests
+
+		from .series_ids import SeriesIdResolver, validate_series_ids
+
+		resolvers = {}
+		unavailable: Dict[str, str] = {}
+		for prefix in sorted({s[:2] for s in ids}):
+			try:
+				resolvers[prefix] = SeriesIdResolver.load(prefix.lower(), rate_limit_per_second=args.rate_limit)
+			except requests.RequestException as e:
+				# Unknown or mistyped prefix (404) or a network error: those IDs can't be checked
+				unavailable[prefix] = f"can't verify: catalog for survey {prefix!r} unavailable ({e})"
+		invalid = validate_series_ids([s for s in ids if s[:2] not in unavailable], resolvers)
+		invalid.update({s: unavailable[s[:2]] for s in ids if s[:2] in unavailable})
+		for sid, why in invalid.items():
+			_log(f"sync: skipping {sid}: {why}")
+		ids = [s for s in ids if s not in invalid]
+
+	if args.years_per_query is None:
+		# The API caps unregistered requests at 10 years; longer windows come back truncated
+		args.years_per_query = _MAX_YEARS_REGISTERED if config.BLS_API_KEY else _MAX_YEARS_UNREGISTERED
+	end_year = args.end_year or date.today().year
+	start_year = args.start_year or end_year - args.years_per_query + 1
+	options: Dict[str, Any] = {}
+	if args.catalog:
+		options["catalog"] = True
+	if args.calculations:
+		options["calculations"] = True
+	if args.annual_average:
+		options["annualaverage"] = True
+	tasks = [
+		(ids[i:i + _MAX_SERIES_PER_QUERY], lo, hi)
+		for i in range(0, len(ids), _MAX_SERIES_PER_QUERY)
+		for lo, hi in _year_windows(start_year, end_year, args.years_per_query)
+	]
+
+	# One client per worker thread (requests sessions aren't shared), one rate limit overall
+	limiter = RateLimiter(args.rate_limit)
+	local = threading.local()
+	cache = _ResponseCache(args.cache_dir, args.cache_ttl) if args.cache_dir else None
+	queries = cached = 0
+	lock = threading.Lock()
+
+	def run(task: Tuple[List[str], int, int]) -> List[Dict[str, Any]]:
+		nonlocal queries, cached
+		chunk, lo, hi = task
+		body = {"seriesid": chunk, "startyear": str(lo), "endyear": str(hi), **options}
+		hit = cache.get(body) if cache is not None else None
+		if hit is not None:
+			with lock:
+				cached += 1
+			return hit
+		if not hasattr(local, "client"):
+			http = HttpClient()
+			http.rate_limiter = limiter
+			local.client = PublicDataClient(http=http)
+		series_list = local.client.get_many_series(chunk, **{k: v for k, v in body.items() if k != "seriesid"})
+		with lock:
+			queries += 1
+		if cache is not None:
+			cache.put(body, series_list)
+		return series_list
+
+	started = time.monotonic()
+	pieces: List[Dict[str, Any]] = []
+	failed = 0
+	failed_ids = set()
+	with _progress(len(tasks), "sync", "query", not args.quiet) as bar, ThreadPoolExecutor(max_workers=args.workers) as pool:
+		futures = {pool.submit(run, t): t for t in tasks}
+		for fut in as_completed(futures):
+			try:
+				pieces.extend(fut.result())
+			except Exception as e:  # keep going; report at the end
+				failed += 1
+				failed_ids.update(futures[fut][0])
+				_log(f"sync: query failed: {e}")
+			bar.update(1)
+	# A series missing a year window would overwrite stored data with a partial copy
+	series_list = [s for s in _merge_windows(pieces) if s.get("seriesID") not in failed_ids]
+	if failed_ids:
+		_log(f"sync: not writing {len(failed_ids)} series from failed queries")
+	if failed and args.format != "parquet" and Path(args.output).exists():
+		# csv/jsonl are rewritten whole; keep the previous file rather than drop those series from it
+		_log(f"sync: {args.output} left unchanged because some queries failed")
+		rows = 0
+	else:
+		rows = _write_series(series_list, args.output, args.format)
+	elapsed = time.monotonic() - started
+
+	daily = _DAILY_QUERIES_REGISTERED if config.BLS_API_KEY else _DAILY_QUERIES_UNREGISTERED
+	_log(_summary(
+		"sync", elapsed,
+		series=len(series_list),
+		observations=rows,
+		queries=queries,
+		cached=cached,
+		failed=failed,
+	))
+	_log(f"sync: {rows / elapsed if elapsed else 0:.0f} obs/s, {queries / elapsed if elapsed else 0:.2f} queries/s; "
+		f"{queries}/{daily} of the daily query quota used by this run")
+	return 1 if failed else 0
+
+
+def cmd_catalog(args: argparse.Namespace) -> int:
+	from .rate_limiter import RateLimiter
+	from .series_catalog import fetch_series_for_survey
+
+	out_dir = Path(args.output)
+	suffix = {"csv": ".csv", "jsonl": ".jsonl", "parquet": ".parquet", "snapshot": ""}[args.format]
+	surveys = list(dict.fromkeys(s.strip().lower() for s in args.surveys))
+	todo = [s for s in surveys if args.refresh or not (out_dir / f"{s}{suffix}").exists()]
+	for s in surveys:
+		if s not in todo:
+			_log(f"catalog: {s} already present, skipping (use --refresh)")
+
+	limiter = RateLimiter(args.rate_limit)
+
+	def run(survey: str) -> int:
+		limiter.acquire()
+		rows = fetch_series_for_survey(survey, rate_limit_per_second=args.rate_limit)
+		target = out_dir / f"{survey}{suffix}"
+		if args.format == "snapshot":
+			from .catalog_snapshot import write_catalog_snapshot
+			write_catalog_snapshot(rows, target, survey=survey)
+		else:
+			_write_records(rows, target, args.format)
+		return len(rows)
+
+	started = time.monotonic()
+	total = failed = 0
+	with _progress(len(todo), "catalog", "survey", not args.quiet) as bar, ThreadPoolExecutor(max_workers=args.workers) as pool:
+		futures = {pool.submit(run, s): s for s in todo}
+		for fut in as_completed(futures):
+			try:
+				total += fut.result()
+			except Exception as e:
+				failed += 1
+				_log(f"catalog: {futures[fut]} failed: {e}")
+			bar.update(1)
+	elapsed = time.monotonic() - started
+	_log(_summary("catalog", elapsed, surveys=len(todo) - failed, series=total, failed=failed))
+	return 1 if failed else 0
+
+
+def cmd_schedule(args: argparse.Namespace) -> int:
+	years = _parse_years(args.years)
+	started = time.monotonic()
+	if args.from_cache:
+		from .release_schedule import reparse_cached_schedule
+		records = reparse_cached_schedule(args.from_cache, years=years or None, output="json")
+	else:
+		from .release_schedule import ScheduleScraper
+		with ScheduleScraper(headless=not args.show_browser, cache_dir=args.cache_dir, profile=args.profile) as scraper:
+			records = scraper.scrape(years, output="json", refresh=args.refresh)
+		if scraper.last_profile is not None:
+			_log(scraper.last_profile.summary())
+	if args.format == "parquet" and Path(args.output).suffix != ".parquet":
+		# Directory target: partitioned by year, like storage.write_schedule
+		import pandas as pd  # type: ignore
+		from .storage import write_schedule
+		write_schedule(pd.DataFrame.from_records(records), args.output)
+	else:
+		_write_records(records, Path(args.output), args.format)
+	elapsed = time.monotonic() - started
+	_log(_summary("schedule", elapsed, years=len(years), releases=len(records)))
+	return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+	parser = argparse.ArgumentParser(prog="bls-sdk", description="Bulk BLS data jobs.")
+	sub = parser.add_subparsers(dest="command", required=True)
+
+	common = argparse.ArgumentParser(add_help=False)
+	common.add_argument("-o", "--output", required=True, help="Output file or directory")
+	common.add_argument("-q", "--quiet", action="store_true", help="No progress bar")
+
+	# Only for the commands that issue parallel HTTP requests (the scraper drives one browser)
+	requests_opts = argparse.ArgumentParser(add_help=False)
+	requests_opts.add_argument("--workers", type=int, default=4, help="Parallel requests (default 4)")
+	requests_opts.add_argument("--rate-limit", type=float, default=None, help="Requests per second across all workers")
+
+	sync = sub.add_parser("sync", parents=[common, requests_opts], help="Pull timeseries for a list of series IDs")
+	sync.add_argument("--series-file", action="append", default=[], help="File of series IDs ('-' for stdin); repeatable")
+	sync.add_argument("--series", nargs="*", default=[], help="Series IDs on the command line")
+	sync.add_argument("--start-year", type=int)
+	sync.add_argument("--end-year", type=int)
+	sync.add_argument("--years-per-query", type=int, help="API year span per query (default 20 with BLS_API_KEY, 10 without)")
+	sync.add_argument("--format", choices=["parquet", "csv", "jsonl"], default="parquet")
+	sync.add_argument("--cache-dir", help="Reuse query results cached here")
+	sync.add_argument("--cache-ttl", type=float, default=12.0, help="Hours a cached result stays valid (default 12)")
+	sync.add_argument("--catalog", action="store_true", help="Request catalog metadata")
+	sync.add_argument("--calculations", action="store_true", help="Request net/percent changes")
+	sync.add_argument("--annual-average", action="store_true", help="Request annual averages")
+	sync.add_argument("--validate", action="store_true", help="Drop IDs missing from the survey catalogs before querying")
+	sync.set_defaults(func=cmd_sync)
+
+	catalog = sub.add_parser("catalog", parents=[common, requests_opts], help="Download survey catalogs (<survey>.series)")
+	catalog.add_argument("surveys", nargs="+", help="Survey codes, e.g. cu ce sm")
+	catalog.add_argument("--format", choices=["snapshot", "parquet", "csv", "jsonl"], default="snapshot")
+	catalog.add_argument("--refresh", action="store_true", help="Re-download catalogs already in the output directory")
+	catalog.set_defaults(func=cmd_catalog)
+
+	schedule = sub.add_parser("schedule", parents=[common], help="Rebuild the archived release schedule")
+	schedule.add_argument("--years", required=True, help="Years, e.g. 2008-2024 or 2019,2021")
+	schedule.add_argument("--format", choices=["csv", "jsonl", "parquet"], default="csv")
+	schedule.add_argument("--cache-dir", help="Page cache for the scraper (closed years are reused)")
+	schedule.add_argument("--from-cache", metavar="DIR", help="Re-parse cached pages only; no browser")
+	schedule.add_argument("--refresh", action="store_true", help="Re-fetch cached years")
+	schedule.add_argument("--show-browser", action="store_true", help="Run Chrome with a visible window")
+	schedule.add_argument("--profile", action="store_true", help="Report time spent per scraper stage and per year")
+	schedule.set_defaults(func=cmd_schedule)
+	return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+	args = build_parser().parse_args(argv)
+	if getattr(args, "rate_limit", 0) is None:
+		if args.command == "sync":
+			from . import config
+			args.rate_limit = config.DEFAULT_RATE_LIMIT_PER_SECOND
+		else:
+			args.rate_limit = 2.0
+	return args.func(args)
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -1,21 +1,69 @@
+"""Settings resolved from the environment (and `.env`) on first attribute access.
+
+Importing this module is free; `load_dotenv()` runs the first time a setting
+such as `config.BLS_API_KEY` is read. Call `reload()` to re-read the environment.
+"""
 import os
-from dotenv import load_dotenv
+from typing import Any, Dict
+
+_SETTINGS: Dict[str, Any] = {}
+
+# Names `__getattr__` will resolve; anything else (e.g. `__wrapped__` probes
+# from inspect/doctest) fails without reading the environment.
+_KEYS = (
+	"BLS_API_KEY",
+	"PUBLIC_API_BASE",
+	"PUBLIC_API_TS_DATA_ENDPOINT",
+	"PUBLIC_API_LATEST_ENDPOINT",
+	"PUBLIC_API_POPULAR_ENDPOINT",
+	"PUBLIC_API_SURVEYS_ENDPOINT",
+	"REQUEST_TIMEOUT_SECONDS",
+	"MAX_RETRIES",
+	"BACKOFF_INITIAL_SECONDS",
+	"BACKOFF_MAX_SECONDS",
+	"USER_AGENT",
+	"DEFAULT_RATE_LIMIT_PER_SECOND",
+)
+
+
+def _resolve() -> Dict[str, Any]:
+	if _SETTINGS:
+		return _SETTINGS
+	from dotenv import load_dotenv
+
+	load_dotenv()
+
+	public_api_base = os.getenv("BLS_PUBLIC_API_BASE", "https://api.bls.gov/publicAPI/v2")
+	_SETTINGS.update({
+		"BLS_API_KEY": os.getenv("BLS_API_KEY"),
+
+		"PUBLIC_API_BASE": public_api_base,
+		"PUBLIC_API_TS_DATA_ENDPOINT": f"{public_api_base}/timeseries/data",
+		"PUBLIC_API_LATEST_ENDPOINT": f"{public_api_base}/timeseries/latest",
+		"PUBLIC_API_POPULAR_ENDPOINT": f"{public_api_base}/timeseries/popular",
+		"PUBLIC_API_SURVEYS_ENDPOINT": f"{public_api_base}/surveys",
+
+		"REQUEST_TIMEOUT_SECONDS": int(os.getenv("BLS_REQUEST_TIMEOUT_SECONDS", "30")),
+		"MAX_RETRIES": int(os.getenv("BLS_MAX_RETRIES", "3")),
+		"BACKOFF_INITIAL_SECONDS": float(os.getenv("BLS_BACKOFF_INITIAL_SECONDS", "0.5")),
+		"BACKOFF_MAX_SECONDS": float(os.getenv("BLS_BACKOFF_MAX_SECONDS", "5")),
+		"USER_AGENT": os.getenv("BLS_USER_AGENT", "bls-sdk/0.1 (+local)"),
+
+		"DEFAULT_RATE_LIMIT_PER_SECOND": float(os.getenv("BLS_RATE_LIMIT_PER_SECOND", "5")),
+	})
+	return _SETTINGS
 
-load_dotenv()
 
-BLS_API_KEY = os.getenv("BLS_API_KEY")
+def reload() -> None:
+	"""Forget resolved settings so the next access re-reads the environment."""
+	_SETTINGS.clear()
 
-PUBLIC_API_BASE = os.getenv("BLS_PUBLIC_API_BASE", "https://api.bls.gov/publicAPI/v2")
-PUBLIC_API_TS_DATA_ENDPOINT = f"{PUBLIC_API_BASE}/timeseries/data"
-PUBLIC_API_LATEST_ENDPOINT = f"{PUBLIC_API_BASE}/timeseries/latest"
-PUBLIC_API_POPULAR_ENDPOINT = f"{PUBLIC_API_BASE}/timeseries/popular"
-PUBLIC_API_SURVEYS_ENDPOINT = f"{PUBLIC_API_BASE}/surveys"
 
+def __getattr__(name: str) -> Any:
+	if name not in _KEYS:
+		raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+	return _resolve()[name]
 
-REQUEST_TIMEOUT_SECONDS = int(os.getenv("BLS_REQUEST_TIMEOUT_SECONDS", "30"))
-MAX_RETRIES = int(os.getenv("BLS_MAX_RETRIES", "3"))
-BACKOFF_INITIAL_SECONDS = float(os.getenv("BLS_BACKOFF_INITIAL_SECONDS", "0.5"))
-BACKOFF_MAX_SECONDS = float(os.getenv("BLS_BACKOFF_MAX_SECONDS", "5"))
-USER_AGENT = os.getenv("BLS_USER_AGENT", "bls-sdk/0.1 (+local)")
 
-DEFAULT_RATE_LIMIT_PER_SECOND = float(os.getenv("BLS_RATE_LIMIT_PER_SECOND", "5"))
+def __dir__():
+	return sorted(list(globals()) + list(_KEYS))
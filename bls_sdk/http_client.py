@@ -3,16 +3,7 @@ from typing import Any, Dict, Optional
 import requests
 from tenacity import Retrying, stop_after_attempt, wait_exponential, retry_if_exception_type
 
-from .config import (
-	BLS_API_KEY,
-	PUBLIC_API_TS_DATA_ENDPOINT,
-	REQUEST_TIMEOUT_SECONDS,
-	MAX_RETRIES,
-	BACKOFF_INITIAL_SECONDS,
-	BACKOFF_MAX_SECONDS,
-	USER_AGENT,
-	DEFAULT_RATE_LIMIT_PER_SECOND,
-)
+from . import config
 from .errors import HttpError, ApiError
 from .rate_limiter import RateLimiter
 
@@ -26,16 +17,16 @@ class HttpClient:
 			rate_limit_per_second: Optional[float] = None,
 	):
 		self.session = requests.Session()
-		self.timeout_seconds = timeout_seconds or REQUEST_TIMEOUT_SECONDS
-		self.max_retries = max_retries or MAX_RETRIES
-		self.backoff_initial_seconds = backoff_initial_seconds or BACKOFF_INITIAL_SECONDS
-		self.backoff_max_seconds = backoff_max_seconds or BACKOFF_MAX_SECONDS
+		self.timeout_seconds = timeout_seconds or config.REQUEST_TIMEOUT_SECONDS
+		self.max_retries = max_retries or config.MAX_RETRIES
+		self.backoff_initial_seconds = backoff_initial_seconds or config.BACKOFF_INITIAL_SECONDS
+		self.backoff_max_seconds = backoff_max_seconds or config.BACKOFF_MAX_SECONDS
 		self.headers = {
-			"User-Agent": USER_AGENT,
+			"User-Agent": config.USER_AGENT,
 			"Accept": "application/json",
 			"Content-Type": "application/json",
 		}
-		self.rate_limiter = RateLimiter(rate_limit_per_second or DEFAULT_RATE_LIMIT_PER_SECOND)
+		self.rate_limiter = RateLimiter(rate_limit_per_second or config.DEFAULT_RATE_LIMIT_PER_SECOND)
 
 	def _do_request(self, method: str, url: str, **kwargs) -> requests.Response:
 		self.rate_limiter.acquire()
@@ -56,9 +47,9 @@ class HttpClient:
 
 	def post_public_timeseries(self, body: Dict[str, Any]) -> Dict[str, Any]:
 		payload = dict(body)
-		if BLS_API_KEY and "registrationKey" not in payload:
-			payload["registrationKey"] = BLS_API_KEY
-		resp = self._request_with_retries("POST", PUBLIC_API_TS_DATA_ENDPOINT, data=json.dumps(payload))
+		if config.BLS_API_KEY and "registrationKey" not in payload:
+			payload["registrationKey"] = config.BLS_API_KEY
+		resp = self._request_with_retries("POST", config.PUBLIC_API_TS_DATA_ENDPOINT, data=json.dumps(payload))
 		data = resp.json()
 		status = (data.get("status") or "").upper()
 		if status != "REQUEST_SUCCEEDED":
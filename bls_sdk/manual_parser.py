@@ -1,5 +1,7 @@
 import re
-from typing import Iterable, List, Dict, Union, Optional
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Dict, Tuple, Union, Optional
 from pathlib import Path
 
 _MONTH_TO_NUM = {
@@ -22,6 +24,13 @@ _DATE_RE = re.compile(
     r"(January|February|March|April|May|June|July|August|September|October|November|December|Jan\.?|Feb\.?|Mar\.?|Apr\.?|Jun\.?|Jul\.?|Aug\.?|Sep\.?|Sept\.?|Oct\.?|Nov\.?|Dec\.?)\s+(\d{1,2})(?:\s*,\s*(\d{4}))?(?!\d)",
     re.I,
 )
+_FIELD_SPLIT_RE = re.compile(r"\s{2,}|\t+")
+_NOTES_TAIL_RE = re.compile(r"(\s*\([^)]+\)\s*)+$")
+_NOTE_INNER_RE = re.compile(r"\(([^)]+)\)")
+_QUARTER_TAIL_RE = re.compile(r",\s*(First|Second|Third|Fourth)\s+Quarter\s+(\d{4})\s*$", re.I)
+_MONTH_TAIL_RE = re.compile(r",\s*(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})\s*$", re.I)
+_YEAR_TAIL_RE = re.compile(r",\s*(\d{4})\s*$")
+_INDEXES_RE = re.compile(r"\bIndexes\b", re.I)
 
 
 def _normalize_time_24h(text: str) -> Optional[str]:
@@ -45,10 +54,10 @@ def _normalize_time_24h(text: str) -> Optional[str]:
 
 def _strip_notes(title: str) -> (str, Optional[str]):
 	# Extract trailing parenthetical notes and normalize
-	m = re.search(r"(\s*\([^)]+\)\s*)+$", title)
+	m = _NOTES_TAIL_RE.search(title)
 	if not m:
 		return title.strip(), None
-	inner = re.findall(r"\(([^)]+)\)", m.group(0))
+	inner = _NOTE_INNER_RE.findall(m.group(0))
 	tokens = []
 	for raw in inner:
 		t = raw.strip().replace(".", "")
@@ -62,14 +71,13 @@ def _strip_notes(title: str) -> (str, Optional[str]):
 	return title[: m.start()].strip(), notes
 
 
-def _filter_cross_year_records(records: List[Dict[str, Union[str, int, None]]]) -> List[Dict[str, Union[str, int, None]]]:
+def _iter_cross_year_filtered(records: Iterable[Dict[str, Union[str, int, None]]]) -> Iterator[Dict[str, Union[str, int, None]]]:
 	"""Keep only rows where year(date) == source_year_page and drop duplicates.
 
 	This mirrors the reference filtering that removes the first releases of the
 	next year when they appear at the bottom of the prior year's manual page.
 	Duplicates are identified on (date, release_title).
 	"""
-	filtered: List[Dict[str, Union[str, int, None]]] = []
 	seen = set()
 	for r in records:
 		date_str = r.get("date")  # type: ignore[assignment]
@@ -87,32 +95,70 @@ def _filter_cross_year_records(records: List[Dict[str, Union[str, int, None]]])
 		if key in seen:
 			continue
 		seen.add(key)
-		filtered.append(r)
-	return filtered
+		yield r
 
 
-def parse_manual_schedule_txt(path: Union[str, Path], source_year: int, output: str = "dataframe") -> Union[List[Dict[str, Union[str, int, None]]], object]:
-	"""Parse a manually saved schedule text file into release_schedule format.
+def _filter_cross_year_records(records: Iterable[Dict[str, Union[str, int, None]]]) -> List[Dict[str, Union[str, int, None]]]:
+	return list(_iter_cross_year_filtered(records))
 
-	Expected line shape: '<Release Title>\t<Month> <day>[, <year>]\t<time>'
-	We tolerate multiple spaces or tabs as separators.
-	"""
-	path = Path(path)
-	lines = [ln.rstrip("\n") for ln in path.read_text(encoding="utf-8").splitlines()]
-	records: List[Dict[str, Union[str, int, None]]] = []
+
+@lru_cache(maxsize=65536)
+def _parse_manual_title(title: str) -> (str, Optional[str], Optional[int], Optional[int], Optional[int]):
+	"""Clean a manual-page title and split off notes and period fields (memoized)."""
+	clean_title, notes = _strip_notes(title)
+	# Drop leading 'The ' for Employment Situation
+	if clean_title.startswith("The Employment Situation"):
+		clean_title = clean_title[4:]
+
+	# Period extraction from title like ", Fourth Quarter 2006", ", December 2006" or trailing ", 2006"
+	period_year = None
+	period_month = None
+	period_quarter = None
+	# Tail ', <Quarter> Quarter <YYYY>'
+	m_q = _QUARTER_TAIL_RE.search(clean_title)
+	if m_q:
+		quarter_word = m_q.group(1).lower()
+		period_quarter = {"first": 1, "second": 2, "third": 3, "fourth": 4}[quarter_word]
+		period_year = int(m_q.group(2))
+		clean_title = clean_title[: m_q.start()].rstrip(', ').strip()
+	else:
+		# Tail ', <Month> <YYYY>'
+		m_tail = _MONTH_TAIL_RE.search(clean_title)
+		if m_tail:
+			period_month = _MONTH_TO_NUM[m_tail.group(1).lower()]
+			period_year = int(m_tail.group(2))
+			clean_title = clean_title[: m_tail.start()].rstrip(', ').strip()
+		else:
+			m_tail_y = _YEAR_TAIL_RE.search(clean_title)
+			if m_tail_y:
+				period_year = int(m_tail_y.group(1))
+				clean_title = clean_title[: m_tail_y.start()].rstrip(', ').strip()
+
+	# Normalize plural 'Indexes' to singular 'Index' for consistency
+	clean_title = _INDEXES_RE.sub("Index", clean_title)
+	return clean_title, notes, period_year, period_month, period_quarter
+
+
+def _iter_manual_records(path: Path, source_year: int) -> Iterator[Dict[str, Union[str, int, None]]]:
+	"""Stream raw (unfiltered) records from a manual schedule file, one line at a time."""
+	with path.open(encoding="utf-8") as fh:
+		yield from _iter_manual_lines(fh, source_year)
+
+
+def _iter_manual_lines(lines: Iterable[str], source_year: int) -> Iterator[Dict[str, Union[str, int, None]]]:
 	# Some BLS pages append a block of next-year January/February releases at the end.
 	# Detect entry into that block when we first see an explicit Jan/Feb date labeled
 	# with source_year+1, and from then on infer missing years on Jan/Feb rows as +1.
 	cross_year_active = False
 	for raw in lines:
-		raw = raw.replace("\xa0", " ")
+		raw = raw.rstrip("\r\n").replace("\xa0", " ")
 		if not raw.strip():
 			continue
 		low = raw.strip().lower()
 		if low.startswith("release name") or low.startswith("schedule for ") or low.startswith("last modified date"):
 			continue
 		# Split by two or more spaces or tabs
-		parts = re.split(r"\s{2,}|\t+", raw.strip())
+		parts = _FIELD_SPLIT_RE.split(raw.strip())
 		if len(parts) < 2:
 			continue
 		title = parts[0].strip()
@@ -152,39 +198,9 @@ def parse_manual_schedule_txt(path: Union[str, Path], source_year: int, output:
 				year = source_year + 1
 		date_iso = f"{year:04d}-{month:02d}-{day:02d}"
 
-		clean_title, notes = _strip_notes(title)
-		# Drop leading 'The ' for Employment Situation
-		if clean_title.startswith("The Employment Situation"):
-			clean_title = clean_title[4:]
-
-		# Period extraction from title like ", Fourth Quarter 2006", ", December 2006" or trailing ", 2006"
-		period_year = None
-		period_month = None
-		period_quarter = None
-		# Tail ', <Quarter> Quarter <YYYY>'
-		m_q = re.search(r",\s*(First|Second|Third|Fourth)\s+Quarter\s+(\d{4})\s*$", clean_title, re.I)
-		if m_q:
-			quarter_word = m_q.group(1).lower()
-			period_quarter = {"first": 1, "second": 2, "third": 3, "fourth": 4}[quarter_word]
-			period_year = int(m_q.group(2))
-			clean_title = clean_title[: m_q.start()].rstrip(', ').strip()
-		else:
-			# Tail ', <Month> <YYYY>'
-			m_tail = re.search(r",\s*(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})\s*$", clean_title, re.I)
-			if m_tail:
-				period_month = _MONTH_TO_NUM[m_tail.group(1).lower()]
-				period_year = int(m_tail.group(2))
-				clean_title = clean_title[: m_tail.start()].rstrip(', ').strip()
-			else:
-				m_tail_y = re.search(r",\s*(\d{4})\s*$", clean_title)
-				if m_tail_y:
-					period_year = int(m_tail_y.group(1))
-					clean_title = clean_title[: m_tail_y.start()].rstrip(', ').strip()
+		clean_title, notes, period_year, period_month, period_quarter = _parse_manual_title(title)
 
-		# Normalize plural 'Indexes' to singular 'Index' for consistency
-		clean_title = re.sub(r"\bIndexes\b", "Index", clean_title, flags=re.I)
-
-		records.append({
+		yield {
 			"date": date_iso,
 			"time": time_part or "",
 			"release_title": clean_title,
@@ -194,70 +210,121 @@ def parse_manual_schedule_txt(path: Union[str, Path], source_year: int, output:
 			"notes": notes,
 			"source_year_page": source_year,
 			"year_page_url": None,
-		})
+		}
 
-	# Remove rows whose release year doesn't match the page year; also de-dupe
-	records = _filter_cross_year_records(records)
 
-	if output == "json":
-		return records
-	# Default to DataFrame
+_COLUMNS = [
+	"date",
+	"time",
+	"release_title",
+	"period_year",
+	"period_month",
+	"period_quarter",
+	"notes",
+	"source_year_page",
+	"year_page_url",
+]
+
+
+def _records_to_frame(records: List[Dict[str, Union[str, int, None]]]) -> object:
 	import pandas as pd  # type: ignore
-	df = pd.DataFrame.from_records(records, columns=[
-		"date",
-		"time",
-		"release_title",
-		"period_year",
-		"period_month",
-		"period_quarter",
-		"notes",
-		"source_year_page",
-		"year_page_url",
-	])
+	df = pd.DataFrame.from_records(records, columns=_COLUMNS)
 	# Ensure strict de-duplication on (date, release_title)
 	if not df.empty:
 		df = df.drop_duplicates(subset=["date", "release_title"], keep="first").reset_index(drop=True)
 	return df
 
 
-def parse_manual_batch(years: Iterable[int], directory: Union[str, Path] = "data/manual_scrapes", output: str = "dataframe") -> Union[List[Dict[str, Union[str, int, None]]], object]:
+def parse_manual_schedule_txt(path: Union[str, Path], source_year: int, output: str = "dataframe") -> Union[List[Dict[str, Union[str, int, None]]], Iterator[Dict[str, Union[str, int, None]]], object]:
+	"""Parse a manually saved schedule text file into release_schedule format.
+
+	Expected line shape: '<Release Title>\t<Month> <day>[, <year>]\t<time>'
+	We tolerate multiple spaces or tabs as separators.
+	The file is read line by line; output='iter' yields records lazily.
+	"""
+	# Remove rows whose release year doesn't match the page year; also de-dupe
+	records = _iter_cross_year_filtered(_iter_manual_records(Path(path), int(source_year)))
+	if output == "iter":
+		return records
+	if output == "json":
+		return list(records)
+	# Default to DataFrame
+	return _records_to_frame(list(records))
+
+
+# (resolved path, source_year) -> ((mtime_ns, size), filtered records)
+_FILE_CACHE: Dict[Tuple[str, int], Tuple[Tuple[int, int], List[Dict[str, Union[str, int, None]]]]] = {}
+
+
+def _file_stamp(path: Path) -> Tuple[int, int]:
+	st = path.stat()
+	return st.st_mtime_ns, st.st_size
+
+
+def _parse_manual_file(path: str, source_year: int) -> List[Dict[str, Union[str, int, None]]]:
+	# Top-level so it can run in a worker process
+	return parse_manual_schedule_txt(path, source_year, output="json")  # type: ignore[return-value]
+
+
+def clear_manual_cache() -> None:
+	"""Forget cached parses so every file is re-read on the next batch call."""
+	_FILE_CACHE.clear()
+
+
+def _iter_year_records(jobs: List[Tuple[Path, int]], workers: Optional[int], use_cache: bool) -> Iterator[Dict[str, Union[str, int, None]]]:
+	# Serve unchanged files from the cache; parse the rest serially or in a process pool.
+	# Years are emitted in input order as soon as each one is ready.
+	keyed = [((str(p.resolve()), y), p, y, _file_stamp(p)) for p, y in jobs]
+	cached: Dict[int, List[Dict[str, Union[str, int, None]]]] = {}
+	for i, (key, _, _, stamp) in enumerate(keyed):
+		hit = _FILE_CACHE.get(key) if use_cache else None
+		if hit is not None and hit[0] == stamp:
+			cached[i] = hit[1]
+	pool = None
+	futures = {}
+	if workers and workers > 1 and len(keyed) - len(cached) > 1:
+		pool = ProcessPoolExecutor(max_workers=workers)
+		futures = {i: pool.submit(_parse_manual_file, str(p), y) for i, (_, p, y, _) in enumerate(keyed) if i not in cached}
+	try:
+		for i, (key, p, y, stamp) in enumerate(keyed):
+			if i in cached:
+				recs = cached[i]
+			else:
+				recs = futures[i].result() if i in futures else _parse_manual_file(str(p), y)
+				if use_cache:
+					_FILE_CACHE[key] = (stamp, recs)
+			# Hand out copies so callers can't mutate cached records
+			for r in recs:
+				yield dict(r)
+	finally:
+		if pool is not None:
+			pool.shutdown(wait=True, cancel_futures=True)
+
+
+def parse_manual_batch(years: Iterable[int], directory: Union[str, Path] = "data/manual_scrapes", output: str = "dataframe", workers: Optional[int] = None, use_cache: bool = True) -> Union[List[Dict[str, Union[str, int, None]]], Iterator[Dict[str, Union[str, int, None]]], object]:
 	"""Parse multiple manual schedule text files (one per year) and combine.
 
 	Parameters:
 	- years: iterable of ints (e.g., [2004, 2005])
 	- directory: root folder containing '<year>.txt'
-	- output: 'dataframe' (default) or 'json'
+	- output: 'dataframe' (default), 'json', or 'iter' (generator of dicts)
+	- workers: parse year files in a process pool of this size (default: serial)
+	- use_cache: reuse earlier parses of files whose mtime and size are unchanged
 
 	Returns a combined pandas DataFrame or list of dicts in the same schema as parse_manual_schedule_txt.
 	"""
 	directory = Path(directory)
-	all_records: List[Dict[str, Union[str, int, None]]] = []
+	jobs: List[Tuple[Path, int]] = []
 	for y in years:
 		p = directory / f"{int(y)}.txt"
 		if not p.exists():
 			continue
-		records_or_df = parse_manual_schedule_txt(p, int(y), output="json")
-		# ensure list
-		all_records.extend(records_or_df)  # type: ignore[arg-type]
+		jobs.append((p, int(y)))
 
 	# Apply cross-year filter and global de-duplication across combined years
-	all_records = _filter_cross_year_records(all_records)
+	records = _iter_cross_year_filtered(_iter_year_records(jobs, workers, use_cache))
+	if output == "iter":
+		return records
 	if output == "json":
-		return all_records
-	import pandas as pd  # type: ignore
-	df = pd.DataFrame.from_records(all_records, columns=[
-		"date",
-		"time",
-		"release_title",
-		"period_year",
-		"period_month",
-		"period_quarter",
-		"notes",
-		"source_year_page",
-		"year_page_url",
-	])
-	if not df.empty:
-		df = df.drop_duplicates(subset=["date", "release_title"], keep="first").reset_index(drop=True)
-	return df
-
-
+		return list(records)
+	return _records_to_frame(list(records))
@@ -0,0 +1,132 @@
+"""Aligned wide panels (dates x series) from Public Data API results.
+
+`build_panel` places every observation on a common month axis (see
+`calculations.observations_frame`), converts it to the target frequency and
+scatters it into a dense matrix in one vectorized pass:
+
+	panel = build_panel(client.get_many_series(ids, startyear="2015", endyear="2024"), freq="Q")
+	panel.values   # float64 [dates x series], NaN where missing
+	panel.mask     # True where the cell holds a value
+	panel.to_frame()
+
+Frequencies are "M", "Q", "S" (semiannual) and "A". Finer series are
+aggregated into each target period (`how`: mean, sum, first, last, min, max);
+by default a period is only filled when all its sub-periods are present.
+Coarser series are placed at the end of their period, or repeated across it
+with upsample="repeat". Annual-average periods (M13 etc.) are ignored.
+"""
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .calculations import MONTHS_PER_STEP, observations_frame
+
+
+_HOW = ("mean", "sum", "first", "last", "min", "max")
+
+
+class Panel:
+	"""Dense panel: `values[t, j]` is series `columns[j]` in the period starting `index[t]`."""
+
+	__slots__ = ("values", "mask", "index", "columns", "freq")
+
+	def __init__(self, values: np.ndarray, mask: np.ndarray, index: pd.DatetimeIndex, columns: List[str], freq: str):
+		self.values = values
+		self.mask = mask
+		self.index = index
+		self.columns = columns
+		self.freq = freq
+
+	@property
+	def shape(self):
+		return self.values.shape
+
+	def __repr__(self) -> str:
+		return f"Panel(freq={self.freq!r}, {self.values.shape[0]} periods x {self.values.shape[1]} series)"
+
+	def to_frame(self) -> pd.DataFrame:
+		return pd.DataFrame(self.values, index=self.index, columns=self.columns)
+
+
+def _period_starts(buckets: np.ndarray, months_per_bucket: int) -> pd.DatetimeIndex:
+	first_month = buckets * months_per_bucket
+	return pd.DatetimeIndex(pd.to_datetime({"year": first_month // 12, "month": first_month % 12 + 1, "day": 1}))
+
+
+def build_panel(
+		series_list: Iterable[Dict[str, Any]],
+		freq: str = "M",
+		how: str = "mean",
+		complete: bool = True,
+		upsample: str = "end",
+		start_year: Optional[int] = None,
+		end_year: Optional[int] = None,
+) -> Panel:
+	"""Align API series (`get_many_series` output) on one date index at frequency `freq`.
+
+	Columns keep the order series first appear in; the index covers every
+	period from the earliest to the latest observation (or start_year/end_year).
+	"""
+	freq = freq.upper()
+	if freq not in MONTHS_PER_STEP:
+		raise ValueError(f"Unknown frequency {freq!r} (use one of {', '.join(MONTHS_PER_STEP)})")
+	if how not in _HOW:
+		raise ValueError(f"Unknown aggregation {how!r} (use one of {', '.join(_HOW)})")
+	if upsample not in ("end", "repeat"):
+		raise ValueError(f"Unknown upsample mode {upsample!r} (use 'end' or 'repeat')")
+	k = MONTHS_PER_STEP[freq]
+
+	series_list = list(series_list)
+	columns = list(dict.fromkeys(s.get("seriesID") or s.get("series_id") for s in series_list))
+	frame = observations_frame(series_list)
+	frame = frame[frame["month"].notna() & frame["value"].notna()]
+	col = pd.Index(columns).get_indexer(frame["series_id"])
+	# Zero-based month the observation's period ends in, and its native length in months
+	end = frame["month"].to_numpy(dtype="int64") - 1
+	codes, uniques = pd.factorize(frame["period"])
+	native = np.array([MONTHS_PER_STEP[p[0]] for p in uniques], dtype="int64")[codes]
+	values = frame["value"].to_numpy(dtype="float64")
+
+	# Coarser-than-target observations cover several target periods
+	copies = np.where(native > k, native // k, 1) if upsample == "repeat" else np.ones_like(native)
+	rep = np.repeat(np.arange(len(values)), copies)
+	offset = np.arange(len(rep)) - np.repeat(np.cumsum(copies) - copies, copies)
+	bucket = end[rep] // k - (copies[rep] - 1 - offset)
+	col, values, native, end = col[rep], values[rep], native[rep], end[rep]
+
+	lo = start_year * 12 // k if start_year is not None else (int(bucket.min()) if len(bucket) else 0)
+	hi = ((end_year + 1) * 12 // k) - 1 if end_year is not None else (int(bucket.max()) if len(bucket) else -1)
+	keep = (bucket >= lo) & (bucket <= hi)
+	col, values, native, end, bucket = col[keep], values[keep], native[keep], end[keep], bucket[keep]
+	n_rows, n_cols = max(hi - lo + 1, 0), len(columns)
+	flat = (bucket - lo) * n_cols + col
+
+	size = n_rows * n_cols
+	count = np.bincount(flat, minlength=size)
+	if how in ("mean", "sum"):
+		out = np.bincount(flat, weights=values, minlength=size)
+		if how == "mean":
+			with np.errstate(invalid="ignore", divide="ignore"):
+				out = out / count
+	elif how in ("min", "max"):
+		out = np.full(size, np.inf if how == "min" else -np.inf)
+		(np.minimum if how == "min" else np.maximum).at(out, flat, values)
+	else:
+		# Order by cell then time; keep the first or last row of each cell
+		order = np.lexsort((end, flat))
+		sorted_flat = flat[order]
+		pick = np.r_[True, sorted_flat[1:] != sorted_flat[:-1]] if how == "first" else np.r_[sorted_flat[1:] != sorted_flat[:-1], True]
+		out = np.full(size, np.nan)
+		if len(order):
+			out[sorted_flat[pick]] = values[order][pick]
+
+	mask = count > 0
+	if complete:
+		# Sub-periods each cell needs, from the native frequency of the series in it
+		needed = np.zeros(size, dtype="int64")
+		np.maximum.at(needed, flat, np.where(native < k, k // native, 1))
+		mask &= count >= needed
+	out = np.where(mask, out, np.nan).reshape(n_rows, n_cols)
+	index = _period_starts(np.arange(lo, lo + n_rows), k)
+	return Panel(out, mask.reshape(n_rows, n_cols), index, columns, freq)
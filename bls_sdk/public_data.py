@@ -1,12 +1,7 @@
 from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 from .http_client import HttpClient
-from .config import (
-	PUBLIC_API_TS_DATA_ENDPOINT,
-	PUBLIC_API_LATEST_ENDPOINT,
-	PUBLIC_API_POPULAR_ENDPOINT,
-	PUBLIC_API_SURVEYS_ENDPOINT,
-)
+from . import config
 
 
 _MAX_SERIES_PER_REQUEST = 50
@@ -21,7 +16,8 @@ class PublicDataClient:
 		body.update(options)
 		return self.http.post_public_timeseries(body)
 
-	def get_many_series(self, series_ids: Sequence[str], **options: Any) -> List[Dict[str, Any]]:
+	def get_many_series(self, series_ids: Sequence[str], compact: bool = False, **options: Any) -> List[Any]:
+		"""Fetch series in chunks of 50; compact=True returns `series_data.Series` objects instead of dicts."""
 		if not series_ids:
 			return []
 		merged_series: List[Dict[str, Any]] = []
@@ -33,22 +29,25 @@ class PublicDataClient:
 			results = resp.get("Results", {})
 			series_list = results.get("series", [])
 			merged_series.extend(series_list)
+		if compact:
+			from .series_data import compact_series
+			return compact_series(merged_series)  # type: ignore[return-value]
 		return merged_series
 
 	def get_latest(self, series_ids: Union[Sequence[str], str]) -> Dict[str, Any]:
 		ids: List[str] = [series_ids] if isinstance(series_ids, str) else list(series_ids)
 		params: List[Tuple[str, str]] = [("seriesid", sid) for sid in ids]
-		return self.http.get_json(PUBLIC_API_LATEST_ENDPOINT, params=params)  # type: ignore[arg-type]
+		return self.http.get_json(config.PUBLIC_API_LATEST_ENDPOINT, params=params)  # type: ignore[arg-type]
 
 	def get_popular(self, survey: Optional[str] = None) -> Dict[str, Any]:
 		params = {"survey": survey} if survey else None
-		return self.http.get_json(PUBLIC_API_POPULAR_ENDPOINT, params=params)
+		return self.http.get_json(config.PUBLIC_API_POPULAR_ENDPOINT, params=params)
 
 	def list_surveys(self) -> Dict[str, Any]:
-		return self.http.get_json(PUBLIC_API_SURVEYS_ENDPOINT)
+		return self.http.get_json(config.PUBLIC_API_SURVEYS_ENDPOINT)
 
 	def get_survey(self, survey_abbr: str) -> Dict[str, Any]:
-		return self.http.get_json(f"{PUBLIC_API_SURVEYS_ENDPOINT}/{survey_abbr}")
+		return self.http.get_json(f"{config.PUBLIC_API_SURVEYS_ENDPOINT}/{survey_abbr}")
 
 	def list_surveys_list(self) -> List[Dict[str, Any]]:
 		resp = self.list_surveys()
@@ -0,0 +1,217 @@
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from fnmatch import fnmatchcase
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+try:
+	from zoneinfo import ZoneInfo
+except ImportError:  # pragma: no cover - Python < 3.9
+	ZoneInfo = None  # type: ignore
+
+
+# BLS publishes release times in US Eastern local time
+RELEASE_TZ = "America/New_York"
+
+# Release title -> the series it publishes: survey prefixes (first two
+# characters of series IDs) or, where a survey is split across releases,
+# fnmatch patterns on the whole series ID. Only releases that publish new
+# periods belong here: derived releases such as Real Earnings (CE data on CPI
+# day) would make series look due on the wrong date.
+#
+# Titles match exactly (case-insensitive); a key ending in '*' also matches
+# longer titles, so "Productivity and Costs" doesn't catch the industry release.
+DEFAULT_TITLE_SURVEYS: Dict[str, Tuple[str, ...]] = {
+	"Consumer Price Index": ("CU", "CW", "SU"),
+	"Employment Situation": ("CE", "LN"),
+	"Producer Price Index": ("WP", "PC"),
+	"Job Openings and Labor Turnover Survey": ("JT",),
+	"Employment Cost Index": ("CI",),
+	"Employer Costs for Employee Compensation": ("CM",),
+	"Productivity and Costs": ("PR",),
+	"Productivity and Costs by Industry*": ("IP",),
+	"U.S. Import and Export Price Index": ("EI",),
+	# State payrolls (area 00000) and state/regional unemployment (area types ST, RD)
+	"State Employment and Unemployment": ("SM?[0-9][0-9]00000*", "LA?ST*", "LA?RD*"),
+	# Metro payrolls (CBSA area codes) and sub-state unemployment
+	"Metropolitan Area Employment and Unemployment": ("SM?[0-9][0-9][1-9]*", "LA?MT*", "LA?MC*", "LA?CN*", "LA?CT*", "LA?CS*"),
+	"County Employment and Wages": ("EN",),
+	"Consumer Expenditures": ("CX",),
+	"Average Energy Prices": ("AP",),
+}
+
+Record = Dict[str, Union[str, int, None]]
+
+
+def release_datetime(record: Record) -> Optional[datetime]:
+	"""Combine a record's 'YYYY-MM-DD' date and 'HH:MM' time into a naive Eastern datetime."""
+	date_str = str(record.get("date") or "")
+	time_str = str(record.get("time") or "") or "00:00"
+	try:
+		return datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M")
+	except ValueError:
+		return None
+
+
+def _to_release_tz(when: datetime) -> datetime:
+	# Aware datetimes are converted to Eastern; naive ones are assumed to be Eastern already
+	if when.tzinfo is None or ZoneInfo is None:
+		return when.replace(tzinfo=None)
+	return when.astimezone(ZoneInfo(RELEASE_TZ)).replace(tzinfo=None)
+
+
+def _normalize_title(title: str) -> str:
+	title = " ".join(title.split()).lower()
+	return title.replace("indexes", "index")
+
+
+def _series_matches(series_id: str, entry: str) -> bool:
+	# Two-letter entries are survey prefixes, longer ones patterns on the whole ID
+	return series_id[:2] == entry if len(entry) == 2 else fnmatchcase(series_id, entry)
+
+
+class ReleaseCalendar:
+	"""In-memory release calendar indexed for fast time-window and next-release lookups.
+
+	Rows use the schedule schema of `scrape_archived_schedule` / `parse_manual_batch`
+	and are keyed on (date, release_title); `upsert()` replaces rows with the same
+	key. Release datetimes are naive US Eastern local times; aware datetimes passed
+	to queries are converted.
+
+	Indexes (a sorted datetime list overall and per title) are rebuilt lazily after
+	an upsert, so each query is a bisect rather than a scan.
+	"""
+
+	def __init__(self, records: Union[Iterable[Record], "pd.DataFrame", None] = None, title_surveys: Optional[Dict[str, Sequence[str]]] = None):
+		self._rows: Dict[Tuple[str, str], Record] = {}
+		self._dirty = True
+		self._times: List[datetime] = []
+		self._sorted: List[Record] = []
+		self._by_title: Dict[str, Tuple[List[datetime], List[Record]]] = {}
+		surveys = DEFAULT_TITLE_SURVEYS if title_surveys is None else title_surveys
+		self._title_surveys: Dict[str, Tuple[str, ...]] = {_normalize_title(k): tuple(p.upper() for p in v) for k, v in surveys.items()}
+		# '*' keys, longest first so the most specific title wins
+		self._title_patterns = sorted(((k[:-1], v) for k, v in self._title_surveys.items() if k.endswith("*")), key=lambda kv: -len(kv[0]))
+		self._entry_cache: Dict[str, Tuple[str, ...]] = {}
+		if records is not None:
+			self.upsert(records)
+
+	def __len__(self) -> int:
+		return len(self._rows)
+
+	def upsert(self, records: Union[Iterable[Record], "pd.DataFrame"]) -> int:
+		"""Merge rows (list of dicts or DataFrame), de-duplicating on (date, release_title).
+
+		Later rows replace earlier ones with the same key. Returns the number of
+		rows that were added or changed.
+		"""
+		if hasattr(records, "to_dict"):
+			df = records  # type: ignore[assignment]
+			records = df.astype(object).where(df.notna(), None).to_dict("records")  # type: ignore[union-attr]
+		changed = 0
+		for r in records:
+			key = (str(r.get("date")), str(r.get("release_title")))
+			if self._rows.get(key) != r:
+				self._rows[key] = dict(r)
+				changed += 1
+		if changed:
+			self._dirty = True
+		return changed
+
+	def _ensure_index(self) -> None:
+		if not self._dirty:
+			return
+		pairs = []
+		for r in self._rows.values():
+			dt = release_datetime(r)
+			if dt is not None:
+				pairs.append((dt, str(r.get("release_title")), r))
+		pairs.sort(key=lambda p: (p[0], p[1]))
+		self._times = [p[0] for p in pairs]
+		self._sorted = [p[2] for p in pairs]
+		by_title: Dict[str, Tuple[List[datetime], List[Record]]] = {}
+		for dt, title, r in pairs:
+			times, rows = by_title.setdefault(title, ([], []))
+			times.append(dt)
+			rows.append(r)
+		self._by_title = by_title
+		self._dirty = False
+
+	def _series_for(self, title: Optional[str]) -> Tuple[List[datetime], List[Record]]:
+		self._ensure_index()
+		if title is None:
+			return self._times, self._sorted
+		return self._by_title.get(title, ([], []))
+
+	def titles(self) -> List[str]:
+		self._ensure_index()
+		return sorted(self._by_title)
+
+	def next_release(self, after: datetime, title: Optional[str] = None, inclusive: bool = False) -> Optional[Record]:
+		"""First release strictly after `after` (or at it, with inclusive=True), optionally for one title."""
+		times, rows = self._series_for(title)
+		when = _to_release_tz(after)
+		i = bisect_left(times, when) if inclusive else bisect_right(times, when)
+		return rows[i] if i < len(rows) else None
+
+	def previous_release(self, before: datetime, title: Optional[str] = None) -> Optional[Record]:
+		"""Last release at or before `before`, optionally for one title."""
+		times, rows = self._series_for(title)
+		i = bisect_right(times, _to_release_tz(before))
+		return rows[i - 1] if i > 0 else None
+
+	def between(self, start: datetime, end: datetime, title: Optional[str] = None) -> List[Record]:
+		"""Releases with start <= datetime < end, in time order."""
+		times, rows = self._series_for(title)
+		lo = bisect_left(times, _to_release_tz(start))
+		hi = bisect_left(times, _to_release_tz(end))
+		return rows[lo:hi]
+
+	def _entries_for_title(self, title: str) -> Tuple[str, ...]:
+		hit = self._entry_cache.get(title)
+		if hit is None:
+			norm = _normalize_title(title)
+			hit = self._title_surveys.get(norm)
+			if hit is None:
+				hit = next((v for k, v in self._title_patterns if norm.startswith(k)), ())
+			self._entry_cache[title] = hit
+		return hit
+
+	def surveys_for_title(self, title: str) -> Tuple[str, ...]:
+		"""Survey prefixes (e.g. ('CU', 'CW', 'SU')) a release title publishes; () if unknown.
+
+		Titles match case-insensitively on the mapped name (or start with a '*' key).
+		"""
+		return tuple(dict.fromkeys(e[:2] for e in self._entries_for_title(title)))
+
+	def titles_for_survey(self, prefix: str) -> List[str]:
+		"""Release titles in the calendar that publish (part of) the given survey prefix."""
+		prefix = prefix[:2].upper()
+		return [t for t in self.titles() if prefix in self.surveys_for_title(t)]
+
+	def titles_for_series(self, series_id: str) -> List[str]:
+		"""Release titles in the calendar that publish this particular series."""
+		sid = series_id.strip().upper()
+		return [t for t in self.titles() if any(_series_matches(sid, e) for e in self._entries_for_title(t))]
+
+	def next_release_for_series(self, series_id: str, after: datetime) -> Optional[Record]:
+		"""Next release after `after` whose title publishes `series_id`."""
+		candidates = [self.next_release(after, title=t) for t in self.titles_for_series(series_id)]
+		candidates = [c for c in candidates if c is not None]
+		if not candidates:
+			return None
+		return min(candidates, key=lambda r: release_datetime(r))  # type: ignore[arg-type, return-value]
+
+	def to_frame(self) -> "pd.DataFrame":
+		import pandas as pd  # type: ignore
+		self._ensure_index()
+		return pd.DataFrame.from_records(self._sorted, columns=[
+			"date",
+			"time",
+			"release_title",
+			"period_year",
+			"period_month",
+			"period_quarter",
+			"notes",
+			"source_year_page",
+			"year_page_url",
+		])
@@ -1,16 +1,25 @@
-from typing import Iterable, List, Dict, Union
+from typing import TYPE_CHECKING, Iterable, List, Dict, Optional, Tuple, Union
+from contextlib import nullcontext
+from functools import lru_cache
+from pathlib import Path
+import logging
 import re
 import time
 
-from tqdm.auto import tqdm
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.common.by import By
-from bs4 import BeautifulSoup
+from . import config
+from .schedule_cache import SchedulePageCache
+from .scrape_profile import ScrapeProfile
 
-from .config import USER_AGENT
+logger = logging.getLogger(__name__)
 
 
+if TYPE_CHECKING:
+	import pandas as pd
+	from selenium import webdriver
+
+# selenium, bs4, lxml and tqdm are imported where they are used, so the parsing
+# helpers in this module can be imported without any browser tooling.
+
 _ARCHIVE_URL = "https://www.bls.gov/bls/archived_sched.htm"
 
 _MONTH_TO_NUM = {
@@ -36,31 +45,86 @@ _QUARTER_WORD_TO_NUM = {
 }
 
 
-def _new_driver(headless: bool = True) -> webdriver.Chrome:
+def _new_driver(headless: bool = True) -> "webdriver.Chrome":
+	from selenium import webdriver
+	from selenium.webdriver.chrome.options import Options as ChromeOptions
+
 	opts = ChromeOptions()
 	if headless:
 		opts.add_argument("--headless=new")
-	opts.add_argument(f"--user-agent={USER_AGENT}")
+	opts.add_argument(f"--user-agent={config.USER_AGENT}")
 	opts.add_argument("--no-sandbox")
 	opts.add_argument("--disable-dev-shm-usage")
 	return webdriver.Chrome(options=opts)
 
 
-def _extract_rows_with_selenium(driver: webdriver.Chrome) -> List[Dict[str, str]]:
+def _extract_rows_with_selenium(driver: "webdriver.Chrome") -> List[Dict[str, str]]:
 	# Parse the page source with BeautifulSoup to avoid Selenium grabbing nested text
-	html = driver.page_source
-	soup = BeautifulSoup(html, "html.parser")
-	rows: List[Dict[str, str]] = []
+	return _extract_rows_from_html(driver.page_source)
+
+
+_WEEKDAY_PATTERN = r"(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)"
+_MONTH_PATTERN = r"(?:January|February|March|April|May|June|July|August|September|October|November|December)"
+_ROW_DATE_RE = re.compile(rf"^{_WEEKDAY_PATTERN},\s+{_MONTH_PATTERN}\s+\d{{1,2}},\s+\d{{4}}$", re.I)
+# Accept 'AM', 'PM', 'am', 'pm', and 'a.m.'/'p.m.' variants
+_ROW_TIME_RE = re.compile(r"^\d{1,2}:\d{2}\s*(?:AM|PM|A\.M\.|P\.M\.|am|pm|a\.m\.|p\.m\.)$", re.I)
+_TABLE_TAG_RE = re.compile(r"<(/?)table\b[^>]*>", re.I)
+
+_LXML_UNRESOLVED = object()
+_lxml_html = _LXML_UNRESOLVED
 
-	def norm(s: str) -> str:
-		# Normalize whitespace and NBSPs
-		return " ".join((s or "").replace("\xa0", " ").split())
 
-	weekday = r"(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)"
-	month = r"(?:January|February|March|April|May|June|July|August|September|October|November|December)"
-	date_re = re.compile(rf"^{weekday},\s+{month}\s+\d{{1,2}},\s+\d{{4}}$", re.I)
-	# Accept 'AM', 'PM', 'am', 'pm', and 'a.m.'/'p.m.' variants
-	time_re = re.compile(r"^\d{1,2}:\d{2}\s*(?:AM|PM|A\.M\.|P\.M\.|am|pm|a\.m\.|p\.m\.)$", re.I)
+def _get_lxml_html():
+	# lxml is an optional speedup; None means fall back to BeautifulSoup
+	global _lxml_html
+	if _lxml_html is _LXML_UNRESOLVED:
+		try:
+			import lxml.html as module  # type: ignore
+		except ImportError:
+			module = None
+		_lxml_html = module
+	return _lxml_html
+
+
+def _norm_cell(s: str) -> str:
+	# Normalize whitespace and NBSPs
+	return " ".join((s or "").replace("\xa0", " ").split())
+
+
+def _make_row(date_text: str, time_text: str, release_text: str) -> Optional[Dict[str, str]]:
+	# Preserve original spacing in the date cell (no trimming), but use a trimmed copy for validation
+	date_cell_raw = (date_text or "").replace("\xa0", " ")
+	time_str = _norm_cell(time_text)
+	release_str = _norm_cell(release_text)
+	if not _ROW_DATE_RE.match(date_cell_raw.strip()):
+		return None
+	if not _ROW_TIME_RE.match(time_str):
+		return None
+	if not release_str:
+		return None
+	return {"date_raw": date_cell_raw, "time": time_str, "release_raw": release_str}
+
+
+def _extract_rows_from_html(html: str, backend: Optional[str] = None) -> List[Dict[str, str]]:
+	"""Extract raw `date_raw/time/release_raw` rows from a schedule page.
+
+	backend: 'lxml' or 'bs4'; defaults to lxml when installed. Both return
+	identical rows.
+	"""
+	if backend is None:
+		backend = "lxml" if _get_lxml_html() is not None else "bs4"
+	if backend == "lxml":
+		return _extract_rows_lxml(html)
+	if backend == "bs4":
+		return _extract_rows_bs4(html)
+	raise ValueError(f"Unknown HTML backend: {backend!r}")
+
+
+def _extract_rows_bs4(html: str) -> List[Dict[str, str]]:
+	from bs4 import BeautifulSoup
+
+	soup = BeautifulSoup(html, "html.parser")
+	rows: List[Dict[str, str]] = []
 
 	# Iterate all tables; inside each table, locate the header row, then scan remaining rows
 	for table in soup.find_all("table"):
@@ -70,7 +134,7 @@ def _extract_rows_with_selenium(driver: webdriver.Chrome) -> List[Dict[str, str]
 			ths = tr.find_all("th")
 			if not ths:
 				continue
-			headers = [norm(th.get_text(" ")).lower().rstrip(":") for th in ths]
+			headers = [_norm_cell(th.get_text(" ")).lower().rstrip(":") for th in ths]
 			if headers[:3] == ["date", "time", "release"]:
 				header_index = i
 				break
@@ -82,112 +146,476 @@ def _extract_rows_with_selenium(driver: webdriver.Chrome) -> List[Dict[str, str]
 			cells = tr.find_all("td")
 			if len(cells) != 3:
 				continue
-			# Preserve original spacing in the date cell (no trimming), but use a trimmed copy for validation
-			date_cell_raw = (cells[0].get_text(" ", strip=False) or "").replace("\xa0", " ")
-			date_cell_trim = date_cell_raw.strip()
-			time_str = norm((cells[1].get_text(" ", strip=False) or "").replace("\xa0", " "))
-			release_str = norm((cells[2].get_text(" ", strip=False) or "").replace("\xa0", " "))
-			if not date_re.match(date_cell_trim):
-				continue
-			if not time_re.match(time_str):
-				continue
-			if not release_str:
-				continue
-			rows.append({"date_raw": date_cell_raw, "time": time_str, "release_raw": release_str})
+			row = _make_row(*(c.get_text(" ", strip=False) for c in cells))
+			if row is not None:
+				rows.append(row)
 	return rows
 
 
-def scrape_archived_schedule(years: Iterable[int], output: str = "dataframe") -> Union["pd.DataFrame", List[Dict[str, Union[str, int, None]]]]:
-	"""Selenium-based scraper for BLS Archived Release Schedule.
+def _table_fragments(html: str) -> Optional[List[str]]:
+	"""Slice out top-level <table>...</table> segments; None if tags don't balance."""
+	fragments: List[str] = []
+	depth = 0
+	start = 0
+	for m in _TABLE_TAG_RE.finditer(html):
+		if m.group(1):
+			depth -= 1
+			if depth < 0:
+				return None
+			if depth == 0:
+				fragments.append(html[start:m.end()])
+		else:
+			if depth == 0:
+				start = m.start()
+			depth += 1
+	return fragments if depth == 0 else None
 
-	Returns pandas DataFrame by default, or list[dict] when output="json".
+
+def _extract_rows_lxml(html: str) -> List[Dict[str, str]]:
+	lxml_html = _get_lxml_html()
+	if lxml_html is None:
+		raise ImportError("lxml is required for the 'lxml' backend: pip install lxml")
+	# Parse only the table markup; the rest of the page (nav, scripts, footer) is skipped
+	fragments = _table_fragments(html)
+	if fragments is None:
+		roots = [lxml_html.document_fromstring(html)]
+	else:
+		roots = [lxml_html.fragment_fromstring(f) for f in fragments if "<th" in f.lower()]
+	rows: List[Dict[str, str]] = []
+	for root in roots:
+		for table in root.iter("table"):
+			in_schedule = False
+			for tr in table.iter("tr"):
+				# One pass over each row's cells
+				ths = []
+				tds = []
+				for cell in tr.iter("th", "td"):
+					(ths if cell.tag == "th" else tds).append(cell)
+				if not in_schedule:
+					if not ths:
+						continue
+					headers = [_norm_cell(" ".join(th.itertext())).lower().rstrip(":") for th in ths]
+					in_schedule = headers[:3] == ["date", "time", "release"]
+					continue
+				if ths:
+					break
+				if len(tds) != 3:
+					continue
+				row = _make_row(*(" ".join(c.itertext()) for c in tds))
+				if row is not None:
+					rows.append(row)
+	return rows
+
+
+_OUTPUT_COLUMNS = [
+	"date",
+	"time",
+	"release_title",
+	"period_year",
+	"period_month",
+	"period_quarter",
+	"notes",
+	"source_year_page",
+	"year_page_url",
+]
+
+
+def _tag_rows(rows: List[Dict[str, str]], source_year: int, url: Optional[str]) -> List[Dict[str, Union[str, int, None]]]:
+	return [dict(r, source_year_page=source_year, year_page_url=url) for r in rows]
+
+
+def _records_to_output(raw_rows: List[Dict[str, Union[str, int, None]]], output: str) -> Union["pd.DataFrame", List[Dict[str, Union[str, int, None]]]]:
+	df = normalize_schedule_rows(raw_rows)
+	if output == "json":
+		return df.astype(object).where(df.notna(), None).to_dict("records")
+	return df
+
+
+def parse_release_titles(releases: Union[Iterable[str], "pd.Series"]) -> "pd.DataFrame":
+	"""Batch version of the release-text parser for a whole column.
+
+	Each distinct raw string is parsed once (and memoized across calls), then
+	broadcast back to every row, so heavily repeated titles cost nothing extra.
+	Returns columns release_title, period_year, period_month, period_quarter, notes.
 	"""
-	records: List[Dict[str, Union[str, int, None]]] = []
-	driver = _new_driver(headless=True)
+	import pandas as pd  # type: ignore
+	values = pd.Series(releases, dtype=object).fillna("")
+	codes, uniques = pd.factorize(values)
+	parsed = [_parse_release_text(u) for u in uniques]
+	out = pd.DataFrame.from_records(parsed, columns=["release_title", "period_year", "period_month", "period_quarter", "notes"])
+	out = out.take(codes).reset_index(drop=True)
+	out.index = values.index
+	for col in ("period_year", "period_month", "period_quarter"):
+		out[col] = pd.to_numeric(out[col], errors="coerce").astype("Int64")
+	return out
+
+
+def _map_uniques(values: "pd.Series", fn) -> "pd.Series":
+	# Apply a column transform to distinct values only, then broadcast back
+	import pandas as pd  # type: ignore
+	codes, uniques = pd.factorize(values)
+	mapped = fn(pd.Series(uniques, dtype=object))
+	return pd.Series(mapped.to_numpy()[codes], index=values.index, dtype=object)
+
+
+def parse_date_column(dates: Union[Iterable[str], "pd.Series"]) -> "pd.Series":
+	"""Vectorized `_parse_date_iso`: '<Weekday>, <Month> <d>, <YYYY>' -> 'YYYY-MM-DD' (NaN if no match)."""
+	import pandas as pd  # type: ignore
+
+	def convert(s: "pd.Series") -> "pd.Series":
+		parts = s.str.extract(_DATE_ISO_RE)
+		month = parts[0].str.lower().map(_MONTH_TO_NUM)
+		ok = month.notna()
+		out = pd.Series(float("nan"), index=s.index, dtype=object)
+		out[ok] = (
+			parts.loc[ok, 2]
+			+ "-" + month[ok].astype(int).astype(str).str.zfill(2)
+			+ "-" + parts.loc[ok, 1].str.zfill(2)
+		)
+		return out
+
+	return _map_uniques(pd.Series(dates, dtype=object).fillna("").astype(str), convert)
+
+
+def parse_time_column(times: Union[Iterable[str], "pd.Series"]) -> "pd.Series":
+	"""Vectorized `_normalize_time_to_24h`: 'HH:MM AM/PM' -> 'HH:MM' (NaN if no match)."""
+	import pandas as pd  # type: ignore
+
+	def convert(s: "pd.Series") -> "pd.Series":
+		parts = s.str.strip().str.extract(_TIME_24H_RE)
+		ok = parts[0].notna()
+		out = pd.Series(float("nan"), index=s.index, dtype=object)
+		if ok.any():
+			h = parts.loc[ok, 0].astype(int)
+			pm = parts.loc[ok, 2].str.upper() == "PM"
+			h = h.where(~(~pm & (h == 12)), 0)
+			h = h.where(~(pm & (h != 12)), h + 12)
+			out[ok] = h.astype(str).str.zfill(2) + ":" + parts.loc[ok, 1]
+		return out
+
+	return _map_uniques(pd.Series(times, dtype=object).fillna("").astype(str), convert)
+
+
+def normalize_schedule_rows(rows: Union[List[Dict[str, Union[str, int, None]]], "pd.DataFrame"]) -> "pd.DataFrame":
+	"""Normalize raw scraped rows (date_raw, time, release_raw) into the schedule schema.
+
+	Accepts a list of row dicts or a DataFrame; optional source_year_page and
+	year_page_url columns are passed through. Dates and times are parsed with
+	vectorized `str.extract`; release strings go through `parse_release_titles`.
+	Unparseable dates/times keep their stripped raw text, like the per-row parser.
+	"""
+	import pandas as pd  # type: ignore
+	raw = rows if isinstance(rows, pd.DataFrame) else pd.DataFrame.from_records(rows, columns=["date_raw", "time", "release_raw", "source_year_page", "year_page_url"])
+	if raw.empty:
+		df = pd.DataFrame(columns=_OUTPUT_COLUMNS)
+		for col in ("period_year", "period_month", "period_quarter"):
+			df[col] = df[col].astype("Int64")
+		return df
+	date_raw = raw["date_raw"].fillna("").astype(str)
+	time_raw = raw["time"].fillna("").astype(str)
+	titles = parse_release_titles(raw["release_raw"])
+	df = pd.DataFrame({
+		"date": parse_date_column(date_raw).fillna(date_raw.str.strip()),
+		"time": parse_time_column(time_raw).fillna(time_raw.str.strip()),
+	}, index=raw.index)
+	df = df.join(titles)
+	for col in ("source_year_page", "year_page_url"):
+		df[col] = raw[col] if col in raw.columns else None
+	return df[_OUTPUT_COLUMNS].reset_index(drop=True)
+
+
+# WebDriver errors that mean the browser session itself is dead, not just one page
+_SESSION_ERROR_MARKERS = ("invalid session id", "chrome not reachable", "disconnected", "no such window", "session deleted")
+
+
+def _is_session_error(exc: Exception) -> bool:
 	try:
-		# Load archive to discover year links
-		driver.get(_ARCHIVE_URL)
-		year_elems = driver.find_elements(By.PARTIAL_LINK_TEXT, "20") + driver.find_elements(By.PARTIAL_LINK_TEXT, "19")
-		text_to_href = {e.text.strip(): e.get_attribute("href") for e in year_elems if e.get_attribute("href")}
-		for y in tqdm(years):
-			y_int = int(y)
-			if y_int < 2008:
-				# pre-2008 handled via manual scrapes; skip here
-				continue
-			# Find a link that contains the year
-			candidate = None
-			for k, v in text_to_href.items():
-				if str(y_int) in k or str(y_int) in (v or ""):
-					candidate = v
-					break
-			# Build a list of candidate URLs to try
-			candidates: List[str] = []
-			if candidate:
-				candidates.append(candidate)
-			candidates.append(f"https://www.bls.gov/bls/schedule/archives/all_{y_int}_sched.htm")
-			candidates.append(f"https://www.bls.gov/schedule/{y_int}/home.htm")
-			record_rows: List[Dict[str, str]] = []
-			for url in candidates:
-				try:
+		from selenium.common.exceptions import InvalidSessionIdException, WebDriverException
+	except ImportError:  # pragma: no cover - selenium is a dependency of the scraper
+		return False
+	if isinstance(exc, InvalidSessionIdException):
+		return True
+	return isinstance(exc, WebDriverException) and any(m in str(exc).lower() for m in _SESSION_ERROR_MARKERS)
+
+
+class ScheduleScraper:
+	"""Reusable Selenium session for the BLS Archived Release Schedule.
+
+	Keeps a single Chrome driver warm across calls and caches the archive's
+	year links, so repeated `scrape()` calls skip driver startup and link
+	discovery. Use as a context manager, or call `close()` when done.
+
+	With `cache_dir`, the raw HTML of each year page is persisted (see
+	`SchedulePageCache`). Closed years with a cached page are parsed from disk;
+	only the current and future years hit the network.
+
+	With `profile=True`, every `scrape()` times each stage (driver start, page
+	loads, sleeps, List View clicks, extraction, parsing) and records the URLs
+	tried per year in `last_profile` (a `ScrapeProfile`); the summary is also
+	logged at INFO level.
+
+	If Chrome's session dies mid-run, the browser is restarted and the year
+	retried once; a year that fails again is skipped, listed in `failed_years`
+	(and in the profile), and the rest of the batch is still returned.
+
+	Example:
+		with ScheduleScraper() as scraper:
+			df_2023 = scraper.scrape([2023])
+			df_2024 = scraper.scrape([2024])
+	"""
+
+	def __init__(self, headless: bool = True, cache_dir: Optional[Union[str, Path]] = None, profile: bool = False):
+		self.headless = headless
+		self.cache = SchedulePageCache(cache_dir) if cache_dir is not None else None
+		self.profile = profile
+		self.last_profile: Optional[ScrapeProfile] = None
+		self._profile: Optional[ScrapeProfile] = None
+		self._driver: Optional["webdriver.Chrome"] = None
+		self._link_index: Optional[Dict[str, str]] = None
+		self._year_urls: Dict[int, str] = {}
+		# Years the last `scrape()` gave up on after losing Chrome twice
+		self.failed_years: List[int] = []
+
+	def __enter__(self) -> "ScheduleScraper":
+		# The driver starts lazily so fully cached runs never launch Chrome
+		return self
+
+	def __exit__(self, exc_type, exc, tb) -> None:
+		self.close()
+
+	def _stage(self, name: str):
+		return self._profile.stage(name) if self._profile is not None else nullcontext()
+
+	def _sleep(self, seconds: float) -> None:
+		if self._profile is not None:
+			self._profile.sleep(seconds)
+		else:
+			time.sleep(seconds)
+
+	@property
+	def driver(self) -> "webdriver.Chrome":
+		if self._driver is None:
+			with self._stage("driver_start"):
+				self._driver = _new_driver(headless=self.headless)
+		return self._driver
+
+	def start(self) -> None:
+		"""Start the browser now instead of on first use."""
+		self.driver
+
+	def close(self) -> None:
+		"""Quit the browser. Cached year links are kept for a later restart."""
+		if self._driver is not None:
+			try:
+				self._driver.quit()
+			finally:
+				self._driver = None
+
+	def _discard_driver(self) -> None:
+		driver, self._driver = self._driver, None
+		if driver is not None:
+			try:
+				driver.quit()
+			except Exception:
+				pass
+
+	def year_links(self) -> Dict[str, str]:
+		"""Return the archive's link text -> href map, loading it once per session."""
+		if self._link_index is None:
+			from selenium.webdriver.common.by import By
+
+			driver = self.driver
+			with self._stage("archive_discovery"):
+				driver.get(_ARCHIVE_URL)
+				year_elems = driver.find_elements(By.PARTIAL_LINK_TEXT, "20") + driver.find_elements(By.PARTIAL_LINK_TEXT, "19")
+				self._link_index = {e.text.strip(): e.get_attribute("href") for e in year_elems if e.get_attribute("href")}
+		return self._link_index
+
+	def _candidate_urls(self, year: int) -> List[str]:
+		candidates: List[str] = []
+		# A URL that already yielded rows in this session goes first
+		known = self._year_urls.get(year)
+		if known:
+			candidates.append(known)
+		# Find a link that contains the year
+		for k, v in self.year_links().items():
+			if str(year) in k or str(year) in (v or ""):
+				candidates.append(v)
+				break
+		candidates.append(f"https://www.bls.gov/bls/schedule/archives/all_{year}_sched.htm")
+		candidates.append(f"https://www.bls.gov/schedule/{year}/home.htm")
+		# Drop duplicates while keeping order
+		return list(dict.fromkeys(candidates))
+
+	def _scrape_year(self, year: int) -> (List[Dict[str, str]], Optional[str]):
+		from selenium.webdriver.common.by import By
+
+		driver = self.driver
+		for url in self._candidate_urls(year):
+			t0 = time.perf_counter()
+			rows = []
+			try:
+				with self._stage("page_load"):
 					driver.get(url)
-					time.sleep(0.8)
-					# Simulate minimal human behavior
+				self._sleep(0.8)
+				# Simulate minimal human behavior
+				with self._stage("scroll"):
 					driver.execute_script("window.scrollTo(0, Math.max(document.body.scrollHeight*0.2, 400));")
-					time.sleep(0.4)
+				self._sleep(0.4)
+				with self._stage("scroll"):
 					driver.execute_script("window.scrollTo(0, 0);")
+				with self._stage("list_view"):
 					links = driver.find_elements(By.LINK_TEXT, "List View")
 					if links:
 						links[0].click()
-						time.sleep(0.6)
-					record_rows = _extract_rows_with_selenium(driver)
-					if record_rows:
-						break
-				except Exception:
-					continue
-			if not record_rows:
+				if links:
+					self._sleep(0.6)
+				with self._stage("page_source"):
+					html = driver.page_source
+				with self._stage("extract"):
+					rows = _extract_rows_from_html(html)
+			except Exception as e:
+				if self._profile is not None:
+					self._profile.candidate(url, 0, time.perf_counter() - t0, error=f"{type(e).__name__}: {e}")
+				if _is_session_error(e):
+					# The browser is gone; every later candidate would fail the same way
+					logger.warning("Chrome session lost while loading %s: %s", url, e)
+					self._discard_driver()
+					raise
 				continue
-			for r in record_rows:
-				title, p_year, p_month, p_quarter, notes = _parse_release_text(r["release_raw"])
-				date_iso = _parse_date_iso(r["date_raw"]) or r["date_raw"].strip()
-				time_24h = _normalize_time_to_24h(r["time"]) or r["time"].strip()
-				records.append({
-					"date": date_iso,
-					"time": time_24h,
-					"release_title": title,
-					"period_year": p_year,
-					"period_month": p_month,
-					"period_quarter": p_quarter,
-					"notes": notes,
-					"source_year_page": y_int,
-					"year_page_url": driver.current_url,
-				})
-	finally:
-		driver.quit()
+			if self._profile is not None:
+				self._profile.candidate(url, len(rows), time.perf_counter() - t0)
+			if rows:
+				final_url = driver.current_url
+				self._year_urls[year] = final_url
+				if self.cache is not None:
+					self.cache.put(year, final_url, html)
+				return rows, final_url
+		return [], None
 
-	if output == "json":
-		return records
-	import pandas as pd  # type: ignore
-	df = pd.DataFrame.from_records(records, columns=[
-		"date",
-		"time",
-		"release_title",
-		"period_year",
-		"period_month",
-		"period_quarter",
-		"notes",
-		"source_year_page",
-		"year_page_url",
-	])
-	# Normalize dtypes for period columns
-	for col in ("period_year", "period_month", "period_quarter"):
-		if col in df.columns:
-			df[col] = pd.to_numeric(df[col], errors="coerce").astype("Int64")
-	return df
+	def _scrape_year_with_restart(self, year: int) -> (List[Dict[str, str]], Optional[str]):
+		try:
+			return self._scrape_year(year)
+		except Exception as e:
+			if not _is_session_error(e):
+				raise
+			# Also covers a session lost during link discovery, outside _scrape_year's handler
+			self._discard_driver()
+			logger.warning("Restarting Chrome and retrying %s", year)
+		return self._scrape_year(year)
+
+	def _cached_year(self, year: int) -> (List[Dict[str, str]], Optional[str]):
+		if self.cache is None or not self.cache.is_final(year):
+			return [], None
+		with self._stage("cache_read"):
+			html = self.cache.get(year)
+		if html is None:
+			return [], None
+		with self._stage("extract"):
+			rows = _extract_rows_from_html(html)
+		return rows, self.cache.entry(year)["url"] or None
+
+	def scrape(self, years: Iterable[int], output: str = "dataframe", refresh: bool = False) -> Union["pd.DataFrame", List[Dict[str, Union[str, int, None]]]]:
+		"""Scrape the given years with the warm session.
+
+		Returns pandas DataFrame by default, or list[dict] when output="json".
+		Pass refresh=True to re-fetch closed years even when cached.
+		"""
+		from tqdm.auto import tqdm
+
+		self._profile = ScrapeProfile() if self.profile else None
+		self.failed_years = []
+		records: List[Dict[str, Union[str, int, None]]] = []
+		try:
+			for y in tqdm(years):
+				y_int = int(y)
+				if y_int < 2008:
+					# pre-2008 handled via manual scrapes; skip here
+					continue
+				if self._profile is not None:
+					self._profile.begin_year(y_int)
+				rows, url = ([], None) if refresh else self._cached_year(y_int)
+				source = "cache" if rows else None
+				error = None
+				if not rows:
+					try:
+						rows, url = self._scrape_year_with_restart(y_int)
+					except Exception as e:
+						if not _is_session_error(e):
+							raise
+						self._discard_driver()
+						error = f"{type(e).__name__}: {e}"
+						logger.warning("Skipping %s: Chrome session lost again after a restart: %s", y_int, e)
+						self.failed_years.append(y_int)
+						rows, url = [], None
+					source = "network" if rows else None
+				if self._profile is not None:
+					self._profile.end_year(len(rows), url, source, error=error)
+				if not rows:
+					continue
+				records.extend(_tag_rows(rows, y_int, url))
+			with self._stage("parse"):
+				return _records_to_output(records, output)
+		finally:
+			if self._profile is not None:
+				self.last_profile = self._profile.finish()
+				self._profile = None
+				logger.info("%s", self.last_profile.summary())
+
+
+def scrape_archived_schedule(years: Iterable[int], output: str = "dataframe", profile: bool = False) -> Union["pd.DataFrame", List[Dict[str, Union[str, int, None]]], Tuple[Union["pd.DataFrame", List[Dict[str, Union[str, int, None]]]], ScrapeProfile]]:
+	"""Selenium-based scraper for BLS Archived Release Schedule.
+
+	Returns pandas DataFrame by default, or list[dict] when output="json".
+	With profile=True, returns (result, ScrapeProfile) with per-stage timings.
+	Starts and stops a browser per call; use `ScheduleScraper` for repeated runs.
+	"""
+	with ScheduleScraper(headless=True, profile=profile) as scraper:
+		result = scraper.scrape(years, output=output)
+	return (result, scraper.last_profile) if profile else result
+
+
+def reparse_cached_schedule(cache_dir: Union[str, Path] = "data/schedule_pages", years: Optional[Iterable[int]] = None, output: str = "dataframe") -> Union["pd.DataFrame", List[Dict[str, Union[str, int, None]]]]:
+	"""Rebuild the schedule from cached year pages without any network access.
+
+	Useful after changing the parsing rules: every cached page is re-extracted
+	and re-parsed. `years` defaults to all cached years.
+	"""
+	cache = SchedulePageCache(cache_dir)
+	records: List[Dict[str, Union[str, int, None]]] = []
+	for y in (cache.years() if years is None else years):
+		y_int = int(y)
+		html = cache.get(y_int)
+		if html is None:
+			continue
+		url = cache.entry(y_int)["url"] or None
+		records.extend(_tag_rows(_extract_rows_from_html(html), y_int, url))
+	return _records_to_output(records, output)
+
+
+__all__ = [
+	"scrape_archived_schedule",
+	"ScheduleScraper",
+	"reparse_cached_schedule",
+	"normalize_schedule_rows",
+	"parse_release_titles",
+	"parse_date_column",
+	"parse_time_column",
+]
 
 
-__all__ = ["scrape_archived_schedule"]
+_FOR_SPLIT_RE = re.compile(r"\s+for\s+", re.I)
+_TRAILING_NOTES_RE = re.compile(r"(\s*\([^)]+\)\s*)+$")
+_NOTE_INNER_RE = re.compile(r"\(([^)]+)\)")
+_PERIOD_QUARTER_RE = re.compile(r"(First|Second|Third|Fourth)\s+Quarter\s+(\d{4})", re.I)
+_PERIOD_MONTH_RE = re.compile(r"(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})", re.I)
+_PERIOD_ANNUAL_RE = re.compile(r"(Annual|Biennial)\s+(\d{4})", re.I)
+_PERIOD_YEAR_RE = re.compile(r"\b(\d{4})(?:\s*-\s*(\d{4}))?\b")
+_DATE_ISO_RE = re.compile(r"(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),\s*(\d{4})", re.I)
+_TIME_24H_RE = re.compile(r"^(\d{1,2}):(\d{2})\s*(AM|PM)$", re.I)
 
 
+@lru_cache(maxsize=65536)
 def _parse_release_text(release_text: str) -> (str, Union[int, None], Union[int, None], Union[int, None], Union[str, None]):
 	"""Split release into clean title and period components.
 
@@ -200,14 +628,14 @@ def _parse_release_text(release_text: str) -> (str, Union[int, None], Union[int,
 	  - Fallback: first 4-digit year in the period string
 	"""
 	s = " ".join((release_text or "").split())
-	parts = re.split(r"\s+for\s+", s, maxsplit=1, flags=re.I)
+	parts = _FOR_SPLIT_RE.split(s, maxsplit=1)
 	title_raw = parts[0]
 	# Capture one or more trailing parenthetical notes e.g. '(Monthly) (P)' and strip parentheses
 	notes = None
-	m_multi = re.search(r"(\s*\([^)]+\)\s*)+$", title_raw)
+	m_multi = _TRAILING_NOTES_RE.search(title_raw)
 	if m_multi:
 		raw_notes = m_multi.group(0)
-		inner = re.findall(r"\(([^)]+)\)", raw_notes)
+		inner = _NOTE_INNER_RE.findall(raw_notes)
 		notes = ", ".join([n.strip() for n in inner if n.strip()]) or None
 		title = title_raw[:m_multi.start()].strip()
 	else:
@@ -224,19 +652,19 @@ def _parse_release_text(release_text: str) -> (str, Union[int, None], Union[int,
 				notes = ps_clean.title()
 			return title, period_year, period_month, period_quarter, notes
 		# Quarter
-		m_q = re.search(r"(First|Second|Third|Fourth)\s+Quarter\s+(\d{4})", period_str, re.I)
+		m_q = _PERIOD_QUARTER_RE.search(period_str)
 		if m_q:
 			period_quarter = _QUARTER_WORD_TO_NUM[m_q.group(1).lower()]
 			period_year = int(m_q.group(2))
 			return title, period_year, period_month, period_quarter, notes
 		# Month
-		m_m = re.search(r"(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})", period_str, re.I)
+		m_m = _PERIOD_MONTH_RE.search(period_str)
 		if m_m:
 			period_month = _MONTH_TO_NUM[m_m.group(1).lower()]
 			period_year = int(m_m.group(2))
 			return title, period_year, period_month, period_quarter, notes
 		# Annual/Biennial
-		m_a = re.search(r"(Annual|Biennial)\s+(\d{4})", period_str, re.I)
+		m_a = _PERIOD_ANNUAL_RE.search(period_str)
 		if m_a:
 			period_year = int(m_a.group(2))
 			# If notes not already set from title, use Annual/Biennial from period
@@ -244,7 +672,7 @@ def _parse_release_text(release_text: str) -> (str, Union[int, None], Union[int,
 				notes = m_a.group(1).title()
 			return title, period_year, period_month, period_quarter, notes
 		# General fallback: year or year range like 2021-2023 (pick the rightmost year)
-		m_y = re.search(r"\b(\d{4})(?:\s*-\s*(\d{4}))?\b", period_str)
+		m_y = _PERIOD_YEAR_RE.search(period_str)
 		if m_y:
 			period_year = int(m_y.group(2) or m_y.group(1))
 	return title, period_year, period_month, period_quarter, notes
@@ -255,7 +683,7 @@ def _parse_date_iso(date_text: str) -> Union[str, None]:
 
 	Matches the first '<Month> <day>, <year>' substring to be robust to leading weekday.
 	"""
-	m = re.search(r"(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),\s*(\d{4})", (date_text or ""), re.I)
+	m = _DATE_ISO_RE.search(date_text or "")
 	if not m:
 		return None
 	month = _MONTH_TO_NUM[m.group(1).lower()]
@@ -266,7 +694,7 @@ def _parse_date_iso(date_text: str) -> Union[str, None]:
 
 def _normalize_time_to_24h(time_text: str) -> Union[str, None]:
 	"""Convert 'HH:MM AM/PM' to 24-hour 'HH:MM'. Returns None if pattern doesn't match."""
-	m = re.match(r"^(\d{1,2}):(\d{2})\s*(AM|PM)$", (time_text or "").strip(), re.I)
+	m = _TIME_24H_RE.match((time_text or "").strip())
 	if not m:
 		return None
 	h = int(m.group(1))
@@ -0,0 +1,242 @@
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import requests
+
+from .errors import ApiError, BlsError
+from .public_data import PublicDataClient
+from .rate_limiter import RateLimiter
+from .release_calendar import RELEASE_TZ, ReleaseCalendar, release_datetime
+
+try:
+	from zoneinfo import ZoneInfo
+except ImportError:  # pragma: no cover - Python < 3.9
+	ZoneInfo = None  # type: ignore
+
+
+_LATEST_MAX_SERIES = 50
+
+# Failures that shouldn't kill the watcher: HTTP errors, API rejections (e.g. quota), network errors
+_POLL_ERRORS = (BlsError, requests.RequestException)
+
+logger = logging.getLogger(__name__)
+
+
+class ReleaseEvent:
+	"""A newly published observation detected by `ReleaseWatcher`."""
+
+	__slots__ = ("series_id", "year", "period", "value", "observation", "release", "scheduled_at", "detected_at")
+
+	def __init__(self, series_id: str, observation: Dict[str, Any], release: Optional[Dict[str, Any]], scheduled_at: Optional[datetime], detected_at: datetime):
+		self.series_id = series_id
+		self.year = observation.get("year")
+		self.period = observation.get("period")
+		self.value = observation.get("value")
+		self.observation = observation
+		self.release = release
+		self.scheduled_at = scheduled_at
+		self.detected_at = detected_at
+
+	@property
+	def latency_seconds(self) -> Optional[float]:
+		"""Seconds between the scheduled release time and detection."""
+		if self.scheduled_at is None:
+			return None
+		return (self.detected_at - self.scheduled_at).total_seconds()
+
+	def __repr__(self) -> str:
+		return f"ReleaseEvent({self.series_id!r}, {self.year}-{self.period}, value={self.value!r})"
+
+
+def _eastern_now() -> datetime:
+	if ZoneInfo is None:
+		return datetime.now()
+	return datetime.now(ZoneInfo(RELEASE_TZ)).replace(tzinfo=None)
+
+
+def async_queue_callback(queue: "asyncio.Queue", loop: "asyncio.AbstractEventLoop") -> Callable[[ReleaseEvent], None]:
+	"""Callback that hands events from the watcher thread to an asyncio queue."""
+	return lambda event: loop.call_soon_threadsafe(queue.put_nowait, event)
+
+
+class ReleaseWatcher:
+	"""Poll `get_latest` only around scheduled release times.
+
+	For each series in the watchlist, the next release that publishes its
+	survey is looked up in the `ReleaseCalendar`. The watcher sleeps until that
+	time, then polls `get_latest` in a short burst until a new (year, period)
+	shows up, `max_polls_per_burst` polls were made or `burst_timeout` passes.
+	The first poll is immediate; the gap between later polls starts at
+	`poll_interval` seconds and grows by `poll_backoff` up to `max_poll_interval`.
+	Each new observation is passed to `callback` as a `ReleaseEvent`.
+
+	Quota is spent only during bursts: one query per 50 pending series per
+	poll, so at most `max_polls_per_burst` queries per 50 series per release.
+	HTTP/API errors (a quota rejection, say) are logged, counted in
+	`error_count`, kept in `last_error` and passed to `on_error`; the watcher
+	backs off and keeps running instead of dying.
+	Clock times are US Eastern, matching the calendar.
+	"""
+
+	def __init__(self,
+			client: PublicDataClient,
+			calendar: ReleaseCalendar,
+			series_ids: Sequence[str],
+			callback: Callable[[ReleaseEvent], None],
+			poll_rate_per_second: float = 1.0,
+			burst_timeout: float = 600.0,
+			lead_seconds: float = 0.0,
+			clock: Optional[Callable[[], datetime]] = None,
+			max_polls_per_burst: int = 8,
+			poll_interval: float = 5.0,
+			poll_backoff: float = 2.0,
+			max_poll_interval: float = 60.0,
+			error_backoff: float = 30.0,
+			on_error: Optional[Callable[[Exception], None]] = None,
+	):
+		self.client = client
+		self.calendar = calendar
+		self.series_ids = list(dict.fromkeys(series_ids))
+		self.callback = callback
+		self.poll_limiter = RateLimiter(poll_rate_per_second)
+		self.burst_timeout = burst_timeout
+		self.lead_seconds = lead_seconds
+		self.clock = clock or _eastern_now
+		self.max_polls_per_burst = max_polls_per_burst
+		self.poll_interval = poll_interval
+		self.poll_backoff = poll_backoff
+		self.max_poll_interval = max_poll_interval
+		self.error_backoff = error_backoff
+		self.on_error = on_error
+		self.queries_used = 0
+		self.error_count = 0
+		self.last_error: Optional[Exception] = None
+		self._last_seen: Dict[str, Tuple[str, str]] = {}
+		self._stop = threading.Event()
+		self._thread: Optional[threading.Thread] = None
+
+	def _wait(self, seconds: float) -> bool:
+		"""Sleep up to `seconds`; returns True if the watcher was stopped meanwhile."""
+		return self._stop.wait(max(0.0, seconds))
+
+	def _record_error(self, error: Exception) -> None:
+		self.error_count += 1
+		self.last_error = error
+		logger.warning("get_latest failed (%d errors so far): %s", self.error_count, error)
+		if self.on_error is not None:
+			self.on_error(error)
+
+	def _fetch_latest(self, series_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+		ids = list(series_ids)
+		latest: Dict[str, Dict[str, Any]] = {}
+		for i in range(0, len(ids), _LATEST_MAX_SERIES):
+			self.poll_limiter.acquire()
+			resp = self.client.get_latest(ids[i:i + _LATEST_MAX_SERIES])
+			self.queries_used += 1
+			status = (resp.get("status") or "REQUEST_SUCCEEDED").upper()
+			if status != "REQUEST_SUCCEEDED":
+				# e.g. the daily threshold was hit; the body then has no series
+				raise ApiError(status=status, messages=resp.get("message") or [])
+			for s in resp.get("Results", {}).get("series", []):
+				data = s.get("data") or []
+				if data:
+					latest[s.get("seriesID")] = data[0]
+		return latest
+
+	def prime(self) -> None:
+		"""Record the currently published period for every series (one burst of queries)."""
+		for sid, obs in self._fetch_latest(self.series_ids).items():
+			self._last_seen[sid] = (str(obs.get("year")), str(obs.get("period")))
+
+	def next_wakeup(self, after: Optional[datetime] = None) -> Optional[Tuple[datetime, Dict[str, Any], List[str]]]:
+		"""Return (release time, release row, series it publishes) for the next release, or None."""
+		now = after or self.clock()
+		best: Optional[Tuple[datetime, Dict[str, Any], List[str]]] = None
+		for sid in self.series_ids:
+			rel = self.calendar.next_release_for_series(sid, now)
+			if rel is None:
+				continue
+			when = release_datetime(rel)
+			if best is None or when < best[0]:
+				best = (when, rel, [sid])
+			elif when == best[0]:
+				best[2].append(sid)
+		return best
+
+	def _burst(self, series_ids: List[str], release: Optional[Dict[str, Any]], scheduled_at: Optional[datetime]) -> List[ReleaseEvent]:
+		pending = set(series_ids)
+		events: List[ReleaseEvent] = []
+		deadline = time.monotonic() + self.burst_timeout
+		interval = self.poll_interval
+		polls = 0
+		while pending and polls < self.max_polls_per_burst and not self._stop.is_set() and time.monotonic() < deadline:
+			if polls:
+				if self._wait(min(interval, max(0.0, deadline - time.monotonic()))):
+					break
+				interval = min(interval * self.poll_backoff, self.max_poll_interval)
+			polls += 1
+			try:
+				latest = self._fetch_latest(sorted(pending))
+			except _POLL_ERRORS as e:
+				self._record_error(e)
+				continue
+			for sid, obs in latest.items():
+				key = (str(obs.get("year")), str(obs.get("period")))
+				if sid in pending and self._last_seen.get(sid) != key:
+					self._last_seen[sid] = key
+					pending.discard(sid)
+					event = ReleaseEvent(sid, obs, release, scheduled_at, self.clock())
+					events.append(event)
+					self.callback(event)
+		return events
+
+	def run_once(self) -> List[ReleaseEvent]:
+		"""Sleep until the next relevant release, burst-poll, and return detected events."""
+		if not self._last_seen:
+			self.prime()
+		nxt = self.next_wakeup()
+		if nxt is None:
+			return []
+		when, release, series_ids = nxt
+		wake_at = when - timedelta(seconds=self.lead_seconds)
+		if self._wait((wake_at - self.clock()).total_seconds()):
+			return []
+		events = self._burst(series_ids, release, when)
+		# Make sure the next lookup moves past this release even if the burst ended early
+		remaining = (when - self.clock()).total_seconds()
+		if remaining >= 0:
+			self._wait(remaining + 0.001)
+		return events
+
+	def run(self) -> None:
+		"""Watch until `stop()` is called or the calendar has no more relevant releases."""
+		backoff = self.error_backoff
+		while not self._stop.is_set():
+			if self.next_wakeup() is None:
+				break
+			try:
+				self.run_once()
+			except _POLL_ERRORS as e:
+				# e.g. priming failed; retry later rather than ending the thread
+				self._record_error(e)
+				if self._wait(backoff):
+					break
+				backoff = min(backoff * 2, 3600.0)
+			else:
+				backoff = self.error_backoff
+
+	def start(self) -> threading.Thread:
+		"""Run the watcher in a daemon thread."""
+		self._stop.clear()
+		self._thread = threading.Thread(target=self.run, name="bls-release-watcher", daemon=True)
+		self._thread.start()
+		return self._thread
+
+	def stop(self, timeout: Optional[float] = None) -> None:
+		self._stop.set()
+		if self._thread is not None:
+			self._thread.join(timeout)
+			self._thread = None
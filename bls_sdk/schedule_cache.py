@@ -0,0 +1,70 @@
+import json
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+
+_INDEX_FILE = "index.json"
+
+
+class SchedulePageCache:
+	"""On-disk cache of raw release schedule pages, one HTML file per year.
+
+	Layout under `directory`:
+	- '<year>.html' — page source the rows were extracted from
+	- 'index.json' — {"<year>": {"url": ..., "fetched_at": ..., "file": ...}}
+
+	Closed years never change on bls.gov, so a cached page for a year before
+	the current one is treated as final and served without network access.
+	"""
+
+	def __init__(self, directory: Union[str, Path] = "data/schedule_pages"):
+		self.directory = Path(directory)
+		self._index: Optional[Dict[str, Dict[str, str]]] = None
+
+	@property
+	def index(self) -> Dict[str, Dict[str, str]]:
+		if self._index is None:
+			path = self.directory / _INDEX_FILE
+			if path.exists():
+				self._index = json.loads(path.read_text(encoding="utf-8"))
+			else:
+				self._index = {}
+		return self._index
+
+	def years(self) -> List[int]:
+		return sorted(int(y) for y in self.index)
+
+	def entry(self, year: int) -> Optional[Dict[str, str]]:
+		"""Return {'url', 'fetched_at', 'file'} for a cached year, or None."""
+		return self.index.get(str(int(year)))
+
+	def get(self, year: int, url: Optional[str] = None) -> Optional[str]:
+		"""Return the cached HTML for `year` (optionally only if fetched from `url`)."""
+		meta = self.entry(year)
+		if meta is None or (url is not None and meta.get("url") != url):
+			return None
+		path = self.directory / meta["file"]
+		if not path.exists():
+			return None
+		return path.read_text(encoding="utf-8")
+
+	def put(self, year: int, url: Optional[str], html: str, fetched_at: Optional[datetime] = None) -> None:
+		y = int(year)
+		self.directory.mkdir(parents=True, exist_ok=True)
+		file_name = f"{y}.html"
+		(self.directory / file_name).write_text(html, encoding="utf-8")
+		stamp = (fetched_at or datetime.now(timezone.utc)).isoformat(timespec="seconds")
+		self.index[str(y)] = {"url": url or "", "fetched_at": stamp, "file": file_name}
+		self._write_index()
+
+	def is_final(self, year: int, today: Optional[date] = None) -> bool:
+		"""True when `year` is closed (before the current year) and cached."""
+		current = (today or date.today()).year
+		return int(year) < current and self.entry(year) is not None
+
+	def _write_index(self) -> None:
+		path = self.directory / _INDEX_FILE
+		tmp = path.with_suffix(".json.tmp")
+		tmp.write_text(json.dumps(self.index, indent=1, sort_keys=True), encoding="utf-8")
+		tmp.replace(path)
@@ -0,0 +1,121 @@
+"""Per-stage timing report for the release-schedule scraper.
+
+`ScheduleScraper(profile=True)` records how long each stage takes, overall and
+per year, together with the URLs tried for each year:
+
+- driver_start: launching Chrome
+- archive_discovery: loading the archive page and its year links
+- page_load: `driver.get` of a year page
+- sleep: the fixed pauses between page actions
+- scroll: the scroll scripts
+- list_view: finding and clicking the "List View" link
+- page_source: reading the rendered HTML
+- cache_read: reading a cached year page
+- extract: pulling table rows out of the HTML
+- parse: turning raw rows into the output schema (release titles, dates, times)
+
+	with ScheduleScraper(profile=True) as scraper:
+		df = scraper.scrape(range(2019, 2025))
+	print(scraper.last_profile.summary())
+	scraper.last_profile.to_dict()   # JSON-friendly report
+"""
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+
+class ScrapeProfile:
+	"""Stage timings for one `scrape()` call."""
+
+	def __init__(self):
+		self.stages: Dict[str, float] = {}
+		self.calls: Dict[str, int] = {}
+		self.years: List[Dict[str, Any]] = []
+		self._current: Optional[Dict[str, Any]] = None
+		self._started = time.perf_counter()
+		self.total_seconds: Optional[float] = None
+
+	@contextmanager
+	def stage(self, name: str) -> Iterator[None]:
+		"""Time a block; it counts toward the run totals and the year being scraped, if any."""
+		t0 = time.perf_counter()
+		try:
+			yield
+		finally:
+			elapsed = time.perf_counter() - t0
+			self.stages[name] = self.stages.get(name, 0.0) + elapsed
+			self.calls[name] = self.calls.get(name, 0) + 1
+			if self._current is not None:
+				year_stages = self._current["stages"]
+				year_stages[name] = year_stages.get(name, 0.0) + elapsed
+
+	def sleep(self, seconds: float) -> None:
+		with self.stage("sleep"):
+			time.sleep(seconds)
+
+	def begin_year(self, year: int) -> Dict[str, Any]:
+		record: Dict[str, Any] = {
+			"year": year,
+			"source": None,
+			"url": None,
+			"rows": 0,
+			"error": None,
+			"candidates": [],
+			"stages": {},
+			"seconds": 0.0,
+			"_t0": time.perf_counter(),
+		}
+		self.years.append(record)
+		self._current = record
+		return record
+
+	def candidate(self, url: str, rows: int, seconds: float, error: Optional[str] = None) -> None:
+		"""Record one URL tried for the current year."""
+		if self._current is not None:
+			self._current["candidates"].append({"url": url, "rows": rows, "seconds": seconds, "error": error})
+
+	def end_year(self, rows: int, url: Optional[str], source: Optional[str], error: Optional[str] = None) -> None:
+		record = self._current
+		if record is None:
+			return
+		record["rows"] = rows
+		record["error"] = error
+		record["url"] = url
+		record["source"] = source
+		record["seconds"] = time.perf_counter() - record.pop("_t0")
+		self._current = None
+
+	def finish(self) -> "ScrapeProfile":
+		self.total_seconds = time.perf_counter() - self._started
+		return self
+
+	def to_dict(self) -> Dict[str, Any]:
+		return {
+			"total_seconds": self.total_seconds,
+			"stages": dict(sorted(self.stages.items(), key=lambda kv: -kv[1])),
+			"calls": dict(self.calls),
+			"years": [{k: v for k, v in y.items() if not k.startswith("_")} for y in self.years],
+		}
+
+	def to_frame(self) -> "pd.DataFrame":
+		"""One row per year: rows, source, URL, candidates tried and seconds per stage."""
+		import pandas as pd  # type: ignore
+		rows = []
+		for y in self.years:
+			row = {"year": y["year"], "source": y["source"], "rows": y["rows"], "url": y["url"], "candidates_tried": len(y["candidates"]), "seconds": y["seconds"], "error": y["error"]}
+			row.update(y["stages"])
+			rows.append(row)
+		return pd.DataFrame(rows)
+
+	def summary(self) -> str:
+		total = self.total_seconds if self.total_seconds is not None else time.perf_counter() - self._started
+		lines = [f"schedule scrape: {total:.2f}s, {len(self.years)} year(s)"]
+		for name, seconds in sorted(self.stages.items(), key=lambda kv: -kv[1]):
+			share = seconds / total * 100 if total else 0.0
+			lines.append(f"  {name:<18} {seconds:8.2f}s {share:5.1f}%  ({self.calls[name]} calls)")
+		for y in self.years:
+			tried = len(y["candidates"])
+			lines.append(f"  {y['year']}: {y['rows']} rows from {y['source'] or 'nowhere'} in {y['seconds']:.2f}s ({tried} URL(s) tried)")
+			if y["error"]:
+				lines.append(f"    failed: {y['error']}")
+		return "\n".join(lines)
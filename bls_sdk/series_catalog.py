@@ -5,7 +5,7 @@ from typing import Dict, List, Optional
 import requests
 import re
 
-from .config import USER_AGENT
+from . import config
 from .rate_limiter import RateLimiter
 
 _BASE = "https://download.bls.gov/pub/time.series/"
@@ -18,7 +18,7 @@ def _http_get(url: str, timeout_seconds: int, headers: Dict[str, str]) -> reques
 
 def _fetch_text(url: str, timeout_seconds: int = 30, user_agent: Optional[str] = None) -> str:
 	headers = {
-		"User-Agent": user_agent or USER_AGENT or "bls-sdk/0.1 (series-catalog)",
+		"User-Agent": user_agent or config.USER_AGENT or "bls-sdk/0.1 (series-catalog)",
 		"Accept": "text/plain, text/tab-separated-values, */*; q=0.8",
 		"Accept-Language": "en-US,en;q=0.9",
 		"Referer": "https://www.bls.gov/",
@@ -37,11 +37,19 @@ def _fetch_text(url: str, timeout_seconds: int = 30, user_agent: Optional[str] =
 
 def fetch_series_for_survey(survey: str, rate_limit_per_second: float = 2.0) -> List[Dict[str, str]]:
 	"""Fetch and parse the .series TSV for a given survey (e.g., 'cu')."""
+	return fetch_survey_file(survey, "series", rate_limit_per_second=rate_limit_per_second)
+
+
+def fetch_survey_file(survey: str, name: str, rate_limit_per_second: float = 2.0) -> List[Dict[str, str]]:
+	"""Fetch and parse any '<survey>.<name>' TSV, e.g. the 'cu.area' or 'cu.item' dimension files."""
 	survey = survey.strip("/ ").lower()
-	url = f"{_BASE}{survey}/{survey}.series"
+	url = f"{_BASE}{survey}/{survey}.{name}"
 	# Light client-side rate limit
 	RateLimiter(rate_limit_per_second).acquire()
-	text = _fetch_text(url)
+	return _parse_tsv(_fetch_text(url))
+
+
+def _parse_tsv(text: str) -> List[Dict[str, str]]:
 	# Collapse multiple tabs to a single tab, then parse
 	text = re.sub(r"\t+", "\t", text)
 	reader = csv.DictReader(io.StringIO(text), delimiter='\t')
@@ -0,0 +1,184 @@
+"""Compact, typed containers for Public Data API timeseries results.
+
+API results hold every observation as a dict of strings plus a list of
+footnote dicts. `Series` stores the same data column-wise instead: years and
+values in `array` buffers, period codes/names and footnote texts interned and
+shared, so a large pull costs a fraction of the memory.
+
+For speed, read the columns directly (`values`, `years`, ...) or iterate
+`rows()`, which yields plain tuples. Iterating a `Series` builds an
+`Observation` per row, which is convenient but slower than scanning the dicts.
+
+	series = compact_series(client.get_many_series(ids, startyear="2005", endyear="2024"))
+	for year, period, period_name, value, footnotes in series[0].rows():
+		print(year, period, value)
+
+`Series.to_dict()` rebuilds the API shape when it is needed again.
+"""
+import math
+import sys
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+_NO_FOOTNOTES: Tuple[str, ...] = ()
+
+
+class Observation:
+	"""One observation of a `Series` (value is NaN when BLS published no number)."""
+
+	__slots__ = ("year", "period", "period_name", "value", "footnotes", "latest")
+
+	def __init__(self, year: int, period: str, period_name: Optional[str], value: float, footnotes: Tuple[str, ...] = _NO_FOOTNOTES, latest: bool = False):
+		self.year = year
+		self.period = period
+		self.period_name = period_name
+		self.value = value
+		self.footnotes = footnotes
+		self.latest = latest
+
+	def __eq__(self, other: object) -> bool:
+		if not isinstance(other, Observation):
+			return NotImplemented
+		same_value = self.value == other.value or (math.isnan(self.value) and math.isnan(other.value))
+		return same_value and (self.year, self.period, self.period_name, self.footnotes, self.latest) == \
+			(other.year, other.period, other.period_name, other.footnotes, other.latest)
+
+	def __repr__(self) -> str:
+		return f"Observation({self.year}-{self.period}, value={self.value!r})"
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+	return sys.intern(value) if isinstance(value, str) else value
+
+
+def _footnote_texts(footnotes: Optional[List[Dict[str, Any]]]) -> Tuple[str, ...]:
+	if not footnotes:
+		return _NO_FOOTNOTES
+	texts = tuple(sys.intern(t) for t in (f.get("text") or f.get("code") for f in footnotes if f) if t)
+	return texts or _NO_FOOTNOTES
+
+
+def footnote_text(footnotes: Optional[List[Dict[str, Any]]]) -> Optional[str]:
+	"""An observation's footnote dicts as one '; '-joined string, or None."""
+	if not footnotes or footnotes == [{}]:
+		return None
+	return "; ".join(_footnote_texts(footnotes)) or None
+
+
+class Series:
+	"""Column-wise storage for one series' observations, in API (newest-first) order.
+
+	- `years`: array('h'); `values`: array('d') (NaN for '-' and other non-numbers)
+	- `periods` / `period_names`: lists of interned strings
+	- `footnotes`: per-observation tuples of interned texts, shared between rows
+	Values keep their published precision (`decimals`), so `to_dict()` reproduces
+	the API's value strings.
+	"""
+
+	__slots__ = ("series_id", "catalog", "years", "periods", "period_names", "values", "decimals", "footnotes", "latest_index", "_raw_values")
+
+	def __init__(self, series_id: str, catalog: Optional[Dict[str, Any]] = None):
+		self.series_id = series_id
+		self.catalog = catalog
+		self.years = array("h")
+		self.periods: List[str] = []
+		self.period_names: List[Optional[str]] = []
+		self.values = array("d")
+		self.decimals = array("b")
+		self.footnotes: List[Tuple[str, ...]] = []
+		self.latest_index = -1
+		# Original strings of non-numeric values (e.g. '-'), by position
+		self._raw_values: Dict[int, str] = {}
+
+	@classmethod
+	def from_api(cls, series: Dict[str, Any], _footnote_pool: Optional[Dict[Tuple[str, ...], Tuple[str, ...]]] = None) -> "Series":
+		"""Convert one API series dict ({'seriesID', 'data', ...})."""
+		pool = {} if _footnote_pool is None else _footnote_pool
+		out = cls(series.get("seriesID") or series.get("series_id"), series.get("catalog"))
+		for i, d in enumerate(series.get("data") or []):
+			raw = str(d.get("value", "")).strip()
+			try:
+				value = float(raw)
+				decimals = len(raw) - raw.index(".") - 1 if "." in raw else 0
+			except ValueError:
+				value, decimals = math.nan, -1
+				out._raw_values[i] = raw
+			out.years.append(int(d.get("year")))
+			out.periods.append(_intern(d.get("period")))
+			out.period_names.append(_intern(d.get("periodName")))
+			out.values.append(value)
+			out.decimals.append(decimals)
+			texts = _footnote_texts(d.get("footnotes"))
+			out.footnotes.append(pool.setdefault(texts, texts))
+			if str(d.get("latest", "")).lower() == "true":
+				out.latest_index = i
+		return out
+
+	def __len__(self) -> int:
+		return len(self.values)
+
+	def __getitem__(self, i: int) -> Observation:
+		if i < 0:
+			i += len(self)
+		if not 0 <= i < len(self):
+			raise IndexError("observation index out of range")
+		return Observation(self.years[i], self.periods[i], self.period_names[i], self.values[i], self.footnotes[i], i == self.latest_index)
+
+	def __iter__(self) -> Iterator[Observation]:
+		latest = self.latest_index
+		for i, (y, p, n, v, f) in enumerate(zip(self.years, self.periods, self.period_names, self.values, self.footnotes)):
+			yield Observation(y, p, n, v, f, i == latest)
+
+	def rows(self) -> Iterator[Tuple[int, str, Optional[str], float, Tuple[str, ...]]]:
+		"""(year, period, period_name, value, footnotes) tuples straight from the columns; no per-row objects."""
+		return zip(self.years, self.periods, self.period_names, self.values, self.footnotes)
+
+	def __repr__(self) -> str:
+		return f"Series({self.series_id!r}, {len(self)} observations)"
+
+	@property
+	def latest(self) -> Optional[Observation]:
+		return self[self.latest_index] if self.latest_index >= 0 else None
+
+	def value_string(self, i: int) -> str:
+		"""The value as BLS published it (e.g. '310.326' or '-')."""
+		raw = self._raw_values.get(i)
+		return raw if raw is not None else f"{self.values[i]:.{self.decimals[i]}f}"
+
+	def to_dict(self) -> Dict[str, Any]:
+		"""Rebuild the API series dict (footnotes come back as {'text': ...} only)."""
+		data = []
+		for i in range(len(self)):
+			d: Dict[str, Any] = {
+				"year": str(self.years[i]),
+				"period": self.periods[i],
+				"periodName": self.period_names[i],
+				"value": self.value_string(i),
+				"footnotes": [{"text": t} for t in self.footnotes[i]] or [{}],
+			}
+			if i == self.latest_index:
+				d["latest"] = "true"
+			data.append(d)
+		out: Dict[str, Any] = {"seriesID": self.series_id}
+		if self.catalog is not None:
+			out["catalog"] = self.catalog
+		out["data"] = data
+		return out
+
+	def to_frame(self) -> "pd.DataFrame":
+		import numpy as np  # type: ignore
+		import pandas as pd  # type: ignore
+		return pd.DataFrame({
+			"series_id": self.series_id,
+			"year": np.frombuffer(self.years, dtype=np.int16).copy(),
+			"period": self.periods,
+			"period_name": self.period_names,
+			"value": np.frombuffer(self.values, dtype=np.float64).copy(),
+		})
+
+
+def compact_series(series_list: Iterable[Dict[str, Any]]) -> List[Series]:
+	"""Convert API series dicts (e.g. `get_many_series` output) to `Series`, sharing footnote tuples across all of them."""
+	pool: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+	return [Series.from_api(s, pool) for s in series_list]
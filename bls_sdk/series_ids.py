@@ -0,0 +1,201 @@
+"""Build and validate series IDs locally from the survey catalog files.
+
+`SeriesIdResolver` indexes a survey's dimension files (e.g. 'cu.area',
+'cu.item') and, optionally, its full '<survey>.series' list. IDs can then be
+assembled from dimension codes and whole ID lists checked before any API
+query is spent:
+
+	resolver = SeriesIdResolver.load("cu")
+	sid = resolver.build(seasonal="U", periodicity_code="R", area_code="0000", item_code="SA0")
+	resolver.require_valid(ids)  # raises ValidationError listing the bad IDs
+"""
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import requests
+
+from .errors import ValidationError
+from .series_catalog import fetch_series_for_survey, fetch_survey_file
+
+
+# Components after the two-letter survey prefix, in ID order, named after the
+# '<survey>.series' columns. Surveys not listed here validate against the
+# series list only.
+SERIES_ID_LAYOUTS: Dict[str, Tuple[str, ...]] = {
+	"cu": ("seasonal", "periodicity_code", "area_code", "item_code"),
+	"cw": ("seasonal", "periodicity_code", "area_code", "item_code"),
+	"su": ("seasonal", "periodicity_code", "area_code", "item_code"),
+	"ap": ("seasonal", "area_code", "item_code"),
+	"ce": ("seasonal", "industry_code", "data_type_code"),
+	"sm": ("seasonal", "state_code", "area_code", "industry_code", "data_type_code"),
+	"wp": ("seasonal", "group_code", "item_code"),
+	"pc": ("seasonal", "industry_code", "product_code"),
+}
+
+# Dimension file holding a component's codes, where it isn't the column name minus '_code'
+_DIMENSION_FILES = {
+	("ce", "data_type_code"): "datatype",
+	("sm", "data_type_code"): "data_type",
+}
+
+
+def _dimension_file(survey: str, component: str) -> str:
+	default = component[:-5] if component.endswith("_code") else component
+	return _DIMENSION_FILES.get((survey, component), default)
+
+
+class SeriesIdResolver:
+	"""Precomputed indexes for one survey's series IDs.
+
+	- `series`: set of all known IDs (from '<survey>.series'), the exact check
+	- `dimensions`: component -> set of valid codes (from the dimension files)
+	When the series list is not loaded, IDs are checked structurally: each
+	component must be a known code, with code widths taken from the index.
+	"""
+
+	def __init__(self,
+			survey: str,
+			dimensions: Optional[Mapping[str, Iterable[str]]] = None,
+			series_ids: Optional[Iterable[str]] = None,
+			layout: Optional[Sequence[str]] = None,
+	):
+		self.survey = survey.strip().lower()
+		self.prefix = self.survey.upper()
+		self.layout: Tuple[str, ...] = tuple(layout) if layout is not None else SERIES_ID_LAYOUTS.get(self.survey, ())
+		self.dimensions: Dict[str, FrozenSet[str]] = {k: frozenset(v) for k, v in (dimensions or {}).items()}
+		self.series: Optional[FrozenSet[str]] = frozenset(s.strip().upper() for s in series_ids) if series_ids is not None else None
+		# Distinct code widths per component, longest first, for structural parsing
+		self._widths: Dict[str, Tuple[int, ...]] = {
+			k: tuple(sorted({len(c) for c in v}, reverse=True)) for k, v in self.dimensions.items()
+		}
+
+	@classmethod
+	def load(cls, survey: str, include_series: bool = True, rate_limit_per_second: float = 2.0) -> "SeriesIdResolver":
+		"""Download the survey's dimension files (per its layout) and, optionally, its series list.
+
+		A dimension file that can't be fetched, or has no codes, is skipped; that
+		component is then only checked through the series list.
+		"""
+		survey = survey.strip().lower()
+		layout = SERIES_ID_LAYOUTS.get(survey, ())
+		dimensions: Dict[str, List[str]] = {}
+		for component in layout:
+			try:
+				name = _dimension_file(survey, component)
+				rows = fetch_survey_file(survey, name, rate_limit_per_second=rate_limit_per_second)
+			except requests.RequestException:
+				continue
+			# The code column is named after the file (cu.seasonal has 'seasonal_code'),
+			# which isn't always the column name used in '<survey>.series'
+			column = next((c for c in (f"{name}_code", component) if rows and c in rows[0]), None)
+			codes = [r[column] for r in rows if r.get(column)] if column else []
+			if codes:
+				dimensions[component] = codes
+		series_ids = None
+		if include_series:
+			series_ids = [r["series_id"] for r in fetch_series_for_survey(survey, rate_limit_per_second=rate_limit_per_second) if r.get("series_id")]
+		return cls(survey, dimensions=dimensions, series_ids=series_ids, layout=layout)
+
+	@classmethod
+	def from_series_rows(cls, survey: str, rows: Iterable[Mapping[str, str]]) -> "SeriesIdResolver":
+		"""Build indexes from already fetched '<survey>.series' rows (dimension codes taken from its columns)."""
+		rows = list(rows)
+		layout = SERIES_ID_LAYOUTS.get(survey.strip().lower(), ())
+		dimensions = {c: {r[c] for r in rows if r.get(c)} for c in layout if rows and c in rows[0]}
+		return cls(survey, dimensions=dimensions, series_ids=[r["series_id"] for r in rows if r.get("series_id")], layout=layout)
+
+	def build(self, **codes: str) -> str:
+		"""Assemble a series ID from dimension codes, e.g. build(seasonal="U", periodicity_code="R", ...)."""
+		if not self.layout:
+			raise ValidationError(f"No series ID layout known for survey {self.survey!r}")
+		missing = [c for c in self.layout if c not in codes]
+		if missing:
+			raise ValidationError(f"Missing components for {self.prefix} series ID: {', '.join(missing)}")
+		parts = []
+		for component in self.layout:
+			code = str(codes[component]).strip()
+			known = self.dimensions.get(component)
+			if known is not None and code not in known:
+				raise ValidationError(f"Unknown {component} {code!r} for survey {self.prefix}")
+			parts.append(code)
+		return self.prefix + "".join(parts)
+
+	def _match_components(self, rest: str, i: int = 0) -> Optional[Dict[str, str]]:
+		if i == len(self.layout):
+			return {} if not rest else None
+		component = self.layout[i]
+		known = self.dimensions.get(component)
+		if i == len(self.layout) - 1:
+			return {component: rest} if rest and (known is None or rest in known) else None
+		for width in self._widths.get(component, ()):
+			code = rest[:width]
+			if len(code) == width and code in known:  # type: ignore[operator]
+				tail = self._match_components(rest[width:], i + 1)
+				if tail is not None:
+					tail[component] = code
+					return tail
+		return None
+
+	def parse(self, series_id: str) -> Optional[Dict[str, str]]:
+		"""Split an ID into its dimension codes using the index; None if it doesn't fit."""
+		sid = series_id.strip().upper()
+		if not sid.startswith(self.prefix) or not self.layout:
+			return None
+		if any(c not in self.dimensions for c in self.layout[:-1]):
+			return None
+		return self._match_components(sid[len(self.prefix):])
+
+	def problem(self, series_id: str) -> Optional[str]:
+		"""Reason the ID is invalid, or None when it is valid."""
+		sid = (series_id or "").strip().upper()
+		if not sid.isalnum():
+			return "contains characters other than letters and digits"
+		if not sid.startswith(self.prefix):
+			return f"does not start with survey prefix {self.prefix}"
+		if self.series is not None:
+			return None if sid in self.series else f"not in {self.survey}.series"
+		# Structural check needs codes for every component but the last (whose width is the remainder)
+		structural = self.layout and all(c in self.dimensions for c in self.layout[:-1])
+		if structural and self.parse(sid) is None:
+			return f"does not match {self.prefix} layout {'+'.join(self.layout)}"
+		return None
+
+	def is_valid(self, series_id: str) -> bool:
+		return self.problem(series_id) is None
+
+	def validate(self, series_ids: Iterable[str]) -> Dict[str, str]:
+		"""Return {series_id: reason} for every invalid ID (empty when all are valid)."""
+		invalid: Dict[str, str] = {}
+		for sid in series_ids:
+			reason = self.problem(sid)
+			if reason is not None:
+				invalid[sid] = reason
+		return invalid
+
+	def require_valid(self, series_ids: Iterable[str]) -> None:
+		"""Raise ValidationError naming the invalid IDs; call before `get_many_series`."""
+		_raise_invalid(self.validate(series_ids))
+
+
+def _raise_invalid(invalid: Mapping[str, str]) -> None:
+	if invalid:
+		shown = "; ".join(f"{sid}: {why}" for sid, why in list(invalid.items())[:10])
+		more = f" (+{len(invalid) - 10} more)" if len(invalid) > 10 else ""
+		raise ValidationError(f"{len(invalid)} invalid series ID(s): {shown}{more}")
+
+
+def validate_series_ids(series_ids: Iterable[str], resolvers: Mapping[str, SeriesIdResolver], require: bool = False) -> Dict[str, str]:
+	"""Validate a mixed-survey ID list, routing each ID by its two-letter prefix.
+
+	IDs whose survey has no resolver are reported as unknown. With require=True
+	a ValidationError is raised instead of returning the invalid IDs.
+	"""
+	by_prefix = {k.strip().upper(): v for k, v in resolvers.items()}
+	invalid: Dict[str, str] = {}
+	for sid in series_ids:
+		resolver = by_prefix.get((sid or "").strip()[:2].upper())
+		reason = f"no resolver for survey prefix {(sid or '')[:2]!r}" if resolver is None else resolver.problem(sid)
+		if reason is not None:
+			invalid[sid] = reason
+	if require:
+		_raise_invalid(invalid)
+	return invalid
@@ -0,0 +1,257 @@
+"""Partitioned Parquet / Arrow IPC storage for timeseries results and release schedules.
+
+Timeseries rows are partitioned by survey prefix and year, schedule rows by year
+(hive layout, e.g. `root/survey=CU/year=2024/part-<id>-0.parquet`). Reads go through
+`pyarrow.dataset`, so partition filters and column projection are pushed down and
+only the matching files and columns are touched. With fmt="arrow" the files
+are Arrow IPC and memory-mapped reads are zero-copy.
+
+Requires pyarrow (`pip install bls-sdk[parquet]`).
+"""
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+from .series_data import footnote_text
+
+
+_FORMATS = {"parquet": "parquet", "arrow": "ipc", "ipc": "ipc", "feather": "ipc"}
+
+TIMESERIES_COLUMNS = ["series_id", "survey", "year", "period", "period_name", "value", "footnotes", "latest"]
+
+
+def _pyarrow():
+	try:
+		import pyarrow as pa  # type: ignore
+		import pyarrow.dataset as ds  # type: ignore
+	except ImportError as e:
+		raise ImportError("bls_sdk.storage requires pyarrow: pip install bls-sdk[parquet]") from e
+	return pa, ds
+
+
+def _format(fmt: str) -> str:
+	try:
+		return _FORMATS[fmt.lower()]
+	except KeyError:
+		raise ValueError(f"Unknown storage format: {fmt!r} (use 'parquet' or 'arrow')") from None
+
+
+def _to_float(value: Any) -> Optional[float]:
+	try:
+		return float(value)
+	except (TypeError, ValueError):
+		# BLS uses '-' and footnote codes for missing values
+		return None
+
+
+def timeseries_table(series_list: Iterable[Dict[str, Any]]) -> "pa.Table":
+	"""Flatten API series (as returned by `get_many_series`) into one Arrow table."""
+	pa, _ = _pyarrow()
+	cols: Dict[str, List[Any]] = {c: [] for c in TIMESERIES_COLUMNS}
+	for s in series_list:
+		sid = s.get("seriesID") or s.get("series_id")
+		survey = (sid or "")[:2].upper()
+		for d in s.get("data") or []:
+			cols["series_id"].append(sid)
+			cols["survey"].append(survey)
+			cols["year"].append(int(d.get("year")))
+			cols["period"].append(d.get("period"))
+			cols["period_name"].append(d.get("periodName"))
+			cols["value"].append(_to_float(d.get("value")))
+			cols["footnotes"].append(footnote_text(d.get("footnotes")))
+			cols["latest"].append(str(d.get("latest", "")).lower() == "true")
+	schema = pa.schema([
+		("series_id", pa.string()),
+		("survey", pa.string()),
+		("year", pa.int16()),
+		("period", pa.string()),
+		("period_name", pa.string()),
+		("value", pa.float64()),
+		("footnotes", pa.string()),
+		("latest", pa.bool_()),
+	])
+	return pa.table(cols, schema=schema)
+
+
+_EXTENSIONS = {"parquet": "parquet", "ipc": "arrow"}
+
+_TIMESERIES_KEY = ("series_id", "year", "period")
+
+_SCHEDULE_KEY = ("date", "release_title")
+
+# Fixed types for the schedule columns, so a year whose notes are all None is
+# still a string column and merges with partitions that have text
+_SCHEDULE_TYPES = {
+	"date": "string",
+	"time": "string",
+	"release_title": "string",
+	"period_year": "int64",
+	"period_month": "int64",
+	"period_quarter": "int64",
+	"notes": "string",
+	"source_year_page": "int64",
+	"year_page_url": "string",
+	"year": "int16",
+}
+
+
+def _partition_filter(ds, table: "pa.Table", partition_cols: Sequence[str]):
+	"""Expression matching exactly the partitions `table` has rows for."""
+	expr = None
+	for values in table.select(list(partition_cols)).group_by(list(partition_cols)).aggregate([]).to_pylist():
+		part = None
+		for name in partition_cols:
+			e = ds.field(name) == values[name]
+			part = e if part is None else part & e
+		expr = part if expr is None else expr | part
+	return expr
+
+
+def _merge_existing(table: "pa.Table", root: Union[str, Path], partition_cols: Sequence[str], fmt: str, key: Sequence[str]) -> "pa.Table":
+	"""`table` plus the stored rows of the partitions it touches that it doesn't replace (same `key`)."""
+	pa, ds = _pyarrow()
+	if not Path(root).is_dir() or not any(Path(root).iterdir()):
+		return table
+	existing = _dataset(root, fmt, memory_map=False).to_table(filter=_partition_filter(ds, table, partition_cols))
+	if not existing.num_rows:
+		return table
+	existing = existing.select(table.schema.names).cast(table.schema)
+	kept = existing.join(table.select(list(key)), keys=list(key), join_type="left anti")
+	return pa.concat_tables([kept.select(table.schema.names).cast(table.schema), table])
+
+
+def _write(table: "pa.Table", root: Union[str, Path], partition_cols: Sequence[str], fmt: str, replace_partitions: bool, key: Sequence[str]) -> None:
+	_, ds = _pyarrow()
+	if replace_partitions:
+		# Rewrite each touched partition as its old rows merged with the new ones
+		table = _merge_existing(table, root, partition_cols, fmt, key)
+	ds.write_dataset(
+		table,
+		str(root),
+		format=_format(fmt),
+		partitioning=list(partition_cols),
+		partitioning_flavor="hive",
+		# A unique name per write, so appending never overwrites an earlier part-0
+		basename_template=f"part-{uuid.uuid4().hex}-{{i}}.{_EXTENSIONS[_format(fmt)]}",
+		existing_data_behavior="delete_matching" if replace_partitions else "overwrite_or_ignore",
+	)
+
+
+def write_timeseries(series_list: Iterable[Dict[str, Any]], root: Union[str, Path], fmt: str = "parquet", replace_partitions: bool = True) -> int:
+	"""Write API series into `root`, partitioned by survey and year. Returns rows written.
+
+	With replace_partitions (the default) the new rows are merged into what is
+	stored: an observation (series_id, year, period) already on disk is replaced,
+	other series in the same survey-year are kept. replace_partitions=False
+	only appends files.
+	"""
+	table = timeseries_table(series_list)
+	if table.num_rows:
+		_write(table, root, ["survey", "year"], fmt, replace_partitions, _TIMESERIES_KEY)
+	return table.num_rows
+
+
+def _schedule_schema(df: "pd.DataFrame") -> "pa.Schema":
+	"""Known schedule columns get their fixed type; others are inferred (all-None ones as strings)."""
+	pa, _ = _pyarrow()
+	fields = []
+	for name in df.columns:
+		if name in _SCHEDULE_TYPES:
+			dtype = getattr(pa, _SCHEDULE_TYPES[name])()
+		else:
+			dtype = pa.Array.from_pandas(df[name]).type
+			if pa.types.is_null(dtype):
+				dtype = pa.string()
+		fields.append((name, dtype))
+	return pa.schema(fields)
+
+
+def write_schedule(schedule: "pd.DataFrame", root: Union[str, Path], fmt: str = "parquet", replace_partitions: bool = True) -> int:
+	"""Write a release-schedule frame into `root`, partitioned by release year.
+
+	Rows are merged like `write_timeseries`, keyed on (date, release_title).
+	Rows whose date has no year (e.g. 'TBD') are skipped. Returns rows written.
+	"""
+	import pandas as pd  # type: ignore
+
+	pa, _ = _pyarrow()
+	if schedule.empty:
+		return 0
+	df = schedule.copy()
+	year = pd.to_numeric(df["date"].astype(str).str[:4], errors="coerce")
+	df = df[year.notna()]
+	if df.empty:
+		return 0
+	df["year"] = year[year.notna()].astype("int16")
+	table = pa.Table.from_pandas(df, schema=_schedule_schema(df), preserve_index=False)
+	_write(table, root, ["year"], fmt, replace_partitions, _SCHEDULE_KEY)
+	return table.num_rows
+
+
+def _dataset(root: Union[str, Path], fmt: str, memory_map: bool):
+	_, ds = _pyarrow()
+	from pyarrow import fs as pafs  # type: ignore
+
+	fs = pafs.LocalFileSystem(use_mmap=memory_map)
+	return ds.dataset(str(root), format=_format(fmt), partitioning="hive", filesystem=fs)
+
+
+def _in_filter(ds, name: str, values: Any):
+	if isinstance(values, (str, int)):
+		values = [values]
+	return ds.field(name).isin(list(values))
+
+
+def _read(root, fmt, memory_map, columns, expr, output):
+	table = _dataset(root, fmt, memory_map).to_table(columns=columns, filter=expr)
+	return table if output == "arrow" else table.to_pandas()
+
+
+def read_timeseries(
+		root: Union[str, Path],
+		survey: Union[str, Sequence[str], None] = None,
+		year: Union[int, Sequence[int], None] = None,
+		series_ids: Optional[Sequence[str]] = None,
+		columns: Optional[Sequence[str]] = None,
+		filter: Any = None,
+		fmt: str = "parquet",
+		memory_map: bool = True,
+		output: str = "dataframe",
+) -> Union["pd.DataFrame", "pa.Table"]:
+	"""Read a slice of a timeseries dataset.
+
+	survey/year select partitions (only matching files are opened); series_ids and
+	an optional `pyarrow.dataset` expression in `filter` are pushed down to the
+	scan; `columns` projects. output='arrow' returns a pyarrow Table.
+	"""
+	_, ds = _pyarrow()
+	exprs = []
+	if survey is not None:
+		exprs.append(_in_filter(ds, "survey", [survey.upper()] if isinstance(survey, str) else [s.upper() for s in survey]))
+	if year is not None:
+		exprs.append(_in_filter(ds, "year", year))
+	if series_ids is not None:
+		exprs.append(_in_filter(ds, "series_id", series_ids))
+	if filter is not None:
+		exprs.append(filter)
+	expr = None
+	for e in exprs:
+		expr = e if expr is None else expr & e
+	return _read(root, fmt, memory_map, list(columns) if columns else None, expr, output)
+
+
+def read_schedule(
+		root: Union[str, Path],
+		year: Union[int, Sequence[int], None] = None,
+		columns: Optional[Sequence[str]] = None,
+		filter: Any = None,
+		fmt: str = "parquet",
+		memory_map: bool = True,
+		output: str = "dataframe",
+) -> Union["pd.DataFrame", "pa.Table"]:
+	"""Read release-schedule rows, optionally limited to some years and columns."""
+	_, ds = _pyarrow()
+	expr = _in_filter(ds, "year", year) if year is not None else None
+	if filter is not None:
+		expr = filter if expr is None else expr & filter
+	return _read(root, fmt, memory_map, list(columns) if columns else None, expr, output)
@@ -0,0 +1,228 @@
+"""Vintage (revision) store for timeseries pulls, backed by SQLite.
+
+Each `record()` call is one vintage. Series whose payload hash matches the
+previous vintage are skipped outright; for changed series only the
+observations that are new, revised or dropped are written, stamped with the
+vintage time. `as_of(D)` reconstructs the data as it stood at D:
+
+	store = VintageStore("data/vintages.sqlite")
+	store.record(client.get_many_series(ids, startyear="2020", endyear="2024"))
+	...
+	as_published = store.as_of("2024-03-01", series_ids=ids)
+
+Vintage times are naive UTC ISO strings with microseconds
+('YYYY-MM-DDTHH:MM:SS.ffffff'); a plain date in a query means the end of that
+day. A payload only speaks for the years it contains: an observation missing
+from a year the payload covers is recorded as dropped, while years outside
+the requested window keep their history.
+"""
+import hashlib
+import sqlite3
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .series_data import footnote_text
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS vintages (
+	vintage TEXT PRIMARY KEY,
+	series_seen INTEGER NOT NULL,
+	series_changed INTEGER NOT NULL,
+	observations_written INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS series_state (
+	series_id TEXT PRIMARY KEY,
+	hash TEXT NOT NULL,
+	vintage TEXT NOT NULL
+);
+-- value/footnotes are NULL when an observation was dropped in that vintage
+CREATE TABLE IF NOT EXISTS observations (
+	series_id TEXT NOT NULL,
+	year INTEGER NOT NULL,
+	period TEXT NOT NULL,
+	vintage TEXT NOT NULL,
+	period_name TEXT,
+	value TEXT,
+	footnotes TEXT,
+	PRIMARY KEY (series_id, year, period, vintage)
+) WITHOUT ROWID;
+"""
+
+# Series IDs per query, well under SQLite's bound-parameter limit
+_MAX_SQL_PARAMS = 500
+
+When = Union[str, date, datetime, None]
+
+# (year, period) -> (period_name, value, footnotes)
+_Observations = Dict[Tuple[int, str], Tuple[Optional[str], str, Optional[str]]]
+
+
+def _vintage_str(when: When, end_of_day: bool = False) -> str:
+	if when is None:
+		when = datetime.now(timezone.utc)
+	if isinstance(when, str):
+		when = datetime.fromisoformat(when) if "T" in when or " " in when else date.fromisoformat(when)
+	if isinstance(when, datetime):
+		if when.tzinfo is not None:
+			when = when.astimezone(timezone.utc).replace(tzinfo=None)
+		return when.isoformat(timespec="microseconds")
+	return f"{when.isoformat()}T{'23:59:59.999999' if end_of_day else '00:00:00.000000'}"
+
+
+def _is_compact(series: Any) -> bool:
+	return hasattr(series, "value_string")
+
+
+def _series_id(series: Any) -> str:
+	return series.series_id if _is_compact(series) else (series.get("seriesID") or series.get("series_id"))
+
+
+def _series_observations(series: Any) -> _Observations:
+	"""Observations of an API series dict or a compact `series_data.Series`."""
+	if _is_compact(series):
+		return {
+			(series.years[i], series.periods[i]): (series.period_names[i], series.value_string(i), "; ".join(series.footnotes[i]) or None)
+			for i in range(len(series))
+		}
+	return {
+		(int(d.get("year")), d.get("period")): (d.get("periodName"), str(d.get("value", "")).strip(), footnote_text(d.get("footnotes")))
+		for d in series.get("data") or []
+	}
+
+
+def _payload_hash(series: Any) -> str:
+	# A single pass over the payload in API order; unchanged series never get diffed
+	if _is_compact(series):
+		lines = (
+			f"{series.years[i]}|{series.periods[i]}|{series.value_string(i)}|{'; '.join(series.footnotes[i])}"
+			for i in range(len(series))
+		)
+	else:
+		lines = (
+			f"{d.get('year')}|{d.get('period')}|{str(d.get('value', '')).strip()}|{footnote_text(d.get('footnotes')) or ''}"
+			for d in series.get("data") or []
+		)
+	return hashlib.blake2b("\n".join(lines).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _in_clause(column: str, values: Sequence[Any]) -> str:
+	return f"{column} IN ({','.join('?' * len(values))})"
+
+
+class VintageStore:
+	"""Append-only history of series payloads, keyed by vintage time."""
+
+	def __init__(self, path: Union[str, Path]):
+		self.path = Path(path)
+		if str(path) != ":memory:":
+			self.path.parent.mkdir(parents=True, exist_ok=True)
+		self._conn = sqlite3.connect(str(path))
+		# One transaction per record(); WAL keeps readers unblocked while it commits
+		self._conn.execute("PRAGMA journal_mode=WAL")
+		self._conn.execute("PRAGMA synchronous=NORMAL")
+		self._conn.executescript(_SCHEMA)
+
+	def close(self) -> None:
+		self._conn.close()
+
+	def __enter__(self) -> "VintageStore":
+		return self
+
+	def __exit__(self, *exc: Any) -> None:
+		self.close()
+
+	def vintages(self) -> List[str]:
+		return [r[0] for r in self._conn.execute("SELECT vintage FROM vintages ORDER BY vintage")]
+
+	def _current(self, series_id: str) -> _Observations:
+		rows = self._conn.execute(
+			"SELECT year, period, period_name, value, footnotes, MAX(vintage) FROM observations"
+			" WHERE series_id = ? GROUP BY year, period",
+			(series_id,),
+		)
+		return {(y, p): (n, v, f) for y, p, n, v, f, _ in rows if v is not None}
+
+	def record(self, series_list: Iterable[Any], vintage: When = None) -> Dict[str, int]:
+		"""Store one vintage of `get_many_series` output (dicts or compact `Series`).
+
+		Returns counts: series_seen, series_changed, observations_written.
+		Vintages must be recorded in time order; without `vintage` the current
+		time is used, moved just past the latest vintage if the clock hasn't.
+		"""
+		stamp = _vintage_str(vintage)
+		latest = self._conn.execute("SELECT MAX(vintage) FROM vintages").fetchone()[0]
+		if vintage is None and latest is not None and stamp <= latest:
+			stamp = _vintage_str(datetime.fromisoformat(latest) + timedelta(microseconds=1))
+		if latest is not None and stamp <= latest:
+			raise ValueError(f"Vintage {stamp} is not after the latest recorded vintage {latest}")
+		hashes = dict(self._conn.execute("SELECT series_id, hash FROM series_state"))
+		seen = changed = written = 0
+		with self._conn:
+			for series in series_list:
+				sid = _series_id(series)
+				seen += 1
+				digest = _payload_hash(series)
+				if hashes.get(sid) == digest:
+					continue
+				changed += 1
+				obs = _series_observations(series)
+				before = self._current(sid) if sid in hashes else {}
+				rows = [
+					(sid, y, p, stamp, n, v, f)
+					for (y, p), (n, v, f) in obs.items()
+					if before.get((y, p), (None, None, None))[1:] != (v, f)
+				]
+				# Only years in this payload can have dropped observations; a narrower
+				# startyear/endyear window must not tombstone older history
+				years = {y for y, _ in obs}
+				rows.extend((sid, y, p, stamp, n, None, None) for (y, p), (n, _, _) in before.items() if y in years and (y, p) not in obs)
+				self._conn.executemany("INSERT INTO observations VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+				self._conn.execute("INSERT OR REPLACE INTO series_state VALUES (?, ?, ?)", (sid, digest, stamp))
+				hashes[sid] = digest
+				written += len(rows)
+			self._conn.execute("INSERT INTO vintages VALUES (?, ?, ?, ?)", (stamp, seen, changed, written))
+		return {"series_seen": seen, "series_changed": changed, "observations_written": written}
+
+	def as_of(self, when: When, series_ids: Optional[Sequence[str]] = None, output: str = "series") -> Union[List[Dict[str, Any]], "pd.DataFrame"]:
+		"""Data as it stood at `when`: API-shaped series (newest first) or, with output='dataframe', a long frame."""
+		stamp = _vintage_str(when, end_of_day=True)
+		if series_ids is None:
+			rows = self._latest_rows("vintage <= ?", [stamp])
+		else:
+			ids = list(dict.fromkeys(series_ids))
+			rows = []
+			for i in range(0, len(ids), _MAX_SQL_PARAMS):
+				chunk = ids[i:i + _MAX_SQL_PARAMS]
+				rows.extend(self._latest_rows("vintage <= ? AND " + _in_clause("series_id", chunk), [stamp, *chunk]))
+		rows = [r for r in rows if r[4] is not None]
+		if output == "dataframe":
+			import pandas as pd  # type: ignore
+			return pd.DataFrame(rows, columns=["series_id", "year", "period", "period_name", "value", "footnotes", "vintage"])
+		out: Dict[str, Dict[str, Any]] = {}
+		for sid, y, p, n, v, f, _ in rows:
+			series = out.setdefault(sid, {"seriesID": sid, "data": []})
+			series["data"].append({"year": str(y), "period": p, "periodName": n, "value": v, "footnotes": [{"text": f}] if f else [{}]})
+		return list(out.values())
+
+	def _latest_rows(self, where: str, params: List[Any]) -> List[Tuple[Any, ...]]:
+		# SQLite takes the bare columns from the row holding MAX(vintage)
+		return self._conn.execute(
+			"SELECT series_id, year, period, period_name, value, footnotes, MAX(vintage) FROM observations"
+			f" WHERE {where} GROUP BY series_id, year, period ORDER BY series_id, year DESC, period DESC",
+			params,
+		).fetchall()
+
+	def revisions(self, series_id: str, year: Optional[int] = None, period: Optional[str] = None) -> List[Dict[str, Any]]:
+		"""Every stored version of a series' observations (value None = dropped), oldest vintage first."""
+		where, params = "series_id = ?", [series_id]
+		if year is not None:
+			where, params = where + " AND year = ?", params + [year]
+		if period is not None:
+			where, params = where + " AND period = ?", params + [period]
+		rows = self._conn.execute(
+			f"SELECT year, period, vintage, value, footnotes FROM observations WHERE {where} ORDER BY year, period, vintage",
+			params,
+		)
+		return [{"year": y, "period": p, "vintage": vt, "value": v, "footnotes": f} for y, p, vt, v, f in rows]
@@ -0,0 +1,55 @@
+from bls_sdk.calculations import apply_calculations, compute_annual_averages, compute_changes, observations_frame
+
+
+def _monthly(sid, values_by_year):
+	# Newest first, like the API
+	data = []
+	for year in sorted(values_by_year, reverse=True):
+		for m in range(len(values_by_year[year]), 0, -1):
+			data.append({"year": str(year), "period": f"M{m:02d}", "periodName": "", "value": values_by_year[year][m - 1], "footnotes": [{}]})
+	return {"seriesID": sid, "data": data}
+
+
+def test_changes_match_api_semantics():
+	values = {
+		2022: [f"{100 + m:.3f}" for m in range(12)],
+		2023: [f"{112 + m * 0.5:.3f}" for m in range(3)],
+	}
+	out = apply_calculations([_monthly("CUUR0000SA0", values)])
+	mar_2023 = out[0]["data"][0]
+	assert mar_2023["period"] == "M03"
+	# 113.000 vs Feb 112.500, Dec 111.000, Sep 108.000, Mar 2022 102.000
+	assert mar_2023["calculations"]["net_changes"] == {"1": "0.500", "3": "2.000", "6": "5.000", "12": "11.000"}
+	assert mar_2023["calculations"]["pct_changes"] == {"1": "0.4", "3": "1.8", "6": "4.6", "12": "10.8"}
+	jan_2022 = out[0]["data"][-1]
+	assert jan_2022["calculations"] == {"net_changes": {}, "pct_changes": {}}
+
+
+def test_annual_averages_only_for_complete_years():
+	values = {
+		2022: [f"{100 + m:.1f}" for m in range(12)],
+		2023: ["200.0"] * 11,
+	}
+	out = apply_calculations([_monthly("S1", values)], calculations=False, annualaverage=True)
+	periods = [(d["year"], d["period"]) for d in out[0]["data"]]
+	assert ("2022", "M13") in periods and ("2023", "M13") not in periods
+	avg = next(d for d in out[0]["data"] if d["period"] == "M13")
+	assert avg["value"] == "105.5" and avg["periodName"] == "Annual"
+	# Inserted ahead of the year's months, matching the API's newest-first order
+	assert periods.index(("2022", "M13")) == periods.index(("2022", "M12")) - 1
+	assert "calculations" not in out[0]["data"][0]
+
+
+def test_quarterly_and_missing_values_vectorized():
+	series = [
+		{"seriesID": "Q1", "data": [
+			{"year": "2023", "period": "Q02", "value": "110"},
+			{"year": "2023", "period": "Q01", "value": "100"},
+			{"year": "2022", "period": "Q02", "value": "-"},
+		]},
+	]
+	frame = compute_changes(observations_frame(series))
+	q2 = frame.iloc[0]
+	assert q2["net_change_3"] == 10 and round(q2["pct_change_3"], 6) == 10
+	assert frame["net_change_12"].isna().all()
+	assert compute_annual_averages(frame).empty
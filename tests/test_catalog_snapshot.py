@@ -0,0 +1,65 @@
+import subprocess
+import sys
+
+import pytest
+
+import bls_sdk.catalog_snapshot as catalog_snapshot
+from bls_sdk.catalog_snapshot import CatalogSnapshot, compile_catalog, write_catalog_snapshot
+
+
+ROWS = [
+	{"series_id": "CUUR0000SA0", "area_code": "0000", "item_code": "SA0", "series_title": "All items in U.S. city average"},
+	{"series_id": "CUSR0000SAF1", "area_code": "0000", "item_code": "SAF1", "series_title": "Food — seasonally adjusted"},
+	{"series_id": "CUUR0100SA0", "area_code": "0100", "item_code": "SA0", "series_title": ""},
+	{"series_id": "CUUR0000SA0", "area_code": "dup", "item_code": "dup", "series_title": "duplicate"},
+]
+
+
+def test_round_trip_and_lookup(tmp_path):
+	write_catalog_snapshot(ROWS, tmp_path / "cu", survey="cu")
+	with CatalogSnapshot(tmp_path / "cu") as snap:
+		assert len(snap) == 3 and snap.survey == "cu"
+		assert list(snap) == ["CUSR0000SAF1", "CUUR0000SA0", "CUUR0100SA0"]
+		assert snap.get("cuur0000sa0") == ROWS[0]
+		assert snap["CUSR0000SAF1"]["series_title"] == "Food — seasonally adjusted"
+		assert snap.get("CUUR0100SA0")["series_title"] == ""
+		assert "CUUR0000SA0X" not in snap and snap.get("CUUR0000SA") is None
+		with pytest.raises(KeyError):
+			snap["NOPE"]
+		assert snap.find(["CUUR0100SA0", "NOPE", "CUUR0000SA0X", "CUSR0000SAF1"]).tolist() == [2, -1, -1, 0]
+		assert snap.column("item_code") == ["SAF1", "SA0", "SA0"]
+		assert snap.column("series_id", rows=[2]) == ["CUUR0100SA0"]
+
+
+def test_compile_catalog_and_open_in_other_process(tmp_path, monkeypatch):
+	monkeypatch.setattr(catalog_snapshot, "fetch_series_for_survey", lambda survey, rate_limit_per_second=2.0: ROWS)
+	path = compile_catalog("cu", tmp_path / "cu")
+	code = f"from bls_sdk.catalog_snapshot import CatalogSnapshot; print(CatalogSnapshot({str(path)!r}).get('CUUR0000SA0')['item_code'])"
+	out = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True)
+	assert out.stdout.strip() == "SA0"
+
+
+def test_empty_catalog(tmp_path):
+	write_catalog_snapshot([], tmp_path / "empty")
+	snap = CatalogSnapshot(tmp_path / "empty")
+	assert len(snap) == 0 and snap.get("X") is None and snap.find(["X"]).tolist() == [-1]
+
+
+def test_refresh_leaves_open_snapshot_intact(tmp_path):
+	write_catalog_snapshot(ROWS, tmp_path / "cu", survey="cu")
+	with CatalogSnapshot(tmp_path / "cu") as old:
+		refreshed = [dict(r, series_title=r["series_title"] + " (revised)") for r in ROWS[:2]]
+		write_catalog_snapshot(refreshed, tmp_path / "cu", survey="cu")
+		# The mapped files are the old ones, untouched by the rewrite
+		assert len(old) == 3 and old.get("CUUR0000SA0") == ROWS[0]
+	with CatalogSnapshot(tmp_path / "cu") as new:
+		assert len(new) == 2 and new["CUUR0000SA0"]["series_title"].endswith("(revised)")
+	assert [p.name for p in tmp_path.iterdir()] == ["cu"]
+
+
+def test_refuses_to_replace_a_foreign_directory(tmp_path):
+	(tmp_path / "data").mkdir()
+	(tmp_path / "data" / "notes.txt").write_text("keep me", encoding="utf-8")
+	with pytest.raises(ValueError):
+		write_catalog_snapshot(ROWS, tmp_path / "data")
+	assert (tmp_path / "data" / "notes.txt").exists()
@@ -0,0 +1,150 @@
+import json
+
+import pytest
+
+import bls_sdk.public_data as public_data
+import bls_sdk.series_catalog as series_catalog
+from bls_sdk import cli
+
+
+def _series(sid, years):
+	data = [{"year": str(y), "period": f"M{m:02d}", "periodName": "", "value": f"{y % 100}.{m}", "footnotes": [{}]} for y in sorted(years, reverse=True) for m in (2, 1)]
+	return {"seriesID": sid, "data": data}
+
+
+@pytest.fixture
+def fake_api(monkeypatch):
+	calls = []
+
+	def get_many_series(self, series_ids, **options):
+		calls.append((list(series_ids), options["startyear"], options["endyear"]))
+		return [_series(sid, range(int(options["startyear"]), int(options["endyear"]) + 1)) for sid in series_ids]
+
+	monkeypatch.setattr(public_data.PublicDataClient, "get_many_series", get_many_series)
+	return calls
+
+
+def test_parse_helpers(tmp_path):
+	assert cli._parse_years("2008-2010, 2015") == [2008, 2009, 2010, 2015]
+	ids_file = tmp_path / "ids.txt"
+	ids_file.write_text("# CPI\ncuur0000sa0, CUUR0000SA0L1E\n\nCES0000000001  # payrolls\n", encoding="utf-8")
+	assert cli._read_series_ids([str(ids_file)], ["LNS14000000"]) == ["LNS14000000", "CUUR0000SA0", "CUUR0000SA0L1E", "CES0000000001"]
+	assert cli._year_windows(2000, 2024, 10) == [(2000, 2009), (2010, 2019), (2020, 2024)]
+
+
+def test_sync_splits_queries_and_writes_jsonl(tmp_path, fake_api, capsys):
+	ids = [f"CUUR{i:04d}SA0" for i in range(60)]
+	out = tmp_path / "out.jsonl"
+	code = cli.main(["sync", "--series", *ids, "--start-year", "2001", "--end-year", "2024", "--years-per-query", "20",
+		"--format", "jsonl", "-o", str(out), "--workers", "3", "--rate-limit", "100", "-q"])
+	assert code == 0
+	# 2 series chunks x 2 year windows
+	assert sorted((len(c), lo, hi) for c, lo, hi in fake_api) == [(10, "2001", "2020"), (10, "2021", "2024"), (50, "2001", "2020"), (50, "2021", "2024")]
+	lines = [json.loads(l) for l in out.read_text(encoding="utf-8").splitlines()]
+	assert len(lines) == 60
+	data = lines[0]["data"]
+	assert len(data) == 48 and (data[0]["year"], data[0]["period"]) == ("2024", "M02") and data[-1]["year"] == "2001"
+	err = capsys.readouterr().err
+	assert "queries=4" in err and "daily query quota" in err
+
+
+def test_sync_csv_and_cache(tmp_path, fake_api, capsys):
+	args = ["sync", "--series", "CUUR0000SA0", "--start-year", "2023", "--end-year", "2024", "--format", "csv",
+		"-o", str(tmp_path / "out.csv"), "--cache-dir", str(tmp_path / "cache"), "-q"]
+	assert cli.main(args) == 0
+	assert cli.main(args) == 0
+	assert len(fake_api) == 1
+	assert "cached=1" in capsys.readouterr().err
+	lines = (tmp_path / "out.csv").read_text(encoding="utf-8").splitlines()
+	assert lines[0] == "series_id,survey,year,period,period_name,value,footnotes,latest"
+	assert len(lines) == 5
+
+
+def test_catalog_writes_snapshots_and_skips_existing(tmp_path, monkeypatch):
+	fetched = []
+
+	def fake_fetch(survey, rate_limit_per_second=2.0):
+		fetched.append(survey)
+		return [{"series_id": f"{survey.upper()}X", "series_title": "t"}]
+
+	monkeypatch.setattr(series_catalog, "fetch_series_for_survey", fake_fetch)
+	assert cli.main(["catalog", "cu", "CE", "-o", str(tmp_path), "-q"]) == 0
+	assert sorted(fetched) == ["ce", "cu"]
+	from bls_sdk.catalog_snapshot import CatalogSnapshot
+	assert CatalogSnapshot(tmp_path / "cu").get("CUX") == {"series_id": "CUX", "series_title": "t"}
+	assert cli.main(["catalog", "cu", "-o", str(tmp_path), "-q"]) == 0
+	assert len(fetched) == 2
+	assert cli.main(["catalog", "cu", "-o", str(tmp_path), "--format", "jsonl", "-q"]) == 0
+	assert json.loads((tmp_path / "cu.jsonl").read_text(encoding="utf-8"))["series_id"] == "CUX"
+
+
+def test_parquet_syncs_merge_and_failures_keep_stored_data(tmp_path, monkeypatch, fake_api):
+	pytest.importorskip("pyarrow")
+	from bls_sdk import storage
+
+	out = tmp_path / "ts"
+	base = ["sync", "--start-year", "2023", "--end-year", "2024", "--format", "parquet", "-o", str(out), "-q"]
+	assert cli.main(base + ["--series", "CUUR0000SA0"]) == 0
+	assert cli.main(base + ["--series", "CUUR0000SA0E"]) == 0
+	assert set(storage.read_timeseries(out)["series_id"]) == {"CUUR0000SA0", "CUUR0000SA0E"}
+
+	def failing(self, series_ids, **options):
+		raise ConnectionError("connection reset")
+
+	monkeypatch.setattr(public_data.PublicDataClient, "get_many_series", failing)
+	assert cli.main(base + ["--series", "CUUR0000SA0"]) == 1
+	assert len(storage.read_timeseries(out, series_ids=["CUUR0000SA0"])) == 4
+
+
+def test_failed_sync_leaves_existing_file(tmp_path, monkeypatch, fake_api):
+	out = tmp_path / "out.jsonl"
+	args = ["sync", "--series", "CUUR0000SA0", "--start-year", "2023", "--end-year", "2024", "--format", "jsonl", "-o", str(out), "-q"]
+	assert cli.main(args) == 0
+	before = out.read_text(encoding="utf-8")
+
+	def failing(self, series_ids, **options):
+		raise RuntimeError("quota exceeded")
+
+	monkeypatch.setattr(public_data.PublicDataClient, "get_many_series", failing)
+	assert cli.main(args) == 1
+	assert out.read_text(encoding="utf-8") == before
+
+
+def test_sync_validate_survives_unknown_prefix(tmp_path, monkeypatch, fake_api, capsys):
+	import requests
+
+	import bls_sdk.series_ids as series_ids
+
+	def fetch_series(survey, rate_limit_per_second=2.0):
+		if survey != "cu":
+			raise requests.HTTPError("404 Client Error: Not Found")
+		return [{"series_id": "CUUR0000SA0"}]
+
+	def fetch_file(survey, name, rate_limit_per_second=2.0):
+		raise requests.HTTPError("404 Client Error: Not Found")
+
+	monkeypatch.setattr(series_ids, "fetch_series_for_survey", fetch_series)
+	monkeypatch.setattr(series_ids, "fetch_survey_file", fetch_file)
+	out = tmp_path / "out.jsonl"
+	code = cli.main(["sync", "--series", "CUUR0000SA0", "XX123", "--validate", "--start-year", "2024", "--end-year", "2024",
+		"--format", "jsonl", "-o", str(out), "-q"])
+	assert code == 0
+	assert [c for c, _, _ in fake_api] == [["CUUR0000SA0"]]
+	assert "skipping XX123: can't verify" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("key, windows", [(None, [("2005", "2014"), ("2015", "2024")]), ("secret", [("2005", "2024")])])
+def test_default_year_span_follows_api_key(tmp_path, monkeypatch, fake_api, key, windows):
+	from bls_sdk import config
+
+	config._resolve()
+	monkeypatch.setitem(config._SETTINGS, "BLS_API_KEY", key)
+	code = cli.main(["sync", "--series", "CUUR0000SA0", "--start-year", "2005", "--end-year", "2024",
+		"--format", "jsonl", "-o", str(tmp_path / "out.jsonl"), "-q"])
+	assert code == 0
+	assert sorted((lo, hi) for _, lo, hi in fake_api) == windows
+
+
+def test_schedule_has_no_request_options():
+	with pytest.raises(SystemExit):
+		cli.build_parser().parse_args(["schedule", "--years", "2024", "-o", "x.csv", "--workers", "2"])
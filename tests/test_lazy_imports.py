@@ -0,0 +1,39 @@
+import subprocess
+import sys
+
+
+def _loaded_after(code):
+	probe = code + "\nimport sys\nprint(' '.join(sorted(m for m in ('selenium', 'bs4', 'tqdm', 'pandas', 'dotenv', 'requests') if m in sys.modules)))"
+	out = subprocess.run([sys.executable, "-c", probe], check=True, capture_output=True, text=True)
+	return out.stdout.split()
+
+
+def test_import_bls_sdk_is_cheap():
+	assert _loaded_after("import bls_sdk") == []
+
+
+def test_public_data_client_skips_scraper_tooling():
+	# Settings (and python-dotenv) are only resolved once a client is built
+	assert _loaded_after("from bls_sdk import PublicDataClient") == ["requests"]
+	assert _loaded_after("from bls_sdk import PublicDataClient; PublicDataClient()") == ["dotenv", "requests"]
+
+
+def test_lazy_attributes_resolve():
+	import bls_sdk
+	from bls_sdk.release_schedule import ScheduleScraper
+
+	assert bls_sdk.ScheduleScraper is ScheduleScraper
+	assert set(bls_sdk.__all__) <= set(dir(bls_sdk))
+
+
+def test_submodules_resolve_as_attributes():
+	assert _loaded_after("import bls_sdk; bls_sdk.config; bls_sdk.release_calendar") == []
+	assert _loaded_after("import bls_sdk; bls_sdk.config.MAX_RETRIES") == ["dotenv"]
+	code = "import bls_sdk\ntry:\n\tbls_sdk.no_such_module\nexcept AttributeError:\n\tprint('missing')"
+	out = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True)
+	assert out.stdout.strip() == "missing"
+
+
+def test_unknown_config_names_do_not_load_settings():
+	code = "from bls_sdk import config\nassert not hasattr(config, '__wrapped__')\nassert not hasattr(config, 'NOT_A_SETTING')"
+	assert _loaded_after(code) == []
@@ -0,0 +1,53 @@
+import os
+import types
+
+from bls_sdk import manual_parser
+from bls_sdk.manual_parser import parse_manual_batch, parse_manual_schedule_txt
+
+
+_SAMPLE = (
+	"Release Name\tDate\tTime\n"
+	"The Employment Situation, December {prev}\tJan. 5\t8:30 a.m.\n"
+	"Producer Price Indexes, Fourth Quarter {prev} (P)\tJanuary 12\t8:30 AM\n"
+	"Consumer Price Index, December {year}\tJan. 15, {next}\t8:30 a.m.\n"
+	"Real Earnings\tFeb 3\t10:00 a.m.\n"
+)
+
+
+def _write_year(directory, year):
+	path = directory / f"{year}.txt"
+	path.write_text(_SAMPLE.format(prev=year - 1, year=year, next=year + 1), encoding="utf-8")
+	return path
+
+
+def test_parse_manual_schedule_txt_streams_and_filters(tmp_path):
+	path = _write_year(tmp_path, 2006)
+	records = parse_manual_schedule_txt(path, 2006, output="iter")
+	assert isinstance(records, types.GeneratorType)
+	records = list(records)
+	# Cross-year Jan/Feb rows after the explicit 2007 date are dropped
+	assert [r["release_title"] for r in records] == ["Employment Situation", "Producer Price Index"]
+	assert records[1]["period_quarter"] == 4 and records[1]["notes"] == "P"
+
+
+def test_parse_manual_batch_cache_and_process_pool(tmp_path, monkeypatch):
+	for y in (2005, 2006, 2007):
+		_write_year(tmp_path, y)
+	manual_parser.clear_manual_cache()
+	serial = parse_manual_batch([2005, 2006, 2007], tmp_path, output="json")
+	pooled = parse_manual_batch([2005, 2006, 2007], tmp_path, output="json", workers=2, use_cache=False)
+	assert pooled == serial and len(serial) == 6
+
+	calls = []
+	original = manual_parser._parse_manual_file
+	monkeypatch.setattr(manual_parser, "_parse_manual_file", lambda p, y: calls.append(y) or original(p, y))
+	assert parse_manual_batch([2005, 2006, 2007], tmp_path, output="json") == serial
+	assert calls == []
+
+	# A touched file is re-parsed; the others still come from the cache
+	path = tmp_path / "2006.txt"
+	st = path.stat()
+	os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+	df = parse_manual_batch([2005, 2006, 2007], tmp_path)
+	assert calls == [2006]
+	assert list(df["source_year_page"]) == [2005, 2005, 2006, 2006, 2007, 2007]
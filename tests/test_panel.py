@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from bls_sdk.panel import build_panel
+
+
+def _series(sid, obs):
+	# obs: [(year, period, value)], emitted newest first like the API
+	return {"seriesID": sid, "data": [{"year": str(y), "period": p, "periodName": "", "value": v, "footnotes": [{}]} for y, p, v in reversed(obs)]}
+
+
+MONTHLY = _series("M1", [(2023, f"M{m:02d}", f"{m}.0") for m in range(1, 13)] + [(2023, "M13", "6.5"), (2024, "M01", "13.0")])
+QUARTERLY = _series("Q1", [(2023, "Q01", "10"), (2023, "Q02", "20"), (2023, "Q03", "-"), (2023, "Q04", "40")])
+ANNUAL = _series("A1", [(2023, "A01", "100")])
+
+
+def test_monthly_panel_aligns_and_masks():
+	panel = build_panel([MONTHLY, QUARTERLY, ANNUAL], freq="M")
+	assert panel.columns == ["M1", "Q1", "A1"]
+	assert panel.shape == (13, 3)
+	assert str(panel.index[0].date()) == "2023-01-01" and str(panel.index[-1].date()) == "2024-01-01"
+	assert np.array_equal(panel.values[:, 0], np.arange(1.0, 14.0))
+	# Quarterly and annual values land on the last month of their period; '-' stays missing
+	assert panel.mask[:, 1].nonzero()[0].tolist() == [2, 5, 11]
+	assert panel.values[11, 2] == 100.0 and panel.mask[:, 2].sum() == 1
+	assert np.isnan(panel.values[~panel.mask]).all()
+
+
+def test_quarterly_means_require_complete_quarters():
+	panel = build_panel([MONTHLY, QUARTERLY], freq="Q")
+	df = panel.to_frame()
+	assert df["M1"].tolist()[:4] == [2.0, 5.0, 8.0, 11.0]
+	# Only January of 2024 Q1 is present
+	assert np.isnan(df["M1"].iloc[4])
+	assert build_panel([MONTHLY], freq="Q", complete=False).values[4, 0] == 13.0
+	assert df["Q1"].tolist()[:2] == [10.0, 20.0] and np.isnan(df["Q1"].iloc[2])
+
+
+def test_other_aggregations_and_upsampling():
+	annual = build_panel([MONTHLY], freq="A", how="last", end_year=2023)
+	assert annual.shape == (1, 1) and annual.values[0, 0] == 12.0
+	assert build_panel([MONTHLY], freq="S", how="sum").values[:, 0].tolist()[0] == 21.0
+	assert build_panel([MONTHLY], freq="A", how="max", end_year=2023).values[0, 0] == 12.0
+	assert build_panel([MONTHLY], freq="A", how="first", end_year=2023).values[0, 0] == 1.0
+	repeated = build_panel([QUARTERLY], freq="M", upsample="repeat")
+	assert repeated.values[:3, 0].tolist() == [10.0, 10.0, 10.0]
+	assert repeated.mask[:, 0].sum() == 9
+
+
+def test_bounds_and_validation():
+	panel = build_panel([MONTHLY], freq="M", start_year=2022, end_year=2023)
+	assert panel.shape == (24, 1) and not panel.mask[:12].any()
+	assert build_panel([], freq="Q").shape == (0, 0)
+	with pytest.raises(ValueError):
+		build_panel([MONTHLY], freq="W")
@@ -0,0 +1,88 @@
+from datetime import datetime, timezone
+
+import pandas as pd
+
+from bls_sdk.release_calendar import ReleaseCalendar
+
+
+def _row(date, time, title, **extra):
+	row = {"date": date, "time": time, "release_title": title, "notes": None}
+	row.update(extra)
+	return row
+
+
+def _calendar():
+	return ReleaseCalendar([
+		_row("2024-01-11", "08:30", "Consumer Price Index", period_month=12),
+		_row("2024-01-05", "08:30", "Employment Situation"),
+		_row("2024-02-13", "08:30", "Consumer Price Index", period_month=1),
+		_row("2024-02-02", "08:30", "Employment Situation"),
+		_row("2024-01-12", "08:30", "Producer Price Index"),
+	])
+
+
+def test_next_release_and_window_queries():
+	cal = _calendar()
+	assert cal.next_release(datetime(2024, 1, 11, 8, 30))["release_title"] == "Producer Price Index"
+	assert cal.next_release(datetime(2024, 1, 11, 8, 30), inclusive=True)["release_title"] == "Consumer Price Index"
+	assert cal.next_release(datetime(2024, 1, 12), title="Consumer Price Index")["date"] == "2024-02-13"
+	assert cal.next_release(datetime(2024, 3, 1)) is None
+	assert cal.previous_release(datetime(2024, 2, 1), title="Employment Situation")["date"] == "2024-01-05"
+	window = cal.between(datetime(2024, 1, 1), datetime(2024, 2, 1))
+	assert [r["date"] for r in window] == ["2024-01-05", "2024-01-11", "2024-01-12"]
+	# Aware datetimes are converted to Eastern time (13:30 UTC == 08:30 EST)
+	aware = datetime(2024, 1, 11, 13, 30, tzinfo=timezone.utc)
+	assert cal.next_release(aware, inclusive=True)["release_title"] == "Consumer Price Index"
+
+
+def test_upsert_dedupes_on_date_and_title():
+	cal = _calendar()
+	df = pd.DataFrame([
+		_row("2024-01-11", "08:30", "Consumer Price Index", period_month=12),
+		_row("2024-02-13", "10:00", "Consumer Price Index", period_month=1),
+		_row("2024-03-12", "08:30", "Consumer Price Index", period_month=2),
+	])
+	assert cal.upsert(df) == 2
+	assert len(cal) == 6
+	assert cal.next_release(datetime(2024, 2, 1), title="Consumer Price Index")["time"] == "10:00"
+
+
+def test_title_to_survey_mapping():
+	cal = _calendar()
+	assert cal.surveys_for_title("Consumer Price Index") == ("CU", "CW", "SU")
+	assert cal.surveys_for_title("Producer Price Indexes") == ("WP", "PC")
+	assert cal.surveys_for_title("Something Else") == ()
+	assert cal.titles_for_survey("CE") == ["Employment Situation"]
+	nxt = cal.next_release_for_series("CUUR0000SA0", datetime(2024, 1, 12))
+	assert nxt["date"] == "2024-02-13"
+
+
+def test_payroll_series_waits_for_employment_situation():
+	cal = _calendar()
+	cal.upsert([_row("2024-01-11", "08:30", "Real Earnings")])
+	nxt = cal.next_release_for_series("CES0000000001", datetime(2024, 1, 6))
+	assert nxt["release_title"] == "Employment Situation" and nxt["date"] == "2024-02-02"
+	assert cal.surveys_for_title("Real Earnings") == ()
+
+
+def test_state_and_metro_releases_only_wake_their_own_series():
+	cal = ReleaseCalendar([
+		_row("2024-03-15", "10:00", "State Employment and Unemployment"),
+		_row("2024-04-03", "10:00", "Metropolitan Area Employment and Unemployment"),
+	])
+	after = datetime(2024, 3, 1)
+	assert cal.next_release_for_series("SMU01000000000000001", after)["date"] == "2024-03-15"
+	assert cal.next_release_for_series("LASST010000000000003", after)["date"] == "2024-03-15"
+	assert cal.next_release_for_series("SMU01338600000000001", after)["date"] == "2024-04-03"
+	assert cal.next_release_for_series("LAUMT011150000000003", after)["date"] == "2024-04-03"
+	assert cal.surveys_for_title("State Employment and Unemployment") == ("SM", "LA")
+
+
+def test_title_prefixes_are_anchored():
+	cal = ReleaseCalendar([
+		_row("2024-03-07", "08:30", "Productivity and Costs"),
+		_row("2024-04-25", "10:00", "Productivity and Costs by Industry: Wholesale Trade"),
+	])
+	assert cal.surveys_for_title("Productivity and Costs") == ("PR",)
+	assert cal.surveys_for_title("Productivity and Costs by Industry: Wholesale Trade") == ("IP",)
+	assert cal.titles_for_series("PRS85006092") == ["Productivity and Costs"]
@@ -0,0 +1,229 @@
+import pandas as pd
+import pytest
+
+from bls_sdk import release_schedule
+from bls_sdk.release_schedule import ScheduleScraper
+
+
+_PAGE = """
+<html><body><table>
+<tr><th>Date</th><th>Time</th><th>Release</th></tr>
+<tr><td>Wednesday, January 10, 2024</td><td>08:30 AM</td><td>Consumer Price Index for December 2023</td></tr>
+<tr><td>Friday, February 02, 2024</td><td>08:30 AM</td><td>Employment Situation for January 2024</td></tr>
+</table></body></html>
+"""
+
+
+class _FakeElement:
+	def __init__(self, text, href):
+		self.text = text
+		self._href = href
+
+	def get_attribute(self, name):
+		return self._href if name == "href" else None
+
+
+class _FakeDriver:
+	def __init__(self):
+		self.visited = []
+		self.current_url = None
+		self.page_source = ""
+		self.quit_called = False
+
+	def get(self, url):
+		self.visited.append(url)
+		self.current_url = url
+		self.page_source = "" if url == release_schedule._ARCHIVE_URL else _PAGE
+
+	def find_elements(self, by, value):
+		if self.current_url == release_schedule._ARCHIVE_URL and value == "20":
+			return [_FakeElement("2024", "https://example.test/sched_2024.htm")]
+		return []
+
+	def execute_script(self, script):
+		return None
+
+	def quit(self):
+		self.quit_called = True
+
+
+def test_schedule_scraper_reuses_driver_and_year_links(monkeypatch):
+	drivers = []
+
+	def fake_new_driver(headless=True):
+		drivers.append(_FakeDriver())
+		return drivers[-1]
+
+	monkeypatch.setattr(release_schedule, "_new_driver", fake_new_driver)
+	monkeypatch.setattr(release_schedule.time, "sleep", lambda s: None)
+
+	with ScheduleScraper() as scraper:
+		first = scraper.scrape([2024], output="json")
+		second = scraper.scrape([2024], output="json")
+
+	assert len(drivers) == 1 and drivers[0].quit_called
+	assert drivers[0].visited.count(release_schedule._ARCHIVE_URL) == 1
+	assert first == second
+	assert [r["release_title"] for r in first] == ["Consumer Price Index", "Employment Situation"]
+	assert first[0]["date"] == "2024-01-10" and first[0]["time"] == "08:30"
+	assert first[0]["year_page_url"] == "https://example.test/sched_2024.htm"
+
+
+def test_closed_year_served_from_page_cache(monkeypatch, tmp_path):
+	drivers = []
+
+	def fake_new_driver(headless=True):
+		drivers.append(_FakeDriver())
+		return drivers[-1]
+
+	monkeypatch.setattr(release_schedule, "_new_driver", fake_new_driver)
+	monkeypatch.setattr(release_schedule.time, "sleep", lambda s: None)
+
+	with ScheduleScraper(cache_dir=tmp_path) as scraper:
+		fetched = scraper.scrape([2020], output="json")
+	assert len(drivers) == 1
+	entry = scraper.cache.entry(2020)
+	assert entry["url"] == fetched[0]["year_page_url"] and entry["fetched_at"]
+
+	with ScheduleScraper(cache_dir=tmp_path) as scraper:
+		cached = scraper.scrape([2020], output="json")
+	# Second run never launched a browser
+	assert len(drivers) == 1
+	assert cached == fetched
+
+	offline = release_schedule.reparse_cached_schedule(tmp_path)
+	assert list(offline["release_title"]) == ["Consumer Price Index", "Employment Situation"]
+	assert list(offline["source_year_page"]) == [2020, 2020]
+
+
+def test_lxml_backend_matches_bs4():
+	pytest.importorskip("lxml")
+	html = (
+		"<html><body><table><tr><td>nav</td></tr></table>"
+		"<table><tr><th>Date:</th><th>Time</th><th>Release</th></tr>"
+		"<tr><td>Wednesday,&nbsp; January 10, 2024 </td><td>8:30&nbsp;a.m.</td>"
+		"<td>Consumer <b>Price</b> Index<br>for December 2023 (P)</td></tr>"
+		"<tr><td>Not a date</td><td>8:30 AM</td><td>Skipped</td></tr>"
+		"<tr><th>Footer</th></tr>"
+		"<tr><td>Friday, February 09, 2024</td><td>08:30 AM</td><td>After footer</td></tr>"
+		"</table></body></html>"
+	)
+	rows = release_schedule._extract_rows_from_html(html, backend="lxml")
+	assert rows == release_schedule._extract_rows_from_html(html, backend="bs4")
+	assert rows == [{
+		"date_raw": "Wednesday,  January 10, 2024 ",
+		"time": "8:30 a.m.",
+		"release_raw": "Consumer Price Index for December 2023 (P)",
+	}]
+
+
+def test_normalize_schedule_rows_matches_per_row_parsers():
+	raws = [
+		("Wednesday, January 10, 2024", "08:30 AM", "Consumer Price Index for December 2023 (P)"),
+		("Friday, February 02, 2024 ", "12:00 am", "Employment Situation for January 2024"),
+		("Thursday, April 25, 2024", "12:15 PM", "Gross Domestic Product for First Quarter 2024"),
+		("not a date", "8:30 a.m.", "County Employment (Annual) for Biennial"),
+	] * 3
+	rows = [{"date_raw": d, "time": t, "release_raw": r, "source_year_page": 2024, "year_page_url": None} for d, t, r in raws]
+	df = release_schedule.normalize_schedule_rows(rows)
+	for (d, t, r), rec in zip(raws, df.to_dict("records")):
+		title, p_year, p_month, p_quarter, notes = release_schedule._parse_release_text(r)
+		assert rec["date"] == (release_schedule._parse_date_iso(d) or d.strip())
+		assert rec["time"] == (release_schedule._normalize_time_to_24h(t) or t.strip())
+		assert rec["release_title"] == title and rec["notes"] == notes
+		for col, expected in (("period_year", p_year), ("period_month", p_month), ("period_quarter", p_quarter)):
+			assert (None if pd.isna(rec[col]) else rec[col]) == expected
+	assert str(df["period_year"].dtype) == "Int64"
+
+
+def test_profile_reports_stages_and_candidates(monkeypatch, tmp_path):
+	class _FlakyDriver(_FakeDriver):
+		def get(self, url):
+			if "all_2023_sched" in url:
+				raise TimeoutError("page load timed out")
+			super().get(url)
+
+	monkeypatch.setattr(release_schedule, "_new_driver", lambda headless=True: _FlakyDriver())
+	monkeypatch.setattr(release_schedule.time, "sleep", lambda s: None)
+
+	with ScheduleScraper(cache_dir=tmp_path, profile=True) as scraper:
+		scraper.scrape([2020], output="json")
+		df = scraper.scrape([2020, 2023])
+	report = scraper.last_profile.to_dict()
+
+	assert len(df) == 4
+	years = {y["year"]: y for y in report["years"]}
+	assert years[2020]["source"] == "cache" and years[2020]["candidates"] == []
+	assert years[2023]["source"] == "network" and years[2023]["rows"] == 2
+	tried = years[2023]["candidates"]
+	assert "TimeoutError" in tried[0]["error"] and tried[-1]["rows"] == 2
+	assert years[2023]["url"] == tried[-1]["url"]
+	for stage in ("cache_read", "extract", "page_load", "sleep", "list_view", "parse"):
+		assert stage in report["stages"]
+	assert "driver_start" not in report["stages"]  # the browser was already warm
+	assert "page_load" in years[2023]["stages"] and "page_load" not in years[2020]["stages"]
+	assert list(scraper.last_profile.to_frame()["year"]) == [2020, 2023]
+	assert "2023: 2 rows from network" in scraper.last_profile.summary()
+
+
+def test_scrape_archived_schedule_returns_profile(monkeypatch):
+	monkeypatch.setattr(release_schedule, "_new_driver", lambda headless=True: _FakeDriver())
+	monkeypatch.setattr(release_schedule.time, "sleep", lambda s: None)
+
+	df, profile = release_schedule.scrape_archived_schedule([2024], profile=True)
+	assert len(df) == 2
+	assert {"driver_start", "archive_discovery", "page_load"} <= set(profile.stages)
+	assert profile.total_seconds is not None
+
+
+def test_dead_browser_session_is_restarted(monkeypatch):
+	from selenium.common.exceptions import InvalidSessionIdException
+
+	class _DeadDriver(_FakeDriver):
+		def get(self, url):
+			if url != release_schedule._ARCHIVE_URL:
+				raise InvalidSessionIdException("invalid session id")
+			super().get(url)
+
+	drivers = []
+
+	def fake_new_driver(headless=True):
+		drivers.append(_DeadDriver() if not drivers else _FakeDriver())
+		return drivers[-1]
+
+	monkeypatch.setattr(release_schedule, "_new_driver", fake_new_driver)
+	monkeypatch.setattr(release_schedule.time, "sleep", lambda s: None)
+
+	with ScheduleScraper() as scraper:
+		# The year is retried once with a fresh browser
+		assert len(scraper.scrape([2024])) == 2
+		assert drivers[0].quit_called and scraper.failed_years == []
+	assert len(drivers) == 2
+
+
+def test_year_lost_twice_is_skipped_and_batch_kept(monkeypatch):
+	from selenium.common.exceptions import InvalidSessionIdException
+
+	class _DiesOn2024(_FakeDriver):
+		def get(self, url):
+			if "2024" in url:
+				raise InvalidSessionIdException("invalid session id")
+			super().get(url)
+
+	drivers = []
+
+	def fake_new_driver(headless=True):
+		drivers.append(_DiesOn2024())
+		return drivers[-1]
+
+	monkeypatch.setattr(release_schedule, "_new_driver", fake_new_driver)
+	monkeypatch.setattr(release_schedule.time, "sleep", lambda s: None)
+
+	with ScheduleScraper(profile=True) as scraper:
+		records = scraper.scrape([2023, 2024, 2025], output="json")
+		assert scraper.failed_years == [2024]
+		assert sorted({r["source_year_page"] for r in records}) == [2023, 2025]
+		failed = [y for y in scraper.last_profile.years if y["error"]]
+		assert [y["year"] for y in failed] == [2024]
+	# 2024 lost the session twice; a third browser served 2025
+	assert len(drivers) == 3
@@ -0,0 +1,116 @@
+from datetime import datetime, timedelta
+
+from bls_sdk.release_calendar import ReleaseCalendar
+from bls_sdk.release_watcher import ReleaseWatcher
+
+
+class _FakeClock:
+	def __init__(self, now):
+		self.now = now
+
+	def __call__(self):
+		return self.now
+
+
+class _FakeClient:
+	"""get_latest returns the old period until `publish_after` polls have happened."""
+
+	def __init__(self, publish_after):
+		self.calls = 0
+		self.publish_after = publish_after
+
+	def get_latest(self, series_ids):
+		self.calls += 1
+		period = "M01" if self.calls > self.publish_after else "M12"
+		year = "2024" if period == "M01" else "2023"
+		series = [{"seriesID": sid, "data": [{"year": year, "period": period, "value": "1.0", "footnotes": [{}]}]} for sid in series_ids]
+		return {"status": "REQUEST_SUCCEEDED", "Results": {"series": series}}
+
+
+def test_watcher_sleeps_until_release_then_bursts():
+	calendar = ReleaseCalendar([
+		{"date": "2024-02-13", "time": "08:30", "release_title": "Consumer Price Index"},
+		{"date": "2024-02-02", "time": "08:30", "release_title": "Employment Situation"},
+	])
+	clock = _FakeClock(datetime(2024, 2, 10, 9, 0))
+	client = _FakeClient(publish_after=3)
+	events = []
+	watcher = ReleaseWatcher(client, calendar, ["CUUR0000SA0"], events.append, poll_rate_per_second=1000, clock=clock)
+	waits = []
+
+	def fake_wait(seconds):
+		waits.append(seconds)
+		clock.now += timedelta(seconds=seconds)
+		return False
+
+	watcher._wait = fake_wait
+	detected = watcher.run_once()
+
+	# Slept straight to the CPI release (the Employment Situation one doesn't publish CU)
+	assert waits[0] == (datetime(2024, 2, 13, 8, 30) - datetime(2024, 2, 10, 9, 0)).total_seconds()
+	assert [(e.series_id, e.year, e.period) for e in detected] == [("CUUR0000SA0", "2024", "M01")]
+	assert events == detected
+	assert detected[0].release["release_title"] == "Consumer Price Index"
+	# One priming query, then polls until the new period appeared
+	assert watcher.queries_used == client.calls == 4
+	assert watcher.next_wakeup() is None
+
+
+def _cpi_watcher(client, clock, **kwargs):
+	calendar = ReleaseCalendar([{"date": "2024-02-13", "time": "08:30", "release_title": "Consumer Price Index"}])
+	events = []
+	watcher = ReleaseWatcher(client, calendar, ["CUUR0000SA0"], events.append, poll_rate_per_second=1000, clock=clock, **kwargs)
+	waits = []
+
+	def fake_wait(seconds):
+		waits.append(seconds)
+		clock.now += timedelta(seconds=seconds)
+		return False
+
+	watcher._wait = fake_wait
+	return watcher, events, waits
+
+
+def test_burst_has_a_poll_budget_and_backs_off():
+	clock = _FakeClock(datetime(2024, 2, 13, 8, 0))
+	client = _FakeClient(publish_after=10 ** 6)  # never publishes
+	watcher, events, waits = _cpi_watcher(client, clock, max_polls_per_burst=5, poll_interval=5, poll_backoff=2, max_poll_interval=30)
+	assert watcher.run_once() == []
+	# 1 priming query + 5 polls, with growing gaps between polls
+	assert client.calls == watcher.queries_used == 6
+	assert waits[1:5] == [5, 10, 20, 30]
+
+
+def test_api_errors_are_recorded_not_fatal():
+	class _QuotaClient(_FakeClient):
+		def get_latest(self, series_ids):
+			if self.calls == 1:
+				self.calls += 1
+				return {"status": "REQUEST_NOT_PROCESSED", "message": ["daily threshold reached"]}
+			return super().get_latest(series_ids)
+
+	clock = _FakeClock(datetime(2024, 2, 13, 8, 0))
+	errors = []
+	watcher, events, waits = _cpi_watcher(_QuotaClient(publish_after=2), clock, on_error=errors.append)
+	detected = watcher.run_once()
+	assert [e.period for e in detected] == ["M01"]
+	assert watcher.error_count == 1 and errors == [watcher.last_error]
+	assert "daily threshold" in str(watcher.last_error)
+
+
+def test_run_survives_priming_failure():
+	from bls_sdk.errors import HttpError
+
+	class _FailingFirst(_FakeClient):
+		def get_latest(self, series_ids):
+			self.calls += 1
+			if self.calls == 1:
+				raise HttpError(503, "https://api.bls.gov", body="unavailable")
+			self.calls -= 1
+			return super().get_latest(series_ids)
+
+	clock = _FakeClock(datetime(2024, 2, 13, 8, 0))
+	watcher, events, waits = _cpi_watcher(_FailingFirst(publish_after=2), clock, error_backoff=7)
+	watcher.run()
+	assert watcher.error_count == 1 and waits[0] == 7
+	assert [e.period for e in events] == ["M01"]
@@ -0,0 +1,59 @@
+import math
+
+from bls_sdk.public_data import PublicDataClient
+from bls_sdk.series_data import Observation, Series, compact_series
+
+
+def _api_series(sid="CUUR0000SA0"):
+	return {
+		"seriesID": sid,
+		"data": [
+			{"year": "2024", "period": "M02", "periodName": "February", "latest": "true", "value": "310.326", "footnotes": [{"code": "P", "text": "preliminary"}]},
+			{"year": "2024", "period": "M01", "periodName": "January", "value": "-", "footnotes": [{}]},
+			{"year": "2023", "period": "M12", "periodName": "December", "value": "306.7", "footnotes": [{}]},
+		],
+	}
+
+
+def test_round_trip_keeps_api_shape():
+	s = Series.from_api(_api_series())
+	assert len(s) == 3
+	assert s.to_dict() == {
+		"seriesID": "CUUR0000SA0",
+		"data": [
+			{"year": "2024", "period": "M02", "periodName": "February", "latest": "true", "value": "310.326", "footnotes": [{"text": "preliminary"}]},
+			{"year": "2024", "period": "M01", "periodName": "January", "value": "-", "footnotes": [{}]},
+			{"year": "2023", "period": "M12", "periodName": "December", "value": "306.7", "footnotes": [{}]},
+		],
+	}
+
+
+def test_typed_observations():
+	s = Series.from_api(_api_series())
+	obs = list(s)
+	assert obs[0] == Observation(2024, "M02", "February", 310.326, ("preliminary",), latest=True)
+	assert math.isnan(obs[1].value) and s.value_string(1) == "-"
+	assert s[-1].year == 2023 and s.latest == obs[0]
+	assert not hasattr(obs[0], "__dict__")
+	rows = list(s.rows())
+	assert rows[0] == (2024, "M02", "February", 310.326, ("preliminary",))
+	assert [r[:2] for r in rows] == [(o.year, o.period) for o in obs]
+	frame = s.to_frame()
+	assert list(frame["year"]) == [2024, 2024, 2023]
+
+
+def test_strings_are_shared_across_series():
+	a, b = compact_series([_api_series("A"), _api_series("B")])
+	assert a.periods[0] is b.periods[0]
+	assert a.footnotes[0] is b.footnotes[0]
+	assert a.footnotes[1] is a.footnotes[2] is ()
+
+
+def test_get_many_series_compact():
+	class FakeHttp:
+		def post_public_timeseries(self, body):
+			return {"Results": {"series": [_api_series(sid) for sid in body["seriesid"]]}}
+
+	out = PublicDataClient(http=FakeHttp()).get_many_series(["A", "B"], compact=True, startyear="2023")
+	assert [type(s) for s in out] == [Series, Series]
+	assert [s.series_id for s in out] == ["A", "B"]
@@ -0,0 +1,90 @@
+import pytest
+
+import bls_sdk.series_ids as series_ids
+from bls_sdk.errors import ValidationError
+from bls_sdk.series_ids import SeriesIdResolver, validate_series_ids
+
+
+CU_DIMENSIONS = {
+	"seasonal": ["S", "U"],
+	"periodicity_code": ["R", "S"],
+	"area_code": ["0000", "S49A", "A101"],
+	"item_code": ["SA0", "SA0L1E", "SEFV"],
+}
+
+
+def _cu(series_ids=None):
+	return SeriesIdResolver("cu", dimensions=CU_DIMENSIONS, series_ids=series_ids)
+
+
+def test_build_checks_dimension_codes():
+	cu = _cu()
+	assert cu.build(seasonal="S", periodicity_code="R", area_code="0000", item_code="SA0") == "CUSR0000SA0"
+	with pytest.raises(ValidationError, match="item_code"):
+		cu.build(seasonal="S", periodicity_code="R", area_code="0000", item_code="NOPE")
+	with pytest.raises(ValidationError, match="Missing"):
+		cu.build(seasonal="S", area_code="0000", item_code="SA0")
+
+
+def test_structural_parse_and_validate_without_series_list():
+	cu = _cu()
+	assert cu.parse("CUUR0000SA0L1E") == {"seasonal": "U", "periodicity_code": "R", "area_code": "0000", "item_code": "SA0L1E"}
+	assert cu.is_valid("cuurs49asefv")
+	invalid = cu.validate(["CUUR0000SA0", "CUUR9999SA0", "CEU0000000001", "CUUR-000SA0"])
+	assert set(invalid) == {"CUUR9999SA0", "CEU0000000001", "CUUR-000SA0"}
+	assert "prefix" in invalid["CEU0000000001"]
+
+
+def test_series_list_is_exact_check():
+	cu = _cu(series_ids=["CUUR0000SA0"])
+	assert cu.is_valid("CUUR0000SA0")
+	# Structurally fine but not a published series
+	assert not cu.is_valid("CUSR0000SEFV")
+	with pytest.raises(ValidationError, match="1 invalid"):
+		cu.require_valid(["CUUR0000SA0", "CUSR0000SEFV"])
+
+
+def test_from_series_rows_and_mixed_validation():
+	rows = [
+		{"series_id": "CES0000000001", "seasonal": "S", "industry_code": "00000000", "data_type_code": "01"},
+		{"series_id": "CEU0500000003", "seasonal": "U", "industry_code": "05000000", "data_type_code": "03"},
+	]
+	ce = SeriesIdResolver.from_series_rows("ce", rows)
+	assert ce.dimensions["data_type_code"] == frozenset({"01", "03"})
+	resolvers = {"ce": ce, "CU": _cu()}
+	invalid = validate_series_ids(["CES0000000001", "CUUR0000SA0", "CES0000000003", "LNS14000000"], resolvers)
+	assert set(invalid) == {"CES0000000003", "LNS14000000"}
+	with pytest.raises(ValidationError):
+		validate_series_ids(["LNS14000000"], resolvers, require=True)
+
+
+def test_load_fetches_dimension_files(monkeypatch):
+	requested = []
+
+	def fake_file(survey, name, rate_limit_per_second=2.0):
+		requested.append(name)
+		if name == "periodicity":
+			raise series_ids.requests.HTTPError("404")
+		# Real headers: cu.seasonal has seasonal_code/seasonal_text, cu.area has area_code/area_name, ...
+		codes = CU_DIMENSIONS[{"seasonal": "seasonal"}.get(name, f"{name}_code")]
+		return [{f"{name}_code": c, f"{name}_text": c.lower()} for c in codes]
+
+	monkeypatch.setattr(series_ids, "fetch_survey_file", fake_file)
+	cu = SeriesIdResolver.load("cu", include_series=False)
+	assert requested == ["seasonal", "periodicity", "area", "item"]
+	assert "periodicity_code" not in cu.dimensions
+	assert cu.series is None
+	assert cu.build(seasonal="U", periodicity_code="R", area_code="0000", item_code="SA0") == "CUUR0000SA0"
+	# Without periodicity codes the structural check is skipped rather than failing every ID
+	assert cu.is_valid("CUUR0000SA0")
+	assert cu.dimensions["seasonal"] == {"S", "U"}
+
+
+def test_load_skips_dimension_files_without_codes(monkeypatch):
+	def fake_file(survey, name, rate_limit_per_second=2.0):
+		return [{"unexpected_column": "x"}] if name == "area" else [{f"{name}_code": "R"}]
+
+	monkeypatch.setattr(series_ids, "fetch_survey_file", fake_file)
+	cu = SeriesIdResolver.load("cu", include_series=False)
+	assert "area_code" not in cu.dimensions
+	assert cu.dimensions["item_code"] == {"R"}
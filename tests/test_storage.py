@@ -0,0 +1,105 @@
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from bls_sdk import storage
+
+
+def _series(sid, years):
+	data = [
+		{"year": str(y), "period": f"M{m:02d}", "periodName": "Month", "value": f"{y + m / 100:.2f}", "footnotes": [{}]}
+		for y in years for m in (1, 2)
+	]
+	data[0]["value"] = "-"
+	data[0]["footnotes"] = [{"code": "P", "text": "preliminary"}]
+	return {"seriesID": sid, "data": data}
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "arrow"])
+def test_timeseries_round_trip_with_partition_pruning(tmp_path, fmt):
+	series = [_series("CUUR0000SA0", [2022, 2023]), _series("CEU0000000001", [2023])]
+	assert storage.write_timeseries(series, tmp_path, fmt=fmt) == 6
+	assert (tmp_path / "survey=CU" / "year=2022").is_dir()
+
+	df = storage.read_timeseries(tmp_path, survey="cu", year=2023, columns=["series_id", "period", "value"], fmt=fmt)
+	assert list(df.columns) == ["series_id", "period", "value"]
+	assert sorted(df["period"]) == ["M01", "M02"] and set(df["series_id"]) == {"CUUR0000SA0"}
+
+	# Re-writing a partition replaces it instead of duplicating rows
+	storage.write_timeseries([_series("CUUR0000SA0", [2023])], tmp_path, fmt=fmt)
+	all_rows = storage.read_timeseries(tmp_path, fmt=fmt)
+	assert len(all_rows) == 6
+	first = all_rows[(all_rows["series_id"] == "CUUR0000SA0") & (all_rows["year"] == 2022) & (all_rows["period"] == "M01")].iloc[0]
+	assert pd.isna(first["value"]) and first["footnotes"] == "preliminary"
+
+
+def test_schedule_round_trip(tmp_path):
+	df = pd.DataFrame({
+		"date": ["2023-12-12", "2024-01-11"],
+		"time": ["08:30", "08:30"],
+		"release_title": ["Consumer Price Index", "Consumer Price Index"],
+	})
+	storage.write_schedule(df, tmp_path)
+	out = storage.read_schedule(tmp_path, year=2024, columns=["date", "release_title"])
+	assert out.to_dict("records") == [{"date": "2024-01-11", "release_title": "Consumer Price Index"}]
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "arrow"])
+def test_second_series_in_same_partition_keeps_the_first(tmp_path, fmt):
+	storage.write_timeseries([_series("CUUR0000SA0", [2023])], tmp_path, fmt=fmt)
+	storage.write_timeseries([_series("CUUR0000SA0E", [2023])], tmp_path, fmt=fmt)
+	df = storage.read_timeseries(tmp_path, survey="CU", year=2023, fmt=fmt)
+	assert sorted(df["series_id"].unique()) == ["CUUR0000SA0", "CUUR0000SA0E"]
+	assert len(df) == 4
+
+	# A revised value replaces the stored observation
+	revised = _series("CUUR0000SA0", [2023])
+	revised["data"] = [dict(revised["data"][1], value="99.5")]
+	storage.write_timeseries([revised], tmp_path, fmt=fmt)
+	df = storage.read_timeseries(tmp_path, series_ids=["CUUR0000SA0"], fmt=fmt)
+	assert len(df) == 2 and df.set_index("period").loc["M02", "value"] == 99.5
+
+
+def test_append_mode_does_not_overwrite_earlier_files(tmp_path):
+	storage.write_timeseries([_series("CUUR0000SA0", [2023])], tmp_path, replace_partitions=False)
+	storage.write_timeseries([_series("CUUR0000SA0E", [2023])], tmp_path, replace_partitions=False)
+	assert len(storage.read_timeseries(tmp_path)) == 4
+
+
+def test_schedule_skips_undated_rows_and_empty_frames(tmp_path):
+	assert storage.write_schedule(pd.DataFrame(), tmp_path) == 0
+	df = pd.DataFrame({
+		"date": ["TBD", "2024-02-13"],
+		"time": ["", "08:30"],
+		"release_title": ["Employment Situation", "Consumer Price Index"],
+	})
+	assert storage.write_schedule(df, tmp_path) == 1
+	more = pd.DataFrame({"date": ["2024-03-12"], "time": ["08:30"], "release_title": ["Consumer Price Index"]})
+	storage.write_schedule(more, tmp_path)
+	out = storage.read_schedule(tmp_path, year=2024)
+	assert sorted(out["date"]) == ["2024-02-13", "2024-03-12"]
+
+
+def test_schedule_frames_with_different_null_patterns_merge(tmp_path):
+	def frame(dates, notes, url):
+		return pd.DataFrame({
+			"date": dates,
+			"time": ["08:30"] * len(dates),
+			"release_title": ["Consumer Price Index"] * len(dates),
+			"period_year": [2024] * len(dates),
+			"period_month": [None] * len(dates),
+			"period_quarter": [None] * len(dates),
+			"notes": notes,
+			"source_year_page": [2024] * len(dates),
+			"year_page_url": url,
+		})
+
+	storage.write_schedule(frame(["2024-02-13"], ["Monthly"], ["https://www.bls.gov/schedule/2024/home.htm"]), tmp_path)
+	# Same year, every optional column None: inferred types would be null
+	storage.write_schedule(frame(["2024-03-12"], [None], [None]), tmp_path)
+	storage.write_schedule(frame(["2024-04-10"], [None], [None]).assign(period_month=4), tmp_path)
+	out = storage.read_schedule(tmp_path, year=2024).sort_values("date")
+	assert list(out["date"]) == ["2024-02-13", "2024-03-12", "2024-04-10"]
+	assert out["notes"].tolist()[0] == "Monthly" and out["notes"].isna().tolist()[1:] == [True, True]
+	assert out["period_month"].tolist()[2] == 4
@@ -0,0 +1,76 @@
+from bls_sdk.series_data import compact_series
+from bls_sdk.vintages import VintageStore
+
+
+def _series(sid, values):
+	# values: {(year, period): value}, emitted newest first like the API
+	data = [
+		{"year": str(y), "period": p, "periodName": "", "value": v, "footnotes": [{}]}
+		for (y, p), v in sorted(values.items(), reverse=True)
+	]
+	return {"seriesID": sid, "data": data}
+
+
+def test_unchanged_series_are_skipped_and_only_revisions_written(tmp_path):
+	store = VintageStore(tmp_path / "v.sqlite")
+	jan = {(2024, "M01"): "100.0", (2023, "M12"): "99.0"}
+	first = store.record([_series("A", jan), _series("B", jan)], vintage="2024-02-13T08:30:00")
+	assert first == {"series_seen": 2, "series_changed": 2, "observations_written": 4}
+
+	# B unchanged; A revises January and adds February
+	feb = {(2024, "M02"): "101.0", (2024, "M01"): "100.2", (2023, "M12"): "99.0"}
+	second = store.record([_series("A", feb), _series("B", jan)], vintage="2024-03-12T08:30:00")
+	assert second == {"series_seen": 2, "series_changed": 1, "observations_written": 2}
+	assert store.vintages() == ["2024-02-13T08:30:00.000000", "2024-03-12T08:30:00.000000"]
+
+	history = store.revisions("A", 2024, "M01")
+	assert [(r["vintage"][:10], r["value"]) for r in history] == [("2024-02-13", "100.0"), ("2024-03-12", "100.2")]
+
+
+def test_as_of_reconstructs_each_vintage(tmp_path):
+	store = VintageStore(tmp_path / "v.sqlite")
+	v1 = {(2024, "M01"): "100.0", (2023, "M12"): "99.0", (2023, "M11"): "98.0"}
+	v2 = {(2024, "M02"): "101.0", (2024, "M01"): "100.2", (2023, "M11"): "98.0"}  # December dropped
+	store.record([_series("A", v1)], vintage="2024-02-13T08:30:00")
+	store.record([_series("A", v2)], vintage="2024-03-12T08:30:00")
+
+	assert store.as_of("2024-02-01") == []
+	assert store.as_of("2024-02-13") == [_series("A", v1)]
+	assert store.as_of("2024-03-12", series_ids=["A", "missing"]) == [_series("A", v2)]
+	frame = store.as_of("2024-03-31", output="dataframe")
+	assert sorted(frame["period"]) == ["M01", "M02", "M11"]
+
+
+def test_out_of_order_vintage_rejected_and_compact_series_accepted(tmp_path):
+	import pytest
+
+	store = VintageStore(tmp_path / "v.sqlite")
+	payload = _series("A", {(2024, "M01"): "100.0"})
+	store.record(compact_series([payload]), vintage="2024-02-13")
+	# Same payload as a dict hashes the same
+	assert store.record([payload], vintage="2024-02-14")["series_changed"] == 0
+	with pytest.raises(ValueError):
+		store.record([payload], vintage="2024-02-01")
+	store.close()
+	# Reopened store keeps its state
+	with VintageStore(tmp_path / "v.sqlite") as reopened:
+		assert len(reopened.vintages()) == 2
+
+
+def test_narrower_window_keeps_older_years(tmp_path):
+	store = VintageStore(tmp_path / "v.sqlite")
+	full = {(2024, "M01"): "100.0", (2023, "M12"): "99.0", (2022, "M12"): "95.0"}
+	store.record([_series("A", full)], vintage="2024-02-13")
+	# startyear=2024 pull: only 2024 is in the payload, and it revises January
+	store.record([_series("A", {(2024, "M01"): "100.2"})], vintage="2024-03-12")
+	assert store.as_of("2024-03-12") == [_series("A", {**full, (2024, "M01"): "100.2"})]
+	assert store.revisions("A", 2022) == [{"year": 2022, "period": "M12", "vintage": "2024-02-13T00:00:00.000000", "value": "95.0", "footnotes": None}]
+
+
+def test_default_vintages_in_the_same_instant_do_not_collide(tmp_path):
+	store = VintageStore(tmp_path / "v.sqlite")
+	for value in ("1.0", "2.0", "3.0"):
+		store.record([_series("A", {(2024, "M01"): value})])
+	stamps = store.vintages()
+	assert len(stamps) == 3 and stamps == sorted(set(stamps))
+	assert store.as_of(stamps[-1])[0]["data"][0]["value"] == "3.0"